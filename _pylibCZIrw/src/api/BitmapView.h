@@ -0,0 +1,78 @@
+#pragma once
+
+#include "inc_libCzi.h"
+#include <cstdlib>
+
+/// Bitmap which does not own its memory, but operates on memory provided by
+/// the caller (e.g. the memory of a numpy array or a part of another bitmap).
+/// The caller is responsible for keeping the memory alive as long as the bitmap
+/// is in use. Rows may be strided, pixels within a row have to be tightly
+/// packed.
+class CBitmapView : public libCZI::IBitmapData {
+private:
+  void *ptrData;
+  libCZI::PixelType pixeltype;
+  std::uint32_t width;
+  std::uint32_t height;
+  std::uint32_t stride;
+
+public:
+  CBitmapView(void *ptrData, libCZI::PixelType pixeltype, std::uint32_t width,
+              std::uint32_t height, std::uint32_t stride)
+      : ptrData(ptrData), pixeltype(pixeltype), width(width), height(height),
+        stride(stride) {}
+
+  virtual libCZI::PixelType GetPixelType() const { return this->pixeltype; }
+
+  virtual libCZI::IntSize GetSize() const {
+    return libCZI::IntSize{this->width, this->height};
+  }
+
+  virtual libCZI::BitmapLockInfo Lock() {
+    libCZI::BitmapLockInfo bitmapLockInfo;
+    bitmapLockInfo.ptrData = this->ptrData;
+    bitmapLockInfo.ptrDataRoi = this->ptrData;
+    bitmapLockInfo.stride = this->stride;
+    bitmapLockInfo.size = this->stride * static_cast<size_t>(this->height);
+    return bitmapLockInfo;
+  }
+
+  virtual void Unlock() {}
+};
+
+/// Bitmap owning its memory (allocated with the given stride).
+class CMemBitmapWrapper : public libCZI::IBitmapData {
+private:
+  void *ptrData;
+  libCZI::PixelType pixeltype;
+  std::uint32_t width;
+  std::uint32_t height;
+  std::uint32_t stride;
+
+public:
+  CMemBitmapWrapper(libCZI::PixelType pixeltype, std::uint32_t width,
+                    std::uint32_t height, std::uint32_t stride)
+      : pixeltype(pixeltype), width(width), height(height), stride(stride) {
+    size_t s = this->stride * static_cast<size_t>(height);
+    this->ptrData = malloc(s);
+  }
+
+  virtual ~CMemBitmapWrapper() { free(this->ptrData); }
+
+  virtual libCZI::PixelType GetPixelType() const { return this->pixeltype; }
+
+  virtual libCZI::IntSize GetSize() const {
+    return libCZI::IntSize{this->width, this->height};
+  }
+
+  virtual libCZI::BitmapLockInfo Lock() {
+    libCZI::BitmapLockInfo bitmapLockInfo;
+    bitmapLockInfo.ptrData = this->ptrData;
+    bitmapLockInfo.ptrDataRoi = this->ptrData;
+    bitmapLockInfo.stride = this->stride;
+    bitmapLockInfo.size = this->stride * static_cast<size_t>(this->height);
+    return bitmapLockInfo;
+  }
+
+  virtual void Unlock() {}
+};
@@ -1,9 +1,18 @@
 #include "CZIreadAPI.h"
 #include "StaticContext.h"
+#include "WorkerPool.h"
 
+#include <algorithm>
+#include <cmath>
 #include <codecvt>
+#include <cstring>
+#include <exception>
 #include <locale>
+#include <map>
+#include <mutex>
 #include <sstream>
+#include <stdexcept>
+#include <tuple>
 
 using namespace libCZI;
 using namespace std;
@@ -44,13 +53,12 @@ CZIreadAPI::CZIreadAPI(const std::string &stream_class_name,
     }
   }
 
-  const auto reader = libCZI::CreateCZIReader();
-  reader->Open(stream);
-  this->spAccessor = reader->CreateSingleChannelScalingTileAccessor();
-  this->spReader = reader;
+  // the bytes read from the stream are counted for the cache statistics
+  this->Open(std::make_shared<CCountingStream>(stream),
+             std::make_shared<CSubBlockSpatialIndex>());
   this->subBlockCacheOptions = subBlockCacheOptions;
   if (subBlockCacheOptions.cacheType == CacheType::Standard) {
-    this->spSubBlockCache = libCZI::CreateSubBlockCache();
+    this->spSubBlockCache = std::make_shared<CSubBlockCacheWithStatistics>();
   } else if (subBlockCacheOptions.cacheType != CacheType::None) {
     stringstream string_stream;
     string_stream << "The specified type of cache is not supported: "
@@ -61,6 +69,78 @@ CZIreadAPI::CZIreadAPI(const std::string &stream_class_name,
   }
 }
 
+CZIreadAPI::CZIreadAPI(std::shared_ptr<libCZI::IStream> stream,
+                       std::shared_ptr<libCZI::ISubBlockCache> subBlockCache,
+                       const SubBlockCacheOptions &subBlockCacheOptions,
+                       std::shared_ptr<CSubBlockSpatialIndex> spatialIndex) {
+  this->Open(stream, spatialIndex);
+  this->subBlockCacheOptions = subBlockCacheOptions;
+  this->spSubBlockCache = subBlockCache;
+}
+
+void CZIreadAPI::Open(std::shared_ptr<libCZI::IStream> stream,
+                      std::shared_ptr<CSubBlockSpatialIndex> spatialIndex) {
+  const auto reader = libCZI::CreateCZIReader();
+  reader->Open(stream);
+  const auto repository =
+      std::make_shared<CIndexedSubBlockRepository>(reader, spatialIndex);
+  this->spAccessor =
+      std::dynamic_pointer_cast<libCZI::ISingleChannelScalingTileAccessor>(
+          libCZI::CreateAccesor(
+              repository, AccessorType::SingleChannelScalingTileAccessor));
+  this->spPyramidLayerAccessor =
+      std::dynamic_pointer_cast<libCZI::ISingleChannelPyramidLayerTileAccessor>(
+          libCZI::CreateAccesor(
+              repository, AccessorType::SingleChannelPyramidLayerTileAccessor));
+  this->spReader = reader;
+  this->spStream = stream;
+  this->spSpatialIndex = spatialIndex;
+}
+
+std::unique_ptr<CZIreadAPI> CZIreadAPI::CreateSibling() const {
+  if (!this->spStream) {
+    throw std::logic_error("The czi document is closed.");
+  }
+
+  // the constructor is private, so std::make_unique cannot be used here
+  return std::unique_ptr<CZIreadAPI>(
+      new CZIreadAPI(this->spStream, this->spSubBlockCache,
+                     this->subBlockCacheOptions, this->spSpatialIndex));
+}
+
+std::vector<std::tuple<int, std::string, std::string>>
+CZIreadAPI::GetAttachmentInfos() {
+  std::vector<std::tuple<int, std::string, std::string>> infos;
+  this->spReader->EnumerateAttachments(
+      [&](int index, const AttachmentInfo &info) -> bool {
+        infos.emplace_back(index, info.name, info.contentFileType);
+        return true;
+      });
+
+  return infos;
+}
+
+std::shared_ptr<libCZI::IAttachment> CZIreadAPI::ReadAttachment(int index) {
+  auto attachment = this->spReader->ReadAttachment(index);
+  if (!attachment) {
+    stringstream string_stream;
+    string_stream << "There is no attachment with index " << index << '.';
+    throw std::invalid_argument(string_stream.str());
+  }
+
+  return attachment;
+}
+
+std::unique_ptr<CZIreadAPI> CZIreadAPI::OpenAttachedDocument(int index) {
+  // the stream keeps the data of the attachment alive
+  const auto stream =
+      libCZI::CreateStreamFromMemory(this->ReadAttachment(index).get());
+  // the constructor is private, so std::make_unique cannot be used here
+  return std::unique_ptr<CZIreadAPI>(
+      new CZIreadAPI(stream, nullptr, SubBlockCacheOptions(),
+                     std::make_shared<CSubBlockSpatialIndex>()));
+}
+
 std::string CZIreadAPI::GetXmlMetadata() {
 
   const auto mds = this->spReader->ReadMetadataSegment();
@@ -86,11 +166,24 @@ size_t CZIreadAPI::GetDimensionSize(libCZI::DimensionIndex DimIndex) {
   return 0;
 }
 
+std::map<std::string, std::pair<int, int>> CZIreadAPI::GetDimensionBounds() {
+  std::map<std::string, std::pair<int, int>> bounds;
+  this->spReader->GetStatistics().dimBounds.EnumValidDimensions(
+      [&](libCZI::DimensionIndex dim, int start, int size) -> bool {
+        bounds.emplace(std::string(1, libCZI::Utils::DimensionToChar(dim)),
+                       std::make_pair(start, size));
+        return true;
+      });
+
+  return bounds;
+}
+
 libCZI::PixelType CZIreadAPI::GetChannelPixelType(int chanelIdx) {
 
   libCZI::SubBlockInfo sbBlkInfo;
-  const bool b = this->spReader->TryGetSubBlockInfoOfArbitrarySubBlockInChannel(
-      chanelIdx, sbBlkInfo);
+  const bool b =
+      this->spSpatialIndex->TryGetSubBlockInfoOfArbitrarySubBlockInChannel(
+          this->spReader.get(), chanelIdx, sbBlkInfo);
   if (!b) {
     // TODO more precise error handling
     return libCZI::PixelType::Invalid;
@@ -104,10 +197,468 @@ libCZI::SubBlockStatistics CZIreadAPI::GetSubBlockStats() {
   return this->spReader->GetStatistics();
 }
 
+std::vector<SubBlockIndexEntry> CZIreadAPI::GetSubBlockIndex() {
+  std::vector<SubBlockIndexEntry> entries;
+  entries.reserve(this->spReader->GetStatistics().subBlockCount);
+  this->spReader->EnumerateSubBlocksEx(
+      [&](int index, const DirectorySubBlockInfo &info) -> bool {
+        entries.push_back(SubBlockIndexEntry::FromSubBlockInfo(index, info));
+        return true;
+      });
+
+  return entries;
+}
+
+std::vector<PyramidLayerStatistics> CZIreadAPI::GetPyramidLayerStatistics() {
+  std::map<std::tuple<int, int, int>, PyramidLayerStatistics> layers;
+  this->spReader->EnumerateSubBlocksEx(
+      [&](int index, const DirectorySubBlockInfo &info) -> bool {
+        PyramidLayerStatistics layer;
+        if (!SubBlockIndexEntry::TryGetPyramidLayer(
+                info.logicalRect, info.physicalSize, layer.minificationFactor,
+                layer.pyramidLayer)) {
+          return true;
+        }
+
+        info.coordinate.TryGetPosition(DimensionIndex::S, &layer.scene);
+        auto &statistics =
+            layers
+                .emplace(std::make_tuple(layer.scene, layer.pyramidLayer,
+                                         layer.minificationFactor),
+                         layer)
+                .first->second;
+        statistics.subBlockCount++;
+        statistics.bitmapBytes +=
+            static_cast<std::uint64_t>(info.physicalSize.w) *
+            info.physicalSize.h *
+            libCZI::Utils::GetBytesPerPixel(info.pixelType);
+        return true;
+      });
+
+  std::vector<PyramidLayerStatistics> statistics;
+  statistics.reserve(layers.size());
+  for (const auto &layer : layers) {
+    statistics.push_back(layer.second);
+  }
+
+  return statistics;
+}
+
+std::vector<SubBlockIndexEntry>
+CZIreadAPI::QuerySubBlocks(libCZI::IntRect roi,
+                           const std::string &coordinateString,
+                           const std::wstring &SceneIndexes, bool onlyLayer0) {
+  const auto planeCoordinate = ParsePlaneCoordinate(coordinateString);
+  std::shared_ptr<libCZI::IIndexSet> sceneFilter;
+  if (!SceneIndexes.empty()) {
+    sceneFilter = libCZI::Utils::IndexSetFromString(SceneIndexes);
+  }
+
+  std::vector<SubBlockIndexEntry> entries;
+  this->spSpatialIndex->EnumSubset(
+      this->spReader.get(), &planeCoordinate, &roi, onlyLayer0,
+      [&](int index, const DirectorySubBlockInfo &info) -> bool {
+        // subblocks without a scene index pass the scene filter (as with the
+        // scaling tile accessor)
+        int scene;
+        if (!sceneFilter ||
+            !info.coordinate.TryGetPosition(DimensionIndex::S, &scene) ||
+            sceneFilter->IsContained(scene)) {
+          entries.push_back(SubBlockIndexEntry::FromSubBlockInfo(index, info));
+        }
+
+        return true;
+      });
+
+  return entries;
+}
+
+std::shared_ptr<libCZI::ISubBlock> CZIreadAPI::ReadSubBlock(int index) {
+  auto subBlock = this->spReader->ReadSubBlock(index);
+  if (!subBlock) {
+    throw std::invalid_argument("There is no subblock with index " +
+                                std::to_string(index) + ".");
+  }
+
+  return subBlock;
+}
+
+std::vector<std::shared_ptr<libCZI::ISubBlock>>
+CZIreadAPI::ReadSubBlocks(const std::vector<int> &indices, int numThreads) {
+  std::vector<std::shared_ptr<libCZI::ISubBlock>> subBlocks(indices.size());
+  RunInParallel(indices.size(), numThreads, [&](size_t index) {
+    subBlocks[index] = this->ReadSubBlock(indices[index]);
+  });
+
+  return subBlocks;
+}
+
+std::vector<std::unique_ptr<PImage>>
+CZIreadAPI::ReadSubBlockBitmaps(const std::vector<int> &indices,
+                                int numThreads) {
+  std::vector<std::unique_ptr<PImage>> bitmaps(indices.size());
+  RunInParallel(indices.size(), numThreads, [&](size_t index) {
+    bitmaps[index] = std::make_unique<PImage>(
+        this->ReadSubBlock(indices[index])->CreateBitmap());
+  });
+
+  return bitmaps;
+}
+
 std::unique_ptr<PImage> CZIreadAPI::GetSingleChannelScalingTileAccessorData(
     libCZI::PixelType pixeltype, libCZI::IntRect roi,
     libCZI::RgbFloatColor bgColor, float zoom,
     const std::string &coordinateString, const std::wstring &SceneIndexes) {
+  const auto planeCoordinate = ParsePlaneCoordinate(coordinateString);
+  const auto scstaOptions = this->CreateAccessorOptions(bgColor, SceneIndexes);
+
+  std::shared_ptr<libCZI::IBitmapData> Data = this->spAccessor->Get(
+      pixeltype, roi, &planeCoordinate, zoom, &scstaOptions);
+
+  this->PruneSubBlockCache();
+
+  std::unique_ptr<PImage> ptr_Bitmap(new PImage(Data));
+  return ptr_Bitmap;
+}
+
+void CZIreadAPI::GetSingleChannelScalingTileAccessorDataInto(
+    libCZI::IBitmapData *destination, libCZI::IntRect roi,
+    libCZI::RgbFloatColor bgColor, float zoom,
+    const std::string &coordinateString, const std::wstring &SceneIndexes,
+    int numThreads) {
+  const auto planeCoordinate = ParsePlaneCoordinate(coordinateString);
+  const auto scstaOptions = this->CreateAccessorOptions(bgColor, SceneIndexes);
+  const auto size = destination->GetSize();
+
+  // Splitting into stripes is only done for a zoom of 1, where each row of the
+  // ROI maps exactly to one row of the destination. For other zoom factors,
+  // the rounding of the stripe sizes would not add up to the destination size.
+  if (numThreads <= 1 || zoom != 1.0f || size.w != roi.w || size.h != roi.h ||
+      size.h < 2) {
+    this->spAccessor->Get(destination, roi, &planeCoordinate, zoom,
+                          &scstaOptions);
+
+    this->PruneSubBlockCache();
+    return;
+  }
+
+  // One stripe per thread, so that subblocks overlapping the border of two
+  // stripes (which are decoded for both of them) are kept to a minimum.
+  const std::uint32_t stripeCount =
+      std::min(static_cast<std::uint32_t>(numThreads), size.h);
+  libCZI::ScopedBitmapLockerP lockInfo{destination};
+  RunInParallel(stripeCount, numThreads, [&](size_t index) {
+    const auto top = static_cast<std::uint32_t>(size.h * index / stripeCount);
+    const auto bottom =
+        static_cast<std::uint32_t>(size.h * (index + 1) / stripeCount);
+    CBitmapView stripe(static_cast<std::uint8_t *>(lockInfo.ptrDataRoi) +
+                           top * lockInfo.stride,
+                       destination->GetPixelType(), size.w, bottom - top,
+                       lockInfo.stride);
+    const libCZI::IntRect stripeRoi{roi.x, roi.y + static_cast<int>(top), roi.w,
+                                    static_cast<int>(bottom - top)};
+    this->spAccessor->Get(&stripe, stripeRoi, &planeCoordinate, zoom,
+                          &scstaOptions);
+
+    this->PruneSubBlockCache();
+  });
+}
+
+std::unique_ptr<CReadPlan> CZIreadAPI::PrepareRead(
+    libCZI::PixelType pixeltype, libCZI::RgbFloatColor bgColor, float zoom,
+    const std::string &coordinateString, const std::wstring &SceneIndexes) {
+  return std::make_unique<CReadPlan>(
+      this->spAccessor, this->spSubBlockCache,
+      this->subBlockCacheOptions.pruneOptions, pixeltype,
+      ParsePlaneCoordinate(coordinateString),
+      this->CreateAccessorOptions(bgColor, SceneIndexes), zoom);
+}
+
+void CZIreadAPI::GetPyramidLayerTileAccessorDataInto(
+    libCZI::IBitmapData *destination, int x, int y,
+    libCZI::RgbFloatColor bgColor, int minificationFactor, int pyramidLayer,
+    const std::string &coordinateString, const std::wstring &SceneIndexes) {
+  const auto planeCoordinate = ParsePlaneCoordinate(coordinateString);
+  libCZI::ISingleChannelPyramidLayerTileAccessor::Options options;
+  options.Clear();
+  options.backGroundColor = bgColor;
+  if (this->spSubBlockCache) {
+    options.subBlockCache = this->spSubBlockCache;
+    options.onlyUseSubBlockCacheForCompressedData =
+        this->subBlockCacheOptions.cacheOnlyCompressed;
+  }
+
+  if (!SceneIndexes.empty()) {
+    options.sceneFilter = libCZI::Utils::IndexSetFromString(SceneIndexes);
+  }
+
+  const libCZI::ISingleChannelPyramidLayerTileAccessor::PyramidLayerInfo
+      pyramidLayerInfo{static_cast<std::uint8_t>(minificationFactor),
+                       static_cast<std::uint8_t>(pyramidLayer)};
+  int sizeOfPixelOnLayer0 = 1;
+  for (int layer = 0; layer < pyramidLayer; ++layer) {
+    sizeOfPixelOnLayer0 *= minificationFactor;
+  }
+
+  const auto size = destination->GetSize();
+  const libCZI::IntRect roi{x, y,
+                            static_cast<int>(size.w) * sizeOfPixelOnLayer0,
+                            static_cast<int>(size.h) * sizeOfPixelOnLayer0};
+  if (this->IsPyramidLayerMissing(roi, planeCoordinate,
+                                  options.sceneFilter.get(), minificationFactor,
+                                  pyramidLayer)) {
+    // libCZI throws std::out_of_range for a layer without subblocks in the
+    // ROI (while the ROI has subblocks on other layers), the expected result
+    // is the background though.
+    if (!std::isnan(bgColor.r) && !std::isnan(bgColor.g) &&
+        !std::isnan(bgColor.b)) {
+      libCZI::Utils::FillBitmap(destination, bgColor);
+    }
+
+    return;
+  }
+
+  this->spPyramidLayerAccessor->Get(destination, x, y, &planeCoordinate,
+                                    pyramidLayerInfo, &options);
+  this->PruneSubBlockCache();
+}
+
+bool CZIreadAPI::IsPyramidLayerMissing(
+    const libCZI::IntRect &roi, const libCZI::IDimCoordinate &planeCoordinate,
+    const libCZI::IIndexSet *sceneFilter, int minificationFactor,
+    int pyramidLayer) {
+  bool hasSubBlocks = false;
+  bool hasLayer = false;
+  this->spSpatialIndex->EnumSubset(
+      this->spReader.get(), &planeCoordinate, &roi, false,
+      [&](int, const DirectorySubBlockInfo &info) -> bool {
+        int scene;
+        if (sceneFilter &&
+            info.coordinate.TryGetPosition(DimensionIndex::S, &scene) &&
+            !sceneFilter->IsContained(scene)) {
+          return true;
+        }
+
+        hasSubBlocks = true;
+        // as in CSingleChannelPyramidLevelTileAccessor::CalcPyramidLayerNo
+        const double minFactor =
+            info.physicalSize.w > info.physicalSize.h
+                ? static_cast<double>(info.logicalRect.w) / info.physicalSize.w
+                : static_cast<double>(info.logicalRect.h) / info.physicalSize.h;
+        const int minFactorInt = static_cast<int>(std::round(minFactor));
+        int layer = 0;
+        for (int f = 1; f < minFactorInt; f *= minificationFactor) {
+          ++layer;
+        }
+
+        hasLayer = layer == pyramidLayer;
+        return !hasLayer;
+      });
+
+  return hasSubBlocks && !hasLayer;
+}
+
+std::map<int, ChannelDisplaySettingsStruct> CZIreadAPI::GetDisplaySettings() {
+  std::map<int, ChannelDisplaySettingsStruct> displaySettings;
+  const auto documentDisplaySettings = this->GetDocumentDisplaySettings();
+  if (documentDisplaySettings) {
+    documentDisplaySettings->EnumChannels([&](int channelIndex) -> bool {
+      displaySettings.emplace(
+          channelIndex,
+          ChannelDisplaySettingsStruct::FromChannelDisplaySetting(
+              documentDisplaySettings->GetChannelDisplaySettings(channelIndex)
+                  .get()));
+      return true;
+    });
+  }
+
+  return displaySettings;
+}
+
+void CZIreadAPI::GetMultiChannelCompositeInto(
+    libCZI::IBitmapData *destination, libCZI::IntRect roi, float zoom,
+    const std::string &coordinateString, const std::wstring &SceneIndexes,
+    const std::optional<std::map<int, ChannelDisplaySettingsStruct>>
+        &displaySettings,
+    int numThreads) {
+  if (destination->GetPixelType() != libCZI::PixelType::Bgr24) {
+    throw std::invalid_argument("The destination must be of pixel type Bgr24.");
+  }
+
+  std::shared_ptr<libCZI::IDisplaySettings> displaySettingsToUse;
+  if (displaySettings.has_value()) {
+    libCZI::DisplaySettingsPOD displaySettingsPod;
+    for (const auto &entry : displaySettings.value()) {
+      displaySettingsPod.channelDisplaySettings[entry.first] =
+          entry.second.ToChannelDisplaySettingsPOD();
+    }
+
+    displaySettingsToUse =
+        libCZI::DisplaySettingsPOD::CreateIDisplaySettingSp(displaySettingsPod);
+  } else {
+    displaySettingsToUse = this->GetDocumentDisplaySettings();
+    if (!displaySettingsToUse) {
+      throw std::invalid_argument("The document has no display settings.");
+    }
+  }
+
+  // channels without any subblock are read as (black) Gray8 bitmaps
+  const auto getCompositionPixelType = [this](int channelIndex) {
+    const auto pixelType = this->GetChannelPixelType(channelIndex);
+    switch (pixelType) {
+    case libCZI::PixelType::Invalid:
+      return libCZI::PixelType::Gray8;
+    case libCZI::PixelType::Gray8:
+    case libCZI::PixelType::Gray16:
+    case libCZI::PixelType::Bgr24:
+    case libCZI::PixelType::Bgr48:
+      return pixelType;
+    default:
+      throw std::invalid_argument(
+          "The pixel type of channel " + std::to_string(channelIndex) +
+          " is not supported by the multi-channel composition.");
+    }
+  };
+
+  libCZI::CDisplaySettingsHelper displaySettingsHelper;
+  displaySettingsHelper.Initialize(displaySettingsToUse.get(),
+                                   getCompositionPixelType);
+  const auto &activeChannels = displaySettingsHelper.GetActiveChannels();
+  std::vector<libCZI::PixelType> channelPixelTypes;
+  channelPixelTypes.reserve(activeChannels.size());
+  for (const auto channelIndex : activeChannels) {
+    channelPixelTypes.push_back(getCompositionPixelType(channelIndex));
+  }
+
+  if (activeChannels.empty()) {
+    // there is nothing to compose, the result is black
+    libCZI::ScopedBitmapLockerP lockInfo{destination};
+    const auto size = destination->GetSize();
+    for (std::uint32_t y = 0; y < size.h; ++y) {
+      std::memset(static_cast<std::uint8_t *>(lockInfo.ptrDataRoi) +
+                      y * lockInfo.stride,
+                  0, static_cast<size_t>(size.w) * 3);
+    }
+
+    return;
+  }
+
+  const auto planeCoordinate = ParsePlaneCoordinate(coordinateString);
+  const bool hasChannels = this->spReader->GetStatistics().dimBounds.IsValid(
+      libCZI::DimensionIndex::C);
+  const auto scstaOptions =
+      this->CreateAccessorOptions(libCZI::RgbFloatColor{0, 0, 0}, SceneIndexes);
+
+  std::vector<std::shared_ptr<libCZI::IBitmapData>> channelBitmaps(
+      activeChannels.size());
+  RunInParallel(activeChannels.size(), numThreads, [&](size_t index) {
+    auto channelCoordinate = planeCoordinate;
+    if (hasChannels) {
+      channelCoordinate.Set(libCZI::DimensionIndex::C, activeChannels[index]);
+    }
+
+    channelBitmaps[index] = this->spAccessor->Get(
+        channelPixelTypes[index], roi, &channelCoordinate, zoom, &scstaOptions);
+
+    this->PruneSubBlockCache();
+  });
+
+  std::vector<libCZI::IBitmapData *> sourceBitmaps;
+  sourceBitmaps.reserve(channelBitmaps.size());
+  for (const auto &channelBitmap : channelBitmaps) {
+    sourceBitmaps.push_back(channelBitmap.get());
+  }
+
+  libCZI::Compositors::ComposeMultiChannel_Bgr24(
+      destination, static_cast<int>(sourceBitmaps.size()), sourceBitmaps.data(),
+      displaySettingsHelper.GetChannelInfosArray());
+}
+
+libCZI::IntSize CZIreadAPI::CalcSize(libCZI::IntRect roi, float zoom) const {
+  return this->spAccessor->CalcSize(roi, zoom);
+}
+
+std::vector<std::unique_ptr<PImage>>
+CZIreadAPI::GetSingleChannelScalingTileAccessorDataBatch(
+    libCZI::PixelType pixeltype, const std::vector<libCZI::IntRect> &rois,
+    libCZI::RgbFloatColor bgColor, float zoom,
+    const std::vector<std::string> &coordinateStrings,
+    const std::wstring &SceneIndexes) {
+  if (rois.size() != coordinateStrings.size()) {
+    throw std::invalid_argument(
+        "The number of ROIs and plane coordinates must be equal.");
+  }
+
+  // tiles of a batch usually share a few planes, each of them is parsed once
+  std::map<std::string, libCZI::CDimCoordinate> planeCoordinates;
+  for (const auto &coordinateString : coordinateStrings) {
+    if (planeCoordinates.count(coordinateString) == 0) {
+      planeCoordinates.emplace(coordinateString,
+                               ParsePlaneCoordinate(coordinateString));
+    }
+  }
+
+  const auto scstaOptions = this->CreateAccessorOptions(bgColor, SceneIndexes);
+
+  std::vector<std::unique_ptr<PImage>> bitmaps;
+  bitmaps.reserve(rois.size());
+  for (size_t i = 0; i < rois.size(); ++i) {
+    const auto &planeCoordinate = planeCoordinates.at(coordinateStrings[i]);
+    std::shared_ptr<libCZI::IBitmapData> Data = this->spAccessor->Get(
+        pixeltype, rois[i], &planeCoordinate, zoom, &scstaOptions);
+
+    // we prune after each ROI, so that the configured limits of the cache are
+    // respected throughout the batch
+    this->PruneSubBlockCache();
+
+    bitmaps.emplace_back(new PImage(Data));
+  }
+
+  return bitmaps;
+}
+
+void CZIreadAPI::GetSingleChannelScalingTileAccessorDataStackInto(
+    const std::vector<std::shared_ptr<libCZI::IBitmapData>> &destinations,
+    libCZI::IntRect roi, libCZI::RgbFloatColor bgColor, float zoom,
+    const std::vector<std::string> &coordinateStrings,
+    const std::wstring &SceneIndexes, int numThreads) {
+  if (destinations.size() != coordinateStrings.size()) {
+    throw std::invalid_argument(
+        "The number of destinations and plane coordinates must be equal.");
+  }
+
+  std::vector<libCZI::CDimCoordinate> planeCoordinates;
+  planeCoordinates.reserve(coordinateStrings.size());
+  for (const auto &coordinateString : coordinateStrings) {
+    planeCoordinates.push_back(ParsePlaneCoordinate(coordinateString));
+  }
+
+  const auto scstaOptions = this->CreateAccessorOptions(bgColor, SceneIndexes);
+
+  RunInParallel(destinations.size(), numThreads, [&](size_t index) {
+    this->spAccessor->Get(destinations[index].get(), roi,
+                          &planeCoordinates[index], zoom, &scstaOptions);
+
+    // we prune after each plane, so that the configured limits of the cache
+    // are respected throughout the stack
+    this->PruneSubBlockCache();
+  });
+}
+
+std::shared_ptr<libCZI::IDisplaySettings>
+CZIreadAPI::GetDocumentDisplaySettings() {
+  const auto mds = this->spReader->ReadMetadataSegment();
+  if (!mds) {
+    return nullptr;
+  }
+
+  const auto documentInfo =
+      mds->CreateMetaFromMetadataSegment()->GetDocumentInfo();
+  return documentInfo ? documentInfo->GetDisplaySettings() : nullptr;
+}
+
+/*static*/ libCZI::CDimCoordinate
+CZIreadAPI::ParsePlaneCoordinate(const std::string &coordinateString) {
   libCZI::CDimCoordinate planeCoordinate;
   try {
     planeCoordinate = CDimCoordinate::Parse(coordinateString.c_str());
@@ -115,6 +666,12 @@ std::unique_ptr<PImage> CZIreadAPI::GetSingleChannelScalingTileAccessorData(
     // TODO Error handling
   }
 
+  return planeCoordinate;
+}
+
+libCZI::ISingleChannelScalingTileAccessor::Options
+CZIreadAPI::CreateAccessorOptions(const libCZI::RgbFloatColor &bgColor,
+                                  const std::wstring &SceneIndexes) const {
   libCZI::ISingleChannelScalingTileAccessor::Options scstaOptions;
   scstaOptions.Clear();
   scstaOptions.useVisibilityCheckOptimization =
@@ -130,15 +687,19 @@ std::unique_ptr<PImage> CZIreadAPI::GetSingleChannelScalingTileAccessorData(
     scstaOptions.sceneFilter = libCZI::Utils::IndexSetFromString(SceneIndexes);
   }
 
-  std::shared_ptr<libCZI::IBitmapData> Data = this->spAccessor->Get(
-      pixeltype, roi, &planeCoordinate, zoom, &scstaOptions);
+  return scstaOptions;
+}
 
+void CZIreadAPI::PruneSubBlockCache() {
   if (this->spSubBlockCache) {
     this->spSubBlockCache->Prune(this->subBlockCacheOptions.pruneOptions);
   }
+}
 
-  std::unique_ptr<PImage> ptr_Bitmap(new PImage(Data));
-  return ptr_Bitmap;
+/*static*/ void
+CZIreadAPI::RunInParallel(size_t count, int numThreads,
+                          const std::function<void(size_t)> &func) {
+  CWorkerPool::GetInstance().Run(count, numThreads, func);
 }
 
 /// Returns an info struct on the subblock cache
@@ -152,7 +713,34 @@ SubBlockCacheInfo CZIreadAPI::GetCacheInfo() {
         libCZI::ISubBlockCacheStatistics::kMemoryUsage);
     cacheInfo.elementsCount = cacheStatistics.elementsCount;
     cacheInfo.memoryUsage = cacheStatistics.memoryUsage;
+    const auto cacheWithStatistics =
+        std::dynamic_pointer_cast<CSubBlockCacheWithStatistics>(
+            this->spSubBlockCache);
+    if (cacheWithStatistics) {
+      cacheWithStatistics->GetCounters(cacheInfo);
+    }
+  }
+
+  const auto countingStream =
+      std::dynamic_pointer_cast<CCountingStream>(this->spStream);
+  if (countingStream) {
+    cacheInfo.bytesReadFromStream = countingStream->GetBytesRead();
   }
 
   return cacheInfo;
 }
+
+void CZIreadAPI::ResetCacheStatistics() {
+  const auto cacheWithStatistics =
+      std::dynamic_pointer_cast<CSubBlockCacheWithStatistics>(
+          this->spSubBlockCache);
+  if (cacheWithStatistics) {
+    cacheWithStatistics->ResetCounters();
+  }
+
+  const auto countingStream =
+      std::dynamic_pointer_cast<CCountingStream>(this->spStream);
+  if (countingStream) {
+    countingStream->ResetBytesRead();
+  }
+}
@@ -1,10 +1,19 @@
 #pragma once
 
+#include "BitmapView.h"
+#include "DisplaySettings.h"
 #include "PImage.h"
+#include "ReadPlan.h"
 #include "SubBlockCache.h"
+#include "SubBlockIndex.h"
+#include "SubBlockSpatialIndex.h"
 #include "inc_libCzi.h"
+#include <functional>
 #include <iostream>
+#include <map>
 #include <optional>
+#include <tuple>
+#include <vector>
 
 /// Class used to represent a CZI reader object in pylibCZIrw.
 /// It gathers the libCZI features needed for reading in the pylibCZIrw project.
@@ -12,10 +21,19 @@
 class CZIreadAPI {
 
 private:
+  std::shared_ptr<libCZI::IStream>
+      spStream; ///< The stream the reader operates on.
   std::shared_ptr<libCZI::ICZIReader>
       spReader; ///< The pointer to the spReader.
+  std::shared_ptr<CSubBlockSpatialIndex>
+      spSpatialIndex; ///< The spatial index over the subblocks, shared with
+                      ///< the siblings of this object.
   std::shared_ptr<libCZI::ISingleChannelScalingTileAccessor>
-      spAccessor; ///< The pointer to the spAccessor object.
+      spAccessor; ///< The pointer to the spAccessor object (which finds the
+                  ///< subblocks to compose using the spatial index).
+  std::shared_ptr<libCZI::ISingleChannelPyramidLayerTileAccessor>
+      spPyramidLayerAccessor; ///< The pointer to the accessor for reading
+                              ///< single pyramid layers.
   std::shared_ptr<libCZI::ISubBlockCache>
       spSubBlockCache; ///< The pointer to the subblock cache object, may be
                        ///< null (in which case no caching is done)
@@ -71,8 +89,31 @@ public:
   CZIreadAPI(const std::string &stream_class_name, const std::wstring &fileName,
              const SubBlockCacheOptions &subBlockCacheOptions);
 
-  /// Close the Opened czi document
-  void close() { this->spReader->Close(); }
+  /// Creates a new reader object (with its own reader and accessor) operating
+  /// on the same stream and sharing the subblock cache (and its options) with
+  /// this object. This allows to use several reader objects for the same
+  /// document concurrently, without opening the file again.
+  std::unique_ptr<CZIreadAPI> CreateSibling() const;
+
+  /// Returns the index, name and content file type (e.g. "JPG" or "CZI") of
+  /// all attachments of the document.
+  std::vector<std::tuple<int, std::string, std::string>> GetAttachmentInfos();
+
+  /// Reads the attachment with the given index from the document. Throws
+  /// std::invalid_argument if there is no attachment with this index.
+  std::shared_ptr<libCZI::IAttachment> ReadAttachment(int index);
+
+  /// Creates a reader object for the czi document embedded in the attachment
+  /// with the given index (e.g. the label or slide preview image), which is
+  /// read from memory. The reader does not use a subblock cache.
+  std::unique_ptr<CZIreadAPI> OpenAttachedDocument(int index);
+
+  /// Close the Opened czi document. The stream (e.g. the file) is closed once
+  /// the siblings of this object are closed as well.
+  void close() {
+    this->spReader->Close();
+    this->spStream.reset();
+  }
 
   /// Returns raw xml metadata from the czi document.
   std::string GetXmlMetadata();
@@ -80,12 +121,71 @@ public:
   /// Returns SubBlockStatistics about the czi document
   libCZI::SubBlockStatistics GetSubBlockStats();
 
+  /// Returns the information on all subblocks of the subblock directory (in
+  /// the order of the subblock directory).
+  std::vector<SubBlockIndexEntry> GetSubBlockIndex();
+
+  /// Returns the statistics of all pyramid layers of all scenes (ordered by
+  /// scene and pyramid layer). Subblocks whose pyramid layer could not be
+  /// determined are not counted.
+  std::vector<PyramidLayerStatistics> GetPyramidLayerStatistics();
+
+  /// Reads the subblock with the given index (of the subblock directory) from
+  /// the document, without decoding it. Throws std::invalid_argument if there
+  /// is no subblock with this index.
+  std::shared_ptr<libCZI::ISubBlock> ReadSubBlock(int index);
+
+  /// <summary>
+  /// Reads the subblocks with the given indices (of the subblock directory)
+  /// from the document, without decoding them. The subblocks are read by up to
+  /// numThreads threads (the calling thread included).
+  /// </summary>
+  /// <param name="indices">The indices of the subblocks</param>
+  /// <param name="numThreads">The maximal number of threads to use</param>
+  /// <returns>The subblocks, in the order of the indices</returns>
+  std::vector<std::shared_ptr<libCZI::ISubBlock>>
+  ReadSubBlocks(const std::vector<int> &indices, int numThreads);
+
+  /// <summary>
+  /// Reads and decodes the subblocks with the given indices (of the subblock
+  /// directory). The bitmaps are the stored bitmaps of the subblocks (with
+  /// their physical size and pixel type), no composition or conversion is
+  /// done. The subblocks are read and decoded by up to numThreads threads (the
+  /// calling thread included).
+  /// </summary>
+  /// <param name="indices">The indices of the subblocks</param>
+  /// <param name="numThreads">The maximal number of threads to use</param>
+  /// <returns>The bitmaps stored as PImage objects, in the order of the
+  /// indices</returns>
+  std::vector<std::unique_ptr<PImage>>
+  ReadSubBlockBitmaps(const std::vector<int> &indices, int numThreads);
+
+  /// <summary>
+  /// Returns the information on the subblocks matching the given plane
+  /// coordinate and scene filter and intersecting the given ROI (in the order
+  /// of the subblock directory). The subblocks are looked up in the spatial
+  /// index, which is built on first use.
+  /// </summary>
+  /// <param name="roi">The ROI</param>
+  /// <param name="coordinateString">The plane coordinate, only the dimensions
+  /// it contains are compared</param>
+  /// <param name="SceneIndexes">String specifying the scene filter</param>
+  /// <param name="onlyLayer0">Whether to only return subblocks of pyramid
+  /// layer 0</param>
+  std::vector<SubBlockIndexEntry>
+  QuerySubBlocks(libCZI::IntRect roi, const std::string &coordinateString,
+                 const std::wstring &SceneIndexes, bool onlyLayer0);
+
   /// Returns Pixeltype of the specified channel index
   libCZI::PixelType GetChannelPixelType(int channelIdx);
 
   /// Returns the size of the given dimension in the czi document.
   size_t GetDimensionSize(libCZI::DimensionIndex DimIndex);
 
+  /// Returns the intervals (start index and size) of all dimensions present in
+  /// the czi document, keyed by the character of the dimension (e.g. "C").
+  std::map<std::string, std::pair<int, int>> GetDimensionBounds();
+
   /// <summary>
   /// Returns the bitmap (as a PImage object)
   /// </summary>
@@ -100,9 +200,196 @@ public:
       libCZI::RgbFloatColor bgColor, float zoom,
       const std::string &coordinateString, const std::wstring &SceneIndexes);
 
-  /// Returns information about the current state of the subblock cache. If
-  /// caching is not active, the returned struct will contain zeros.
+  /// <summary>
+  /// Composes the bitmap into the given destination bitmap, which is provided
+  /// by the caller. No bitmap is allocated by this method. The pixel type of
+  /// the composition is the pixel type of the destination bitmap, and its size
+  /// must exactly match the size reported by CalcSize (for the same ROI and
+  /// zoom).
+  /// </summary>
+  /// <param name="destination">The destination bitmap</param>
+  /// <param name="roi">The ROI</param>
+  /// <param name="bgColor">The background color</param>
+  /// <param name="zoom">The zoom factor</param>
+  /// <param name="coordinateString">The plane coordinate</param>
+  /// <param name="SceneIndexes">String specifying the scene filter</param>
+  /// <param name="numThreads">The maximal number of threads to use. With more
+  /// than one thread and a zoom of 1, the ROI is split into horizontal stripes
+  /// which are composed concurrently into the destination bitmap.</param>
+  void GetSingleChannelScalingTileAccessorDataInto(
+      libCZI::IBitmapData *destination, libCZI::IntRect roi,
+      libCZI::RgbFloatColor bgColor, float zoom,
+      const std::string &coordinateString, const std::wstring &SceneIndexes,
+      int numThreads = 1);
+
+  /// <summary>
+  /// Prepares reads of the given pixel type, plane coordinate, scene filter,
+  /// background color and zoom, which then only differ in their ROI. The plane
+  /// coordinate and scene filter are parsed once for all reads of the plan.
+  /// </summary>
+  /// <param name="pixeltype">The pixel type of the composition</param>
+  /// <param name="bgColor">The background color</param>
+  /// <param name="zoom">The zoom factor</param>
+  /// <param name="coordinateString">The plane coordinate</param>
+  /// <param name="SceneIndexes">String specifying the scene filter</param>
+  /// <returns>The read plan, which shares the accessor and subblock cache
+  /// with this object</returns>
+  std::unique_ptr<CReadPlan> PrepareRead(libCZI::PixelType pixeltype,
+                                         libCZI::RgbFloatColor bgColor,
+                                         float zoom,
+                                         const std::string &coordinateString,
+                                         const std::wstring &SceneIndexes);
+
+  /// <summary>
+  /// Composes the bitmap of the given pyramid layer into the given destination
+  /// bitmap, which is provided by the caller. The subblocks of the pyramid
+  /// layer are copied without scaling, i.e. one pixel of the destination
+  /// corresponds to minificationFactor^pyramidLayer pixels of layer 0. The
+  /// pixel type of the composition is the pixel type of the destination.
+  /// </summary>
+  /// <param name="destination">The destination bitmap</param>
+  /// <param name="x">The x position of the ROI (in pixels of layer 0)</param>
+  /// <param name="y">The y position of the ROI (in pixels of layer 0)</param>
+  /// <param name="bgColor">The background color</param>
+  /// <param name="minificationFactor">The factor between adjacent pyramid
+  /// layers</param>
+  /// <param name="pyramidLayer">The pyramid layer number</param>
+  /// <param name="coordinateString">The plane coordinate</param>
+  /// <param name="SceneIndexes">String specifying the scene filter</param>
+  void GetPyramidLayerTileAccessorDataInto(
+      libCZI::IBitmapData *destination, int x, int y,
+      libCZI::RgbFloatColor bgColor, int minificationFactor, int pyramidLayer,
+      const std::string &coordinateString, const std::wstring &SceneIndexes);
+
+  /// Returns the display settings stored in the metadata of the document,
+  /// keyed by channel index (empty if there are none).
+  std::map<int, ChannelDisplaySettingsStruct> GetDisplaySettings();
+
+  /// <summary>
+  /// Composes the channels enabled in the display settings into the given
+  /// Bgr24 destination bitmap, which is provided by the caller (its size must
+  /// exactly match the size reported by CalcSize). Each channel is read in its
+  /// own pixel type with a black background, then the black and white points,
+  /// gradation curve and tinting of the display settings are applied by the
+  /// multi-channel compositor of libCZI. The channels are read by up to
+  /// numThreads threads (the calling thread included).
+  /// </summary>
+  /// <param name="destination">The destination bitmap</param>
+  /// <param name="roi">The ROI</param>
+  /// <param name="zoom">The zoom factor</param>
+  /// <param name="coordinateString">The plane coordinate, its C coordinate is
+  /// replaced by the channel index</param>
+  /// <param name="SceneIndexes">String specifying the scene filter</param>
+  /// <param name="displaySettings">The display settings keyed by channel
+  /// index, the display settings stored in the document are used if not
+  /// given</param>
+  /// <param name="numThreads">The maximal number of threads to use</param>
+  void GetMultiChannelCompositeInto(
+      libCZI::IBitmapData *destination, libCZI::IntRect roi, float zoom,
+      const std::string &coordinateString, const std::wstring &SceneIndexes,
+      const std::optional<std::map<int, ChannelDisplaySettingsStruct>>
+          &displaySettings,
+      int numThreads);
+
+  /// Returns the size of the bitmap composed for the given ROI and zoom.
+  libCZI::IntSize CalcSize(libCZI::IntRect roi, float zoom) const;
+
+  /// <summary>
+  /// Returns the bitmaps (as PImage objects) for a batch of ROIs, each of its
+  /// own plane. All ROIs share the same scene filter, pixel type, background
+  /// color and zoom, so that those are only prepared once for the whole batch,
+  /// and each distinct plane coordinate is parsed once.
+  /// </summary>
+  /// <param name="pixeltype">The pixel type of the returned bitmaps</param>
+  /// <param name="rois">The ROIs</param>
+  /// <param name="bgColor">The background color</param>
+  /// <param name="zoom">The zoom factor</param>
+  /// <param name="coordinateStrings">The plane coordinate of each ROI</param>
+  /// <param name="SceneIndexes">String specifying the scene filter</param>
+  /// <returns>The bitmaps stored as PImage objects, in the order of the
+  /// ROIs</returns>
+  std::vector<std::unique_ptr<PImage>>
+  GetSingleChannelScalingTileAccessorDataBatch(
+      libCZI::PixelType pixeltype, const std::vector<libCZI::IntRect> &rois,
+      libCZI::RgbFloatColor bgColor, float zoom,
+      const std::vector<std::string> &coordinateStrings,
+      const std::wstring &SceneIndexes);
+
+  /// <summary>
+  /// Composes a stack of planes into the given destination bitmaps, which are
+  /// provided by the caller (one destination bitmap per plane coordinate). All
+  /// planes share the same ROI, scene filter, background color and zoom. The
+  /// planes are composed by up to numThreads threads (the calling thread
+  /// included).
+  /// </summary>
+  /// <param name="destinations">The destination bitmaps</param>
+  /// <param name="roi">The ROI</param>
+  /// <param name="bgColor">The background color</param>
+  /// <param name="zoom">The zoom factor</param>
+  /// <param name="coordinateStrings">The plane coordinates, in the order of
+  /// the destination bitmaps</param>
+  /// <param name="SceneIndexes">String specifying the scene filter</param>
+  /// <param name="numThreads">The maximal number of threads to use</param>
+  void GetSingleChannelScalingTileAccessorDataStackInto(
+      const std::vector<std::shared_ptr<libCZI::IBitmapData>> &destinations,
+      libCZI::IntRect roi, libCZI::RgbFloatColor bgColor, float zoom,
+      const std::vector<std::string> &coordinateStrings,
+      const std::wstring &SceneIndexes, int numThreads);
+
+  /// Returns information about the current state of the subblock cache and
+  /// its statistics (which are shared with the siblings of this object). If
+  /// caching is not active, the returned struct will contain zeros, except for
+  /// the bytes read from the stream.
   /// <returns>A SubBlockCacheInfo struct containing the cache
   /// information.</returns>
   SubBlockCacheInfo GetCacheInfo();
+
+  /// Resets the statistics of the subblock cache and the count of bytes read
+  /// from the stream to zero. The content of the cache is kept.
+  void ResetCacheStatistics();
+
+private:
+  /// Constructor which constructs a CZIrwAPI object operating on the given
+  /// stream, using the given subblock cache (which may be null).
+  CZIreadAPI(std::shared_ptr<libCZI::IStream> stream,
+             std::shared_ptr<libCZI::ISubBlockCache> subBlockCache,
+             const SubBlockCacheOptions &subBlockCacheOptions,
+             std::shared_ptr<CSubBlockSpatialIndex> spatialIndex);
+
+  /// Opens the reader for the given stream and creates the accessor, which
+  /// uses the given spatial index.
+  void Open(std::shared_ptr<libCZI::IStream> stream,
+            std::shared_ptr<CSubBlockSpatialIndex> spatialIndex);
+
+  /// Parses the plane coordinate given in string representation.
+  static libCZI::CDimCoordinate
+  ParsePlaneCoordinate(const std::string &coordinateString);
+
+  /// Creates the options for the scaling tile accessor, including the scene
+  /// filter and the subblock cache (if any).
+  libCZI::ISingleChannelScalingTileAccessor::Options
+  CreateAccessorOptions(const libCZI::RgbFloatColor &bgColor,
+                        const std::wstring &SceneIndexes) const;
+
+  /// Returns the display settings stored in the metadata of the document, or
+  /// null if there are none.
+  std::shared_ptr<libCZI::IDisplaySettings> GetDocumentDisplaySettings();
+
+  /// Prunes the subblock cache (if any) according to the configured options.
+  void PruneSubBlockCache();
+
+  /// Returns true if the ROI (in pixels of layer 0) contains subblocks of the
+  /// plane, but none of them is on the given pyramid layer. The pyramid layer
+  /// of a subblock is determined as by the pyramid layer tile accessor.
+  bool IsPyramidLayerMissing(const libCZI::IntRect &roi,
+                             const libCZI::IDimCoordinate &planeCoordinate,
+                             const libCZI::IIndexSet *sceneFilter,
+                             int minificationFactor, int pyramidLayer);
+
+  /// Calls func for all indices from 0 to count-1, spread over up to numThreads
+  /// threads: the calling thread and threads of the (long-lived) worker pool
+  /// of the module. The first exception thrown by func stops the processing of
+  /// further indices and is rethrown.
+  static void RunInParallel(size_t count, int numThreads,
+                            const std::function<void(size_t)> &func);
 };
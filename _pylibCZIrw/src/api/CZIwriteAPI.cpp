@@ -1,15 +1,47 @@
 #include "CZIwriteAPI.h"
 #include "../pylibCZIrw_Config.h"
+#include "BitmapView.h"
+#include <cstring>
 #include <optional>
 
 using namespace libCZI;
 using namespace std;
 
+namespace {
+/// Returns a copy of the bitmap, owning its memory.
+shared_ptr<IBitmapData> CopyBitmap(const shared_ptr<IBitmapData> &bitmap) {
+  const auto size = bitmap->GetSize();
+  const auto rowSize = static_cast<size_t>(size.w) *
+                       Utils::GetBytesPerPixel(bitmap->GetPixelType());
+  const auto copy = make_shared<CMemBitmapWrapper>(
+      bitmap->GetPixelType(), size.w, size.h, static_cast<uint32_t>(rowSize));
+  ScopedBitmapLockerSP source{bitmap};
+  ScopedBitmapLockerSP destination{copy};
+  for (uint32_t y = 0; y < size.h; ++y) {
+    memcpy(static_cast<char *>(destination.ptrDataRoi) + y * destination.stride,
+           static_cast<const char *>(source.ptrDataRoi) + y * source.stride,
+           rowSize);
+  }
+
+  return copy;
+}
+} // namespace
+
 CZIwriteAPI::CZIwriteAPI(const std::wstring &fileName)
     : CZIwriteAPI(fileName, "") {}
 
 CZIwriteAPI::CZIwriteAPI(const std::wstring &fileName,
-                         const std::string &compressionOptions) {
+                         const std::string &compressionOptions)
+    : CZIwriteAPI(fileName, compressionOptions, 0) {}
+
+CZIwriteAPI::CZIwriteAPI(const std::wstring &fileName,
+                         const std::string &compressionOptions,
+                         int compressionThreads, std::uint64_t maxQueuedBytes) {
+  if (compressionThreads < 0) {
+    throw invalid_argument(
+        "The number of compression threads must not be negative.");
+  }
+
   if (!compressionOptions.empty()) {
     this->defaultCompressionOptions_ =
         Utils::ParseCompressionOptions(compressionOptions);
@@ -36,6 +68,35 @@ CZIwriteAPI::CZIwriteAPI(const std::wstring &fileName,
   spWriter->Create(stream, spWriterInfo);
 
   this->spWriter_ = spWriter;
+  if (compressionThreads > 0) {
+    this->writePipeline_ = std::make_unique<CWritePipeline>(
+        compressionThreads, &CZIwriteAPI::CompressTile,
+        [this](const TileToWrite &tile) { this->WriteTile(tile); },
+        maxQueuedBytes);
+    this->copySubmittedTiles_ = maxQueuedBytes > 0;
+  }
+}
+
+void CZIwriteAPI::close() {
+  std::exception_ptr error;
+  if (this->writePipeline_) {
+    try {
+      this->writePipeline_->Flush();
+    } catch (...) {
+      error = std::current_exception();
+    }
+
+    this->writePipeline_->Shutdown();
+  }
+
+  {
+    std::lock_guard<std::mutex> lock(this->writerMutex_);
+    this->spWriter_->Close();
+  }
+
+  if (error) {
+    std::rethrow_exception(error);
+  }
 }
 
 bool CZIwriteAPI::AddTile(const std::string &coordinateString,
@@ -49,22 +110,39 @@ bool CZIwriteAPI::AddTileEx(const std::string &coordinateString,
                             const PImage *plane, int x, int y, int m,
                             const std::string &compressionOptions,
                             const std::string &retiling_id) {
-  libCZI::Utils::CompressionOption actualCompressionOptions;
-  if (!compressionOptions.empty()) {
-    actualCompressionOptions =
-        Utils::ParseCompressionOptions(compressionOptions);
-  } else {
-    actualCompressionOptions = this->defaultCompressionOptions_;
+  auto tile = this->CreateTile(coordinateString, plane, x, y, m,
+                               compressionOptions, retiling_id);
+  CZIwriteAPI::CompressTile(tile);
+  this->WriteTile(tile);
+
+  return true;
+}
+
+std::uint64_t CZIwriteAPI::SubmitTile(const std::string &coordinateString,
+                                      const PImage *plane, int x, int y, int m,
+                                      const std::string &compressionOptions,
+                                      const std::string &retiling_id) {
+  if (!this->writePipeline_) {
+    throw runtime_error(
+        "Tiles can only be submitted to a writer with compression threads.");
+  }
+
+  // the tile is used beyond this call, while the plane may refer to memory
+  // owned by the caller (e.g. a numpy array), which the caller only promises
+  // to keep unchanged until it waited for the tile without a queue limit
+  auto tile = this->CreateTile(coordinateString, plane, x, y, m,
+                               compressionOptions, retiling_id);
+  if (this->copySubmittedTiles_) {
+    tile.bitmap = CopyBitmap(tile.bitmap);
   }
 
-  libCZI::CDimCoordinate coords;
-  bool conversion_to_cdim =
-      Utils::StringToDimCoordinate(coordinateString.c_str(), &coords);
-  auto sbmetadata = CZIwriteAPI::CreateSubBlockMetadataXml(retiling_id);
-  CZIwriteAPI::AddSubBlock(coords, plane, actualCompressionOptions,
-                           this->spWriter_.get(), x, y, m, sbmetadata);
+  return this->writePipeline_->Submit(std::move(tile));
+}
 
-  return true;
+void CZIwriteAPI::WaitForTiles(const std::vector<std::uint64_t> &tickets) {
+  if (this->writePipeline_) {
+    this->writePipeline_->WaitForTiles(tickets);
+  }
 }
 
 void CZIwriteAPI::WriteMetadata(
@@ -125,33 +203,9 @@ void CZIwriteAPI::WriteMetadata(
   // explanation on this process)
   if (displaySettings.size()) {
     DisplaySettingsPOD display_settings;
-    ChannelDisplaySettingsPOD channel_display_setting;
     for (const auto &entry : displaySettings) {
-      channel_display_setting.Clear();
-      channel_display_setting.isEnabled = entry.second.isEnabled;
-      channel_display_setting.tintingColor = entry.second.tintingColor;
-      channel_display_setting.blackPoint = entry.second.blackPoint;
-      channel_display_setting.whitePoint = entry.second.whitePoint;
-      switch (entry.second.tintingMode) {
-      case TintingModeEnum::Color:
-        channel_display_setting.tintingMode =
-            libCZI::IDisplaySettings::TintingMode::Color;
-        break;
-      case TintingModeEnum::LookUpTableExplicit:
-        channel_display_setting.tintingMode =
-            libCZI::IDisplaySettings::TintingMode::LookUpTableExplicit;
-        break;
-      case TintingModeEnum::LookUpTableWellKnown:
-        channel_display_setting.tintingMode =
-            libCZI::IDisplaySettings::TintingMode::LookUpTableWellKnown;
-        break;
-      default:
-        channel_display_setting.tintingMode =
-            libCZI::IDisplaySettings::TintingMode::None;
-        break;
-      }
       display_settings.channelDisplaySettings[entry.first] =
-          (channel_display_setting);
+          entry.second.ToChannelDisplaySettingsPOD();
     }
 
     MetadataUtils::WriteDisplaySettings(
@@ -179,6 +233,7 @@ void CZIwriteAPI::WriteMetadata(
   writerMdInfo.Clear();
   writerMdInfo.szMetadata = xml.c_str();
   writerMdInfo.szMetadataSize = xml.size();
+  std::lock_guard<std::mutex> lock(this->writerMutex_);
   this->spWriter_->SyncWriteMetadata(writerMdInfo);
 }
 
@@ -194,68 +249,98 @@ CZIwriteAPI::CreateSubBlockMetadataXml(const std::string &retiling_id) {
   }
 }
 
-/*static*/ void CZIwriteAPI::AddSubBlock(
-    const libCZI::CDimCoordinate &coord, const PImage *subblock,
-    const libCZI::Utils::CompressionOption &compressionOptions,
-    libCZI::ICziWriter *writer, int x, int y, int m,
-    const std::string &sbmetadata) {
-  if (compressionOptions.first == CompressionMode::UnCompressed) {
+TileToWrite CZIwriteAPI::CreateTile(const std::string &coordinateString,
+                                    const PImage *plane, int x, int y, int m,
+                                    const std::string &compressionOptions,
+                                    const std::string &retiling_id) const {
+  TileToWrite tile;
+  Utils::StringToDimCoordinate(coordinateString.c_str(), &tile.coordinate);
+  tile.bitmap = plane->get_bitmap();
+  tile.x = x;
+  tile.y = y;
+  tile.m = m;
+  if (!compressionOptions.empty()) {
+    tile.compressionOptions =
+        Utils::ParseCompressionOptions(compressionOptions);
+  } else {
+    tile.compressionOptions = this->defaultCompressionOptions_;
+  }
+
+  tile.subBlockMetadata = CZIwriteAPI::CreateSubBlockMetadataXml(retiling_id);
+  return tile;
+}
+
+/*static*/ void CZIwriteAPI::CompressTile(TileToWrite &tile) {
+  const auto compressionMode = tile.compressionOptions.first;
+  if (compressionMode == CompressionMode::UnCompressed) {
+    return;
+  }
+
+  if (compressionMode != CompressionMode::Zstd1 &&
+      compressionMode != CompressionMode::Zstd0) {
+    throw invalid_argument("An unsupported compression mode was specified.");
+  }
+
+  ScopedBitmapLockerSP lockedBitmap{tile.bitmap};
+  const auto size = tile.bitmap->GetSize();
+  if (compressionMode == CompressionMode::Zstd1) {
+    tile.compressedData = ZstdCompress::CompressZStd1Alloc(
+        size.w, size.h, lockedBitmap.stride, tile.bitmap->GetPixelType(),
+        lockedBitmap.ptrDataRoi, tile.compressionOptions.second.get());
+  } else {
+    tile.compressedData = ZstdCompress::CompressZStd0Alloc(
+        size.w, size.h, lockedBitmap.stride, tile.bitmap->GetPixelType(),
+        lockedBitmap.ptrDataRoi, tile.compressionOptions.second.get());
+  }
+}
+
+void CZIwriteAPI::WriteTile(const TileToWrite &tile) {
+  const auto size = tile.bitmap->GetSize();
+  if (tile.compressionOptions.first == CompressionMode::UnCompressed) {
+    ScopedBitmapLockerSP lockedBitmap{tile.bitmap};
     AddSubBlockInfoStridedBitmap addInfo;
     addInfo.Clear();
-    addInfo.coordinate = coord;
+    addInfo.coordinate = tile.coordinate;
     addInfo.mIndexValid = true;
-    addInfo.mIndex = m;
-    addInfo.x = x;
-    addInfo.y = y;
-    addInfo.logicalWidth = static_cast<int>(subblock->get_width());
-    addInfo.logicalHeight = static_cast<int>(subblock->get_height());
-    addInfo.physicalWidth = static_cast<int>(subblock->get_width());
-    addInfo.physicalHeight = static_cast<int>(subblock->get_height());
-    addInfo.PixelType = subblock->get_pixelType();
-    addInfo.ptrBitmap = subblock->get_data();
-    addInfo.strideBitmap = static_cast<uint32_t>(subblock->get_stride());
+    addInfo.mIndex = tile.m;
+    addInfo.x = tile.x;
+    addInfo.y = tile.y;
+    addInfo.logicalWidth = static_cast<int>(size.w);
+    addInfo.logicalHeight = static_cast<int>(size.h);
+    addInfo.physicalWidth = static_cast<int>(size.w);
+    addInfo.physicalHeight = static_cast<int>(size.h);
+    addInfo.PixelType = tile.bitmap->GetPixelType();
+    addInfo.ptrBitmap = lockedBitmap.ptrDataRoi;
+    addInfo.strideBitmap = lockedBitmap.stride;
     addInfo.SetCompressionMode(libCZI::CompressionMode::UnCompressed);
-    addInfo.ptrSbBlkMetadata = sbmetadata.c_str();
-    addInfo.sbBlkMetadataSize = static_cast<uint32_t>(sbmetadata.size());
+    addInfo.ptrSbBlkMetadata = tile.subBlockMetadata.c_str();
+    addInfo.sbBlkMetadataSize =
+        static_cast<uint32_t>(tile.subBlockMetadata.size());
 
-    writer->SyncAddSubBlock(addInfo);
-  } else if (compressionOptions.first == CompressionMode::Zstd1 ||
-             compressionOptions.first == CompressionMode::Zstd0) {
+    std::lock_guard<std::mutex> lock(this->writerMutex_);
+    this->spWriter_->SyncAddSubBlock(addInfo);
+  } else {
     AddSubBlockInfoMemPtr addInfo;
     addInfo.Clear();
-    addInfo.coordinate = coord;
+    addInfo.coordinate = tile.coordinate;
     addInfo.mIndexValid = true;
-    addInfo.mIndex = m;
-    addInfo.x = x;
-    addInfo.y = y;
-    addInfo.logicalWidth = static_cast<int>(subblock->get_width());
-    addInfo.logicalHeight = static_cast<int>(subblock->get_height());
-    addInfo.physicalWidth = static_cast<int>(subblock->get_width());
-    addInfo.physicalHeight = static_cast<int>(subblock->get_height());
-    addInfo.PixelType = subblock->get_pixelType();
-    addInfo.ptrSbBlkMetadata = sbmetadata.c_str();
-    addInfo.sbBlkMetadataSize = static_cast<uint32_t>(sbmetadata.size());
-
-    addInfo.SetCompressionMode(compressionOptions.first);
-
-    std::shared_ptr<IMemoryBlock> memblk;
-    if (compressionOptions.first == CompressionMode::Zstd1) {
-      memblk = ZstdCompress::CompressZStd1Alloc(
-          addInfo.physicalWidth, addInfo.physicalHeight,
-          static_cast<uint32_t>(subblock->get_stride()), addInfo.PixelType,
-          subblock->get_data(), compressionOptions.second.get());
-    } else {
-      memblk = ZstdCompress::CompressZStd0Alloc(
-          addInfo.physicalWidth, addInfo.physicalHeight,
-          static_cast<uint32_t>(subblock->get_stride()), addInfo.PixelType,
-          subblock->get_data(), compressionOptions.second.get());
-    }
+    addInfo.mIndex = tile.m;
+    addInfo.x = tile.x;
+    addInfo.y = tile.y;
+    addInfo.logicalWidth = static_cast<int>(size.w);
+    addInfo.logicalHeight = static_cast<int>(size.h);
+    addInfo.physicalWidth = static_cast<int>(size.w);
+    addInfo.physicalHeight = static_cast<int>(size.h);
+    addInfo.PixelType = tile.bitmap->GetPixelType();
+    addInfo.ptrSbBlkMetadata = tile.subBlockMetadata.c_str();
+    addInfo.sbBlkMetadataSize =
+        static_cast<uint32_t>(tile.subBlockMetadata.size());
+    addInfo.SetCompressionMode(tile.compressionOptions.first);
+    addInfo.ptrData = tile.compressedData->GetPtr();
+    addInfo.dataSize =
+        static_cast<uint32_t>(tile.compressedData->GetSizeOfData());
 
-    addInfo.ptrData = memblk->GetPtr();
-    addInfo.dataSize = static_cast<uint32_t>(memblk->GetSizeOfData());
-
-    writer->SyncAddSubBlock(addInfo);
-  } else {
-    throw invalid_argument("An unsupported compression mode was specified.");
+    std::lock_guard<std::mutex> lock(this->writerMutex_);
+    this->spWriter_->SyncAddSubBlock(addInfo);
   }
 }
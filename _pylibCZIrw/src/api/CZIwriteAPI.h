@@ -1,56 +1,15 @@
 #pragma once
 
+#include "DisplaySettings.h"
 #include "PImage.h"
+#include "WritePipeline.h"
 #include "inc_libCzi.h"
+#include <cstdint>
 #include <iostream>
+#include <memory>
+#include <mutex>
 #include <optional>
-
-/// This enum specifies the "tinting-mode" - how the channel is false-colored.
-/// \remark
-/// Plan is to add a property "GetTintingMode", currently we only implement
-/// "Color" and "None", so this information is conveniently contained in the
-/// method "TryGetTintingColorRgb8".
-enum class TintingModeEnum : std::uint8_t {
-  None = 0, ///< None - which gives the "original color", ie. in case of RGB the
-            ///< RGB-value is directly used, in case of grayscale we get a gray
-            ///< pixel.
-  Color = 1, ///< The pixel value is multiplied with the tinting-color.
-  LookUpTableExplicit = 2, ///< (NOT YET IMPLEMENTED) There is an explicit
-                           ///< look-up-table specified.
-  LookUpTableWellKnown =
-      3 ///< (NOT YET IMPLEMENTED) We are using a "well-known" look-up-table,
-        ///< and it is identified by its name (which is a string).
-};
-
-/// This POD ("plain-old-data") structure is intended to capture all information
-/// found inside an IChannelDisplaySetting-object. It allows for easy
-/// modification of the information.
-struct ChannelDisplaySettingsStruct {
-  /// A boolean indicating whether the corresponding channel is 'active' in the
-  /// multi-channel-composition.
-  bool isEnabled;
-
-  /// The tinting mode.
-  TintingModeEnum tintingMode;
-
-  /// The tinting color (only valid if tinting mode == Color).
-  libCZI::Rgb8Color tintingColor;
-
-  /// The (normalized) black point value.
-  float blackPoint;
-
-  /// The (normalized) white point value.
-  float whitePoint;
-
-  /// Sets the structure to a defined standard value - not enabled, no tinting,
-  /// linear gradation-curve and black-point to zero and white-point to one.
-  LIBCZI_API void Clear() {
-    this->isEnabled = false;
-    this->tintingMode = TintingModeEnum::None;
-    this->blackPoint = 0;
-    this->whitePoint = 1;
-  }
-};
+#include <vector>
 
 /// Class used to represent a CZI writer object in pylibCZIrw.
 /// It gathers the libCZI features for writing needed in the pylibCZI project.
@@ -61,6 +20,13 @@ private:
   std::shared_ptr<libCZI::ICziWriter>
       spWriter_; ///< The pointer to the spWriter.
   libCZI::Utils::CompressionOption defaultCompressionOptions_;
+  std::mutex writerMutex_; ///< Serializes the calls to the spWriter, the
+                           ///< compression runs outside of it.
+  std::unique_ptr<CWritePipeline>
+      writePipeline_; ///< The pipeline compressing the submitted tiles, only
+                      ///< created with compression threads.
+  bool copySubmittedTiles_ =
+      false; ///< Whether SubmitTile copies the bitmap, with maxQueuedBytes.
 
 public:
   /// Constructor which constructs a CZIwriteAPI object from the given wstring.
@@ -81,8 +47,28 @@ public:
   CZIwriteAPI(const std::wstring &fileName,
               const std::string &compressionOptions);
 
-  /// Close the Opened czi writer.
-  void close() { this->spWriter_->Close(); }
+  /// Constructor creating a CZI-writer object for the specified filename,
+  /// with a pipeline compressing the tiles passed to SubmitTile on the given
+  /// number of threads. The tiles are added to the document in the order in
+  /// which they were submitted, so the document is the same as when adding
+  /// them with AddTileEx one after the other.
+  ///
+  /// \param  fileName            Filename of the file.
+  /// \param  compressionOptions  The compression-options in string
+  /// representation.
+  /// \param  compressionThreads  The number of compression threads, 0 for no
+  /// pipeline.
+  /// \param  maxQueuedBytes      The maximal size of the pixels of the
+  /// submitted tiles not added yet, SubmitTile blocks until there is room. 0
+  /// for no limit. With a limit, SubmitTile copies the bitmap (so that the
+  /// caller may reuse its memory right away).
+  CZIwriteAPI(const std::wstring &fileName,
+              const std::string &compressionOptions, int compressionThreads,
+              std::uint64_t maxQueuedBytes = 0);
+
+  /// Close the Opened czi writer. The submitted tiles are written before, the
+  /// error of a submitted tile which was not waited for is thrown afterwards.
+  void close();
 
   /// Writes metadata to the created czi document.
   ///
@@ -109,7 +95,8 @@ public:
       const std::map<int, const ChannelDisplaySettingsStruct> &displaySettings);
 
   /// Add the specified bitmap plane to the czi document at the specified
-  /// coordinates.
+  /// coordinates. This method can be called concurrently from multiple
+  /// threads, the compression of the tiles then runs in parallel.
   ///
   /// \param  coordinateString    The coordinate in string representation.
   /// \param  plane               The bitmap to add.
@@ -139,12 +126,35 @@ public:
                  int x, int y, int m, const std::string &compressionOptions,
                  const std::string &retiling_id);
 
+  /// Submits the specified bitmap plane to the compression pipeline, to be
+  /// added to the czi document at the specified coordinates. The arguments are
+  /// the same as for AddTileEx. The bitmap is only copied with maxQueuedBytes,
+  /// otherwise its memory must not change until WaitForTiles returned for the
+  /// tile.
+  ///
+  /// \returns    The ticket of the tile, to wait for it with WaitForTiles.
+  std::uint64_t SubmitTile(const std::string &coordinateString,
+                           const PImage *plane, int x, int y, int m,
+                           const std::string &compressionOptions,
+                           const std::string &retiling_id);
+
+  /// Waits until the submitted tiles with the specified tickets are added to
+  /// the czi document, and throws the error of the first of them which failed.
+  ///
+  /// \param  tickets    The tickets returned by SubmitTile.
+  void WaitForTiles(const std::vector<std::uint64_t> &tickets);
+
 private:
   static std::string CreateSubBlockMetadataXml(const std::string &retiling_id);
 
-  static void
-  AddSubBlock(const libCZI::CDimCoordinate &coord, const PImage *subblock,
-              const libCZI::Utils::CompressionOption &compressionOptions,
-              libCZI::ICziWriter *writer, int x, int y, int m,
-              const std::string &sbmetadata);
+  TileToWrite CreateTile(const std::string &coordinateString,
+                         const PImage *plane, int x, int y, int m,
+                         const std::string &compressionOptions,
+                         const std::string &retiling_id) const;
+
+  /// Compresses the tile with its compression options (if it is compressed).
+  static void CompressTile(TileToWrite &tile);
+
+  /// Adds the (compressed) tile to the czi document.
+  void WriteTile(const TileToWrite &tile);
 };
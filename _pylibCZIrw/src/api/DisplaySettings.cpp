@@ -0,0 +1,47 @@
+#include "DisplaySettings.h"
+
+libCZI::ChannelDisplaySettingsPOD
+ChannelDisplaySettingsStruct::ToChannelDisplaySettingsPOD() const {
+  libCZI::ChannelDisplaySettingsPOD channelDisplaySetting;
+  channelDisplaySetting.Clear();
+  channelDisplaySetting.isEnabled = this->isEnabled;
+  channelDisplaySetting.tintingColor = this->tintingColor;
+  channelDisplaySetting.blackPoint = this->blackPoint;
+  channelDisplaySetting.whitePoint = this->whitePoint;
+  switch (this->tintingMode) {
+  case TintingModeEnum::Color:
+    channelDisplaySetting.tintingMode =
+        libCZI::IDisplaySettings::TintingMode::Color;
+    break;
+  case TintingModeEnum::LookUpTableExplicit:
+    channelDisplaySetting.tintingMode =
+        libCZI::IDisplaySettings::TintingMode::LookUpTableExplicit;
+    break;
+  case TintingModeEnum::LookUpTableWellKnown:
+    channelDisplaySetting.tintingMode =
+        libCZI::IDisplaySettings::TintingMode::LookUpTableWellKnown;
+    break;
+  default:
+    channelDisplaySetting.tintingMode =
+        libCZI::IDisplaySettings::TintingMode::None;
+    break;
+  }
+
+  return channelDisplaySetting;
+}
+
+/*static*/ ChannelDisplaySettingsStruct
+ChannelDisplaySettingsStruct::FromChannelDisplaySetting(
+    const libCZI::IChannelDisplaySetting *setting) {
+  ChannelDisplaySettingsStruct channelDisplaySetting;
+  channelDisplaySetting.Clear();
+  channelDisplaySetting.tintingColor = libCZI::Rgb8Color{0, 0, 0};
+  channelDisplaySetting.isEnabled = setting->GetIsEnabled();
+  if (setting->TryGetTintingColorRgb8(&channelDisplaySetting.tintingColor)) {
+    channelDisplaySetting.tintingMode = TintingModeEnum::Color;
+  }
+
+  setting->GetBlackWhitePoint(&channelDisplaySetting.blackPoint,
+                              &channelDisplaySetting.whitePoint);
+  return channelDisplaySetting;
+}
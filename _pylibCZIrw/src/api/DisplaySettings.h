@@ -0,0 +1,60 @@
+#pragma once
+#include "inc_libCzi.h"
+#include <cstdint>
+
+/// This enum specifies the "tinting-mode" - how the channel is false-colored.
+/// \remark
+/// Plan is to add a property "GetTintingMode", currently we only implement
+/// "Color" and "None", so this information is conveniently contained in the
+/// method "TryGetTintingColorRgb8".
+enum class TintingModeEnum : std::uint8_t {
+  None = 0, ///< None - which gives the "original color", ie. in case of RGB the
+            ///< RGB-value is directly used, in case of grayscale we get a gray
+            ///< pixel.
+  Color = 1, ///< The pixel value is multiplied with the tinting-color.
+  LookUpTableExplicit = 2, ///< (NOT YET IMPLEMENTED) There is an explicit
+                           ///< look-up-table specified.
+  LookUpTableWellKnown =
+      3 ///< (NOT YET IMPLEMENTED) We are using a "well-known" look-up-table,
+        ///< and it is identified by its name (which is a string).
+};
+
+/// This POD ("plain-old-data") structure is intended to capture all information
+/// found inside an IChannelDisplaySetting-object. It allows for easy
+/// modification of the information.
+struct ChannelDisplaySettingsStruct {
+  /// A boolean indicating whether the corresponding channel is 'active' in the
+  /// multi-channel-composition.
+  bool isEnabled;
+
+  /// The tinting mode.
+  TintingModeEnum tintingMode;
+
+  /// The tinting color (only valid if tinting mode == Color).
+  libCZI::Rgb8Color tintingColor;
+
+  /// The (normalized) black point value.
+  float blackPoint;
+
+  /// The (normalized) white point value.
+  float whitePoint;
+
+  /// Sets the structure to a defined standard value - not enabled, no tinting,
+  /// linear gradation-curve and black-point to zero and white-point to one.
+  LIBCZI_API void Clear() {
+    this->isEnabled = false;
+    this->tintingMode = TintingModeEnum::None;
+    this->blackPoint = 0;
+    this->whitePoint = 1;
+  }
+
+  /// Converts the structure into the corresponding libCZI structure (with a
+  /// linear gradation curve and a weight of one).
+  libCZI::ChannelDisplaySettingsPOD ToChannelDisplaySettingsPOD() const;
+
+  /// Creates the structure from the given channel display setting. Only the
+  /// tinting modes "Color" and "None" can be determined, and the gradation
+  /// curve is not captured.
+  static ChannelDisplaySettingsStruct
+  FromChannelDisplaySetting(const libCZI::IChannelDisplaySetting *setting);
+};
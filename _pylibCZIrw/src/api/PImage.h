@@ -31,6 +31,11 @@ public:
   /// For now should always be 3
   std::uint8_t get_ndim() const { return 3; }
 
+  /// Returns the bitmap data
+  std::shared_ptr<libCZI::IBitmapData> get_bitmap() const {
+    return this->ptrBitmapData;
+  }
+
   /// Returns ptrData
   void *get_data() const { return this->ptrData; }
 
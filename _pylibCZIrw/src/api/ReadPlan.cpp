@@ -0,0 +1,31 @@
+#include "ReadPlan.h"
+
+#include <stdexcept>
+
+std::unique_ptr<PImage> CReadPlan::Read(const libCZI::IntRect &roi) {
+  std::shared_ptr<libCZI::IBitmapData> Data = this->spAccessor->Get(
+      this->pixelType, roi, &this->planeCoordinate, this->zoom, &this->options);
+
+  this->PruneSubBlockCache();
+
+  return std::make_unique<PImage>(Data);
+}
+
+void CReadPlan::ReadInto(libCZI::IBitmapData *destination,
+                         const libCZI::IntRect &roi) {
+  if (destination->GetPixelType() != this->pixelType) {
+    throw std::invalid_argument(
+        "The pixel type of the destination does not match the read plan.");
+  }
+
+  this->spAccessor->Get(destination, roi, &this->planeCoordinate, this->zoom,
+                        &this->options);
+
+  this->PruneSubBlockCache();
+}
+
+void CReadPlan::PruneSubBlockCache() {
+  if (this->spSubBlockCache) {
+    this->spSubBlockCache->Prune(this->pruneOptions);
+  }
+}
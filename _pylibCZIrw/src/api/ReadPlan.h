@@ -0,0 +1,54 @@
+#pragma once
+
+#include "PImage.h"
+#include "SubBlockCache.h"
+#include "inc_libCzi.h"
+#include <memory>
+
+/// A read which is prepared once for a fixed pixel type, plane coordinate,
+/// scene filter, background color and zoom, so that repeated reads which only
+/// differ in their ROI do not need to parse and validate these parameters
+/// again. The plan keeps the accessor (and the subblock cache) of the reader it
+/// was created from alive.
+class CReadPlan {
+private:
+  std::shared_ptr<libCZI::ISingleChannelScalingTileAccessor>
+      spAccessor; ///< The accessor composing the bitmaps.
+  std::shared_ptr<libCZI::ISubBlockCache>
+      spSubBlockCache; ///< The subblock cache (may be null).
+  libCZI::ISubBlockCache::PruneOptions
+      pruneOptions;            ///< The options for pruning the subblock cache.
+  libCZI::PixelType pixelType; ///< The pixel type of the composition.
+  libCZI::CDimCoordinate planeCoordinate; ///< The parsed plane coordinate.
+  libCZI::ISingleChannelScalingTileAccessor::Options
+      options; ///< The accessor options (including the scene filter).
+  float zoom;  ///< The zoom factor.
+
+public:
+  CReadPlan(std::shared_ptr<libCZI::ISingleChannelScalingTileAccessor> accessor,
+            std::shared_ptr<libCZI::ISubBlockCache> subBlockCache,
+            const libCZI::ISubBlockCache::PruneOptions &pruneOptions,
+            libCZI::PixelType pixelType,
+            const libCZI::CDimCoordinate &planeCoordinate,
+            const libCZI::ISingleChannelScalingTileAccessor::Options &options,
+            float zoom)
+      : spAccessor(std::move(accessor)),
+        spSubBlockCache(std::move(subBlockCache)), pruneOptions(pruneOptions),
+        pixelType(pixelType), planeCoordinate(planeCoordinate),
+        options(options), zoom(zoom) {}
+
+  /// Returns the pixel type of the composition.
+  libCZI::PixelType GetPixelType() const { return this->pixelType; }
+
+  /// Returns the bitmap (as a PImage object) composed for the given ROI.
+  std::unique_ptr<PImage> Read(const libCZI::IntRect &roi);
+
+  /// Composes the bitmap for the given ROI into the given destination bitmap,
+  /// whose pixel type must be the pixel type of the plan and whose size must
+  /// exactly match the size of the composition.
+  void ReadInto(libCZI::IBitmapData *destination, const libCZI::IntRect &roi);
+
+private:
+  /// Prunes the subblock cache (if any) according to the configured options.
+  void PruneSubBlockCache();
+};
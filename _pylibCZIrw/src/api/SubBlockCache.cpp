@@ -0,0 +1,121 @@
+#include "SubBlockCache.h"
+
+namespace {
+/// The subblock which was last missed by the current thread, and when. It
+/// identifies the time of reading and decoding the subblock when it is added
+/// to the cache afterwards.
+struct LastMiss {
+  const void *cache = nullptr;
+  int subBlockIndex = -1;
+  std::chrono::steady_clock::time_point time;
+};
+
+thread_local LastMiss lastMiss;
+
+/// A bitmap in the cache, together with the time it took to read and decode
+/// it. It forwards all operations to the bitmap, which is what Get returns.
+class CTimedBitmap : public libCZI::IBitmapData {
+public:
+  CTimedBitmap(std::shared_ptr<libCZI::IBitmapData> bitmap,
+               std::uint64_t decodeTimeNs)
+      : bitmap(std::move(bitmap)), decodeTimeNs(decodeTimeNs) {}
+
+  const std::shared_ptr<libCZI::IBitmapData> bitmap;
+  const std::uint64_t decodeTimeNs;
+
+  libCZI::PixelType GetPixelType() const override {
+    return this->bitmap->GetPixelType();
+  }
+
+  libCZI::IntSize GetSize() const override { return this->bitmap->GetSize(); }
+
+  libCZI::BitmapLockInfo Lock() override { return this->bitmap->Lock(); }
+
+  void Unlock() override { this->bitmap->Unlock(); }
+};
+} // namespace
+
+CSubBlockCacheWithStatistics::CSubBlockCacheWithStatistics()
+    : cache(libCZI::CreateSubBlockCache()) {}
+
+void CSubBlockCacheWithStatistics::GetCounters(SubBlockCacheInfo &info) const {
+  info.hits = this->hits.load();
+  info.misses = this->misses.load();
+  info.evictions = this->evictions.load();
+  info.bytesFromCache = this->bytesFromCache.load();
+  info.decodeTimeSaved =
+      static_cast<double>(this->decodeTimeSavedNs.load()) * 1e-9;
+}
+
+void CSubBlockCacheWithStatistics::ResetCounters() {
+  this->hits = 0;
+  this->misses = 0;
+  this->evictions = 0;
+  this->bytesFromCache = 0;
+  this->decodeTimeSavedNs = 0;
+}
+
+libCZI::ISubBlockCacheStatistics::Statistics
+CSubBlockCacheWithStatistics::GetStatistics(std::uint8_t mask) const {
+  return this->cache->GetStatistics(mask);
+}
+
+void CSubBlockCacheWithStatistics::Prune(const PruneOptions &options) {
+  // elements added concurrently (by other readers sharing the cache) may be
+  // miscounted as not evicted, the count is meant as an estimate
+  const auto elementsCountBefore =
+      this->cache->GetStatistics(kElementsCount).elementsCount;
+  this->cache->Prune(options);
+  const auto elementsCountAfter =
+      this->cache->GetStatistics(kElementsCount).elementsCount;
+  if (elementsCountAfter < elementsCountBefore) {
+    this->evictions += elementsCountBefore - elementsCountAfter;
+  }
+}
+
+std::shared_ptr<libCZI::IBitmapData>
+CSubBlockCacheWithStatistics::Get(int subblock_index) {
+  auto bitmap = this->cache->Get(subblock_index);
+  if (const auto timedBitmap =
+          std::dynamic_pointer_cast<CTimedBitmap>(bitmap)) {
+    this->decodeTimeSavedNs += timedBitmap->decodeTimeNs;
+    bitmap = timedBitmap->bitmap;
+  }
+
+  if (!bitmap) {
+    ++this->misses;
+    lastMiss = LastMiss{this, subblock_index, std::chrono::steady_clock::now()};
+    return bitmap;
+  }
+
+  ++this->hits;
+  const auto size = bitmap->GetSize();
+  this->bytesFromCache +=
+      static_cast<std::uint64_t>(size.w) * size.h *
+      libCZI::Utils::GetBytesPerPixel(bitmap->GetPixelType());
+  return bitmap;
+}
+
+void CSubBlockCacheWithStatistics::Add(
+    int subblock_index, std::shared_ptr<libCZI::IBitmapData> pBitmap) {
+  if (lastMiss.cache == this && lastMiss.subBlockIndex == subblock_index) {
+    const auto decodeTime =
+        std::chrono::duration_cast<std::chrono::nanoseconds>(
+            std::chrono::steady_clock::now() - lastMiss.time);
+    lastMiss = LastMiss();
+    pBitmap = std::make_shared<CTimedBitmap>(
+        std::move(pBitmap), static_cast<std::uint64_t>(decodeTime.count()));
+  }
+
+  this->cache->Add(subblock_index, std::move(pBitmap));
+}
+
+void CCountingStream::Read(std::uint64_t offset, void *pv, std::uint64_t size,
+                           std::uint64_t *ptrBytesRead) {
+  std::uint64_t bytesRead = 0;
+  this->stream->Read(offset, pv, size, &bytesRead);
+  this->bytesRead += bytesRead;
+  if (ptrBytesRead != nullptr) {
+    *ptrBytesRead = bytesRead;
+  }
+}
@@ -1,5 +1,7 @@
 #pragma once
 #include "inc_libCzi.h"
+#include <atomic>
+#include <chrono>
 
 /// Enum to represent all available types of subblock caches
 enum class CacheType : std::uint8_t {
@@ -26,9 +28,73 @@ struct SubBlockCacheOptions {
 };
 
 /// This POD ("plain-old-data") structure represents information on a subblock
-/// cache.
+/// cache. The counters are accumulated since the cache was created or the
+/// statistics were last reset.
 struct SubBlockCacheInfo {
   std::uint32_t elementsCount =
       0; ///< Number of elements (subblocks) in the cache
   std::uint64_t memoryUsage = 0; ///< Memory usage of the cache in bytes
+  std::uint64_t hits = 0;        ///< Number of subblocks found in the cache
+  std::uint64_t misses = 0;      ///< Number of subblocks not found in the cache
+  std::uint64_t evictions =
+      0; ///< Number of elements removed from the cache by pruning
+  std::uint64_t bytesFromCache =
+      0; ///< Bytes of the (decoded) bitmaps served from the cache
+  std::uint64_t bytesReadFromStream =
+      0;                      ///< Bytes read from the stream of the document
+  double decodeTimeSaved = 0; ///< Estimated time in seconds saved by the hits,
+                              ///< i.e. the sum of the time it took to read and
+                              ///< decode the subblocks found in the cache
+};
+
+/// A subblock cache which forwards all operations to a standard libCZI cache
+/// and counts its hits, misses and evictions. The time between a miss and
+/// the subsequent addition of the same subblock (by the same thread) is taken
+/// as the time it takes to read and decode the subblock, which is saved by
+/// each later hit. It is stored alongside the bitmap in the cache, so that it
+/// is pruned with the bitmap.
+class CSubBlockCacheWithStatistics : public libCZI::ISubBlockCache {
+private:
+  std::shared_ptr<libCZI::ISubBlockCache> cache;
+  std::atomic<std::uint64_t> hits{0};
+  std::atomic<std::uint64_t> misses{0};
+  std::atomic<std::uint64_t> evictions{0};
+  std::atomic<std::uint64_t> bytesFromCache{0};
+  std::atomic<std::uint64_t> decodeTimeSavedNs{0};
+
+public:
+  CSubBlockCacheWithStatistics();
+
+  /// Fills the counters into the given info struct.
+  void GetCounters(SubBlockCacheInfo &info) const;
+
+  /// Resets all counters to zero (the content of the cache is kept).
+  void ResetCounters();
+
+  Statistics GetStatistics(std::uint8_t mask) const override;
+  void Prune(const PruneOptions &options) override;
+  std::shared_ptr<libCZI::IBitmapData> Get(int subblock_index) override;
+  void Add(int subblock_index,
+           std::shared_ptr<libCZI::IBitmapData> pBitmap) override;
+};
+
+/// A stream which forwards all reads to the given stream and counts the bytes
+/// read.
+class CCountingStream : public libCZI::IStream {
+private:
+  std::shared_ptr<libCZI::IStream> stream;
+  std::atomic<std::uint64_t> bytesRead{0};
+
+public:
+  explicit CCountingStream(std::shared_ptr<libCZI::IStream> stream)
+      : stream(std::move(stream)) {}
+
+  /// Returns the number of bytes read since the creation or the last reset.
+  std::uint64_t GetBytesRead() const { return this->bytesRead.load(); }
+
+  /// Resets the number of bytes read to zero.
+  void ResetBytesRead() { this->bytesRead = 0; }
+
+  void Read(std::uint64_t offset, void *pv, std::uint64_t size,
+            std::uint64_t *ptrBytesRead) override;
 };
@@ -0,0 +1,70 @@
+#include "SubBlockIndex.h"
+
+#include <cmath>
+
+/*static*/ SubBlockIndexEntry SubBlockIndexEntry::FromSubBlockInfo(
+    int index, const libCZI::DirectorySubBlockInfo &info) {
+  SubBlockIndexEntry entry;
+  entry.filePosition = info.filePosition;
+  entry.index = index;
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::Z, &entry.z);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::C, &entry.c);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::T, &entry.t);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::R, &entry.r);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::S, &entry.s);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::I, &entry.i);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::H, &entry.h);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::V, &entry.v);
+  info.coordinate.TryGetPosition(libCZI::DimensionIndex::B, &entry.b);
+  entry.x = info.logicalRect.x;
+  entry.y = info.logicalRect.y;
+  entry.width = info.logicalRect.w;
+  entry.height = info.logicalRect.h;
+  entry.physicalWidth = static_cast<std::int32_t>(info.physicalSize.w);
+  entry.physicalHeight = static_cast<std::int32_t>(info.physicalSize.h);
+  entry.mIndex = info.mIndex;
+  entry.pixelType = static_cast<std::uint8_t>(info.pixelType);
+  entry.compression = static_cast<std::uint8_t>(info.GetCompressionMode());
+  if (!TryGetPyramidLayer(info.logicalRect, info.physicalSize,
+                          entry.minificationFactor, entry.pyramidLayer)) {
+    entry.minificationFactor = kInvalidPyramidLayer;
+    entry.pyramidLayer = kInvalidPyramidLayer;
+  }
+
+  return entry;
+}
+
+/*static*/ bool SubBlockIndexEntry::TryGetPyramidLayer(
+    const libCZI::IntRect &logicalRect, const libCZI::IntSize &physicalSize,
+    std::uint8_t &minificationFactor, std::uint8_t &pyramidLayer) {
+  if (logicalRect.w == static_cast<int>(physicalSize.w) &&
+      logicalRect.h == static_cast<int>(physicalSize.h)) {
+    minificationFactor = 0;
+    pyramidLayer = 0;
+    return true;
+  }
+
+  if (physicalSize.w == 0 || physicalSize.h == 0) {
+    return false;
+  }
+
+  // the larger side is used, in order to reduce the rounding error of the
+  // (integer) sizes
+  const double minification =
+      physicalSize.w > physicalSize.h
+          ? static_cast<double>(logicalRect.w) / physicalSize.w
+          : static_cast<double>(logicalRect.h) / physicalSize.h;
+  for (const int factor : {2, 3}) {
+    const auto layer = static_cast<int>(
+        std::lround(std::log(minification) / std::log(factor)));
+    if (layer >= 1 && layer < kInvalidPyramidLayer &&
+        std::abs(minification - std::pow(factor, layer)) <=
+            0.05 * std::pow(factor, layer)) {
+      minificationFactor = static_cast<std::uint8_t>(factor);
+      pyramidLayer = static_cast<std::uint8_t>(layer);
+      return true;
+    }
+  }
+
+  return false;
+}
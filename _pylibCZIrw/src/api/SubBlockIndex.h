@@ -0,0 +1,69 @@
+#pragma once
+#include "inc_libCzi.h"
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+
+/// This POD ("plain-old-data") structure represents the information on one
+/// subblock of the subblock directory. The members are ordered such that the
+/// structure has no padding.
+struct SubBlockIndexEntry {
+  /// The value of a plane dimension the subblock has no coordinate in.
+  static constexpr std::int32_t kNoCoordinate =
+      std::numeric_limits<std::int32_t>::min();
+
+  /// The value of the pyramid layer (and minification factor) if it could not
+  /// be determined.
+  static constexpr std::uint8_t kInvalidPyramidLayer = 0xff;
+
+  std::uint64_t filePosition = 0; ///< File position of the subblock
+  std::int32_t index = 0; ///< Index of the subblock in the subblock directory
+  std::int32_t z = kNoCoordinate;  ///< Z coordinate
+  std::int32_t c = kNoCoordinate;  ///< C coordinate
+  std::int32_t t = kNoCoordinate;  ///< T coordinate
+  std::int32_t r = kNoCoordinate;  ///< R coordinate
+  std::int32_t s = kNoCoordinate;  ///< S coordinate (the scene index)
+  std::int32_t i = kNoCoordinate;  ///< I coordinate
+  std::int32_t h = kNoCoordinate;  ///< H coordinate
+  std::int32_t v = kNoCoordinate;  ///< V coordinate
+  std::int32_t b = kNoCoordinate;  ///< B coordinate
+  std::int32_t x = 0;              ///< X position of the logical rectangle
+  std::int32_t y = 0;              ///< Y position of the logical rectangle
+  std::int32_t width = 0;          ///< Width of the logical rectangle
+  std::int32_t height = 0;         ///< Height of the logical rectangle
+  std::int32_t physicalWidth = 0;  ///< Width of the stored bitmap
+  std::int32_t physicalHeight = 0; ///< Height of the stored bitmap
+  std::int32_t mIndex = 0;      ///< M-index (INT32_MIN or INT32_MAX if invalid)
+  std::uint8_t pixelType = 0;   ///< The libCZI::PixelType of the subblock
+  std::uint8_t compression = 0; ///< The libCZI::CompressionMode of the subblock
+  std::uint8_t minificationFactor =
+      0; ///< Factor between adjacent pyramid layers (0 for layer 0)
+  std::uint8_t pyramidLayer = 0; ///< The pyramid layer number
+
+  /// Creates the entry for the given subblock of the subblock directory.
+  static SubBlockIndexEntry
+  FromSubBlockInfo(int index, const libCZI::DirectorySubBlockInfo &info);
+
+  /// Determines the pyramid layer of a subblock from its logical and physical
+  /// size. The minification factor of adjacent layers is either 2 or 3, which
+  /// are the factors used in CZI. Returns false if the layer could not be
+  /// determined.
+  static bool TryGetPyramidLayer(const libCZI::IntRect &logicalRect,
+                                 const libCZI::IntSize &physicalSize,
+                                 std::uint8_t &minificationFactor,
+                                 std::uint8_t &pyramidLayer);
+};
+
+/// This POD ("plain-old-data") structure represents the statistics of one
+/// pyramid layer of one scene.
+struct PyramidLayerStatistics {
+  std::int32_t scene =
+      SubBlockIndexEntry::kNoCoordinate; ///< The scene index (kNoCoordinate
+                                         ///< for subblocks without scene)
+  std::uint8_t minificationFactor =
+      0; ///< Factor between adjacent pyramid layers (0 for layer 0)
+  std::uint8_t pyramidLayer = 0;  ///< The pyramid layer number
+  std::int32_t subBlockCount = 0; ///< The number of subblocks in the layer
+  std::uint64_t bitmapBytes = 0;  ///< The size of the decoded bitmaps (in
+                                  ///< bytes) of the subblocks in the layer
+};
@@ -0,0 +1,217 @@
+#include "SubBlockSpatialIndex.h"
+#include "SubBlockIndex.h"
+
+#include <algorithm>
+#include <iterator>
+#include <map>
+
+using namespace libCZI;
+
+void CSubBlockSpatialIndex::EnumSubset(
+    libCZI::ICZIReader *reader, const libCZI::IDimCoordinate *planeCoordinate,
+    const libCZI::IntRect *roi, bool onlyLayer0,
+    const std::function<
+        bool(int index, const libCZI::DirectorySubBlockInfo &info)> &funcEnum) {
+  std::call_once(this->buildFlag, [&] { this->Build(reader); });
+
+  std::vector<std::uint32_t> result;
+  for (const auto &bucket : this->buckets) {
+    if (onlyLayer0 && !bucket.isLayer0) {
+      continue;
+    }
+
+    // a bucket matches if its coordinate has the same value in all dimensions
+    // given by the plane coordinate (c.f. CziUtils::CompareCoordinate)
+    if (planeCoordinate != nullptr) {
+      bool matches = true;
+      for (const auto dim :
+           {DimensionIndex::Z, DimensionIndex::C, DimensionIndex::T,
+            DimensionIndex::R, DimensionIndex::S, DimensionIndex::I,
+            DimensionIndex::H, DimensionIndex::V, DimensionIndex::B}) {
+        int position, bucketPosition;
+        if (planeCoordinate->TryGetPosition(dim, &position) &&
+            (!bucket.coordinate.TryGetPosition(dim, &bucketPosition) ||
+             position != bucketPosition)) {
+          matches = false;
+          break;
+        }
+      }
+
+      if (!matches) {
+        continue;
+      }
+    }
+
+    if (roi == nullptr) {
+      result.insert(result.end(), bucket.subBlocks.cbegin(),
+                    bucket.subBlocks.cend());
+    } else {
+      this->Query(bucket, *roi, result);
+    }
+  }
+
+  // the subblocks are enumerated in the order of the subblock directory (as
+  // by ICZIReader::EnumSubset), since the order determines the composition of
+  // subblocks with the same M-index
+  std::sort(result.begin(), result.end());
+  for (const auto position : result) {
+    const auto &subBlock = this->subBlocks[position];
+    if (!funcEnum(subBlock.first, subBlock.second)) {
+      break;
+    }
+  }
+}
+
+bool CSubBlockSpatialIndex::TryGetSubBlockInfoOfArbitrarySubBlockInChannel(
+    libCZI::ICZIReader *reader, int channelIndex, libCZI::SubBlockInfo &info) {
+  std::call_once(this->buildFlag, [&] { this->Build(reader); });
+
+  // without a C dimension, the first subblock is taken for any channel (as
+  // by ICZIReader::TryGetSubBlockInfoOfArbitrarySubBlockInChannel)
+  const auto noChannels = this->firstSubBlockInChannel.empty();
+  if (noChannels && !this->subBlocks.empty()) {
+    info = this->subBlocks.front().second;
+    return true;
+  }
+
+  const auto subBlock = this->firstSubBlockInChannel.find(channelIndex);
+  if (subBlock == this->firstSubBlockInChannel.cend()) {
+    return false;
+  }
+
+  info = this->subBlocks[subBlock->second].second;
+  return true;
+}
+
+void CSubBlockSpatialIndex::Build(libCZI::ICZIReader *reader) {
+  reader->EnumerateSubBlocksEx(
+      [&](int index, const DirectorySubBlockInfo &info) -> bool {
+        int c;
+        if (info.coordinate.TryGetPosition(DimensionIndex::C, &c)) {
+          this->firstSubBlockInChannel.emplace(
+              c, static_cast<std::uint32_t>(this->subBlocks.size()));
+        }
+
+        this->subBlocks.emplace_back(index, info);
+        return true;
+      });
+
+  // group the subblocks by their plane coordinate and pyramid layer
+  std::map<std::pair<std::array<std::int32_t, 9>, std::uint8_t>, size_t>
+      bucketIndices;
+  for (size_t position = 0; position < this->subBlocks.size(); ++position) {
+    const auto &info = this->subBlocks[position].second;
+    const auto entry = SubBlockIndexEntry::FromSubBlockInfo(0, info);
+    const auto key = std::make_pair(
+        std::array<std::int32_t, 9>{entry.z, entry.c, entry.t, entry.r, entry.s,
+                                    entry.i, entry.h, entry.v, entry.b},
+        entry.pyramidLayer);
+    const auto inserted = bucketIndices.emplace(key, this->buckets.size());
+    if (inserted.second) {
+      Bucket bucket;
+      bucket.coordinate = CDimCoordinate(&info.coordinate);
+      bucket.isLayer0 = entry.pyramidLayer == 0;
+      this->buckets.push_back(std::move(bucket));
+    }
+
+    this->buckets[inserted.first->second].subBlocks.push_back(
+        static_cast<std::uint32_t>(position));
+  }
+
+  // the grid cells of each bucket are of the average size of its subblocks
+  for (auto &bucket : this->buckets) {
+    std::int64_t totalWidth = 0, totalHeight = 0;
+    for (const auto position : bucket.subBlocks) {
+      const auto &rect = this->subBlocks[position].second.logicalRect;
+      totalWidth += std::max(rect.w, 0);
+      totalHeight += std::max(rect.h, 0);
+    }
+
+    const auto count = static_cast<std::int64_t>(bucket.subBlocks.size());
+    bucket.cellWidth = static_cast<std::int32_t>(
+        std::max<std::int64_t>(totalWidth / count, 1));
+    bucket.cellHeight = static_cast<std::int32_t>(
+        std::max<std::int64_t>(totalHeight / count, 1));
+
+    for (const auto position : bucket.subBlocks) {
+      const auto &rect = this->subBlocks[position].second.logicalRect;
+      if (rect.w <= 0 || rect.h <= 0) {
+        // an empty subblock does not intersect any ROI
+        continue;
+      }
+
+      const auto left = FloorDiv(rect.x, bucket.cellWidth);
+      const auto right = FloorDiv(
+          static_cast<std::int64_t>(rect.x) + rect.w - 1, bucket.cellWidth);
+      const auto top = FloorDiv(rect.y, bucket.cellHeight);
+      const auto bottom = FloorDiv(
+          static_cast<std::int64_t>(rect.y) + rect.h - 1, bucket.cellHeight);
+      if ((right - left + 1) * (bottom - top + 1) > kMaxCellsPerSubBlock) {
+        bucket.largeSubBlocks.push_back(position);
+        continue;
+      }
+
+      for (auto y = top; y <= bottom; ++y) {
+        for (auto x = left; x <= right; ++x) {
+          bucket.cells[CellKey(x, y)].push_back(position);
+        }
+      }
+    }
+  }
+}
+
+void CSubBlockSpatialIndex::Query(const Bucket &bucket,
+                                  const libCZI::IntRect &roi,
+                                  std::vector<std::uint32_t> &result) const {
+  if (roi.w <= 0 || roi.h <= 0) {
+    return;
+  }
+
+  const auto intersects = [&](std::uint32_t position) {
+    const auto &rect = this->subBlocks[position].second.logicalRect;
+    return static_cast<std::int64_t>(rect.x) + rect.w > roi.x &&
+           static_cast<std::int64_t>(roi.x) + roi.w > rect.x &&
+           static_cast<std::int64_t>(rect.y) + rect.h > roi.y &&
+           static_cast<std::int64_t>(roi.y) + roi.h > rect.y && rect.w > 0 &&
+           rect.h > 0;
+  };
+
+  const auto left = FloorDiv(roi.x, bucket.cellWidth);
+  const auto right =
+      FloorDiv(static_cast<std::int64_t>(roi.x) + roi.w - 1, bucket.cellWidth);
+  const auto top = FloorDiv(roi.y, bucket.cellHeight);
+  const auto bottom =
+      FloorDiv(static_cast<std::int64_t>(roi.y) + roi.h - 1, bucket.cellHeight);
+  if ((right - left + 1) * (bottom - top + 1) >
+      static_cast<std::int64_t>(bucket.subBlocks.size())) {
+    // the ROI spans more cells than there are subblocks - scanning the
+    // subblocks is cheaper than visiting the cells then
+    std::copy_if(bucket.subBlocks.cbegin(), bucket.subBlocks.cend(),
+                 std::back_inserter(result), intersects);
+    return;
+  }
+
+  // a subblock is registered in all cells it spans, so it must only be
+  // reported for the first cell (in the order of the loops below) it spans
+  // within the ROI
+  for (auto y = top; y <= bottom; ++y) {
+    for (auto x = left; x <= right; ++x) {
+      const auto cell = bucket.cells.find(CellKey(x, y));
+      if (cell == bucket.cells.cend()) {
+        continue;
+      }
+
+      for (const auto position : cell->second) {
+        const auto &rect = this->subBlocks[position].second.logicalRect;
+        const auto firstX = std::max(left, FloorDiv(rect.x, bucket.cellWidth));
+        const auto firstY = std::max(top, FloorDiv(rect.y, bucket.cellHeight));
+        if (x == firstX && y == firstY && intersects(position)) {
+          result.push_back(position);
+        }
+      }
+    }
+  }
+
+  std::copy_if(bucket.largeSubBlocks.cbegin(), bucket.largeSubBlocks.cend(),
+               std::back_inserter(result), intersects);
+}
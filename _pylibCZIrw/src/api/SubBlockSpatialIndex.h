@@ -0,0 +1,157 @@
+#pragma once
+
+#include "inc_libCzi.h"
+#include <array>
+#include <cstdint>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+/// Spatial index over the subblocks of a document, which allows to find the
+/// subblocks of a plane intersecting a ROI without scanning the whole subblock
+/// directory. The subblocks are grouped into buckets of subblocks with the
+/// same plane coordinate and pyramid layer, and the subblocks of each bucket
+/// are registered in a uniform grid whose cells are about the size of the
+/// subblocks. The index is built lazily (by one pass over the subblock
+/// directory) on its first use, and it is immutable afterwards, so that it can
+/// be used concurrently (and shared between readers of the same document).
+class CSubBlockSpatialIndex {
+public:
+  /// <summary>
+  /// Enumerates the subblocks matching the given plane coordinate and
+  /// intersecting the given ROI, in the order of the subblock directory. This
+  /// is a drop-in replacement for ISubBlockRepository::EnumSubset.
+  /// </summary>
+  /// <param name="reader">The reader the index is built from (if it is not
+  /// built yet)</param>
+  /// <param name="planeCoordinate">The plane coordinate (may be null, in which
+  /// case all planes match)</param>
+  /// <param name="roi">The ROI (may be null, in which case all subblocks
+  /// match)</param>
+  /// <param name="onlyLayer0">Whether to only enumerate subblocks of pyramid
+  /// layer 0</param>
+  /// <param name="funcEnum">The function called for each subblock, the
+  /// enumeration stops if it returns false</param>
+  void EnumSubset(
+      libCZI::ICZIReader *reader, const libCZI::IDimCoordinate *planeCoordinate,
+      const libCZI::IntRect *roi, bool onlyLayer0,
+      const std::function<bool(
+          int index, const libCZI::DirectorySubBlockInfo &info)> &funcEnum);
+
+  /// <summary>
+  /// Gets the information on the first subblock (in the order of the subblock
+  /// directory) of the given channel, or on the first subblock if the document
+  /// has no C dimension. This is a drop-in replacement for
+  /// ISubBlockRepository::TryGetSubBlockInfoOfArbitrarySubBlockInChannel.
+  /// </summary>
+  /// <param name="reader">The reader the index is built from (if it is not
+  /// built yet)</param>
+  /// <param name="channelIndex">The channel index</param>
+  /// <param name="info">The information on the subblock</param>
+  /// <returns>Whether there is a subblock of the channel</returns>
+  bool TryGetSubBlockInfoOfArbitrarySubBlockInChannel(
+      libCZI::ICZIReader *reader, int channelIndex, libCZI::SubBlockInfo &info);
+
+private:
+  /// The maximal number of grid cells a subblock is registered in. Subblocks
+  /// spanning more cells are checked by every query of their bucket instead.
+  static constexpr std::int64_t kMaxCellsPerSubBlock = 16;
+
+  /// The subblocks with the same plane coordinate and pyramid layer.
+  struct Bucket {
+    libCZI::CDimCoordinate coordinate; ///< The plane coordinate
+    bool isLayer0;                     ///< Whether this is pyramid layer 0
+    std::int32_t cellWidth;            ///< The width of the grid cells
+    std::int32_t cellHeight;           ///< The height of the grid cells
+    std::vector<std::uint32_t>
+        subBlocks; ///< All subblocks of the bucket (positions in subBlocks)
+    std::vector<std::uint32_t>
+        largeSubBlocks; ///< The subblocks not registered in the grid
+    std::unordered_map<std::uint64_t, std::vector<std::uint32_t>>
+        cells; ///< The subblocks registered in each grid cell
+  };
+
+  /// Builds the index from the subblock directory of the given reader.
+  void Build(libCZI::ICZIReader *reader);
+
+  /// Appends the subblocks of the bucket intersecting the ROI to result.
+  void Query(const Bucket &bucket, const libCZI::IntRect &roi,
+             std::vector<std::uint32_t> &result) const;
+
+  /// Returns the key of the grid cell with the given (cell) coordinates.
+  static std::uint64_t CellKey(std::int64_t x, std::int64_t y) {
+    return (static_cast<std::uint64_t>(static_cast<std::uint32_t>(x)) << 32) |
+           static_cast<std::uint32_t>(y);
+  }
+
+  /// Returns the largest integer not greater than a/b (for b > 0).
+  static std::int64_t FloorDiv(std::int64_t a, std::int64_t b) {
+    return a >= 0 ? a / b : -((-a + b - 1) / b);
+  }
+
+  std::once_flag buildFlag; ///< Guards the lazy building of the index
+  std::vector<std::pair<int, libCZI::DirectorySubBlockInfo>>
+      subBlocks;               ///< All subblocks, in the order of the directory
+  std::vector<Bucket> buckets; ///< The buckets
+  std::unordered_map<int, std::uint32_t>
+      firstSubBlockInChannel; ///< The first subblock of each channel
+};
+
+/// Subblock repository answering EnumSubset with a spatial index, and
+/// delegating everything else to the reader. Accessors created for this
+/// repository use the spatial index to find the subblocks to compose.
+class CIndexedSubBlockRepository : public libCZI::ISubBlockRepository {
+private:
+  std::shared_ptr<libCZI::ICZIReader> spReader; ///< The reader
+  std::shared_ptr<CSubBlockSpatialIndex>
+      spSpatialIndex; ///< The spatial index over the reader's subblocks
+
+public:
+  CIndexedSubBlockRepository(
+      std::shared_ptr<libCZI::ICZIReader> reader,
+      std::shared_ptr<CSubBlockSpatialIndex> spatialIndex)
+      : spReader(std::move(reader)), spSpatialIndex(std::move(spatialIndex)) {}
+
+  void EnumerateSubBlocks(
+      const std::function<bool(int index, const libCZI::SubBlockInfo &info)>
+          &funcEnum) override {
+    this->spReader->EnumerateSubBlocks(funcEnum);
+  }
+
+  void EnumSubset(
+      const libCZI::IDimCoordinate *planeCoordinate, const libCZI::IntRect *roi,
+      bool onlyLayer0,
+      const std::function<bool(int index, const libCZI::SubBlockInfo &info)>
+          &funcEnum) override {
+    this->spSpatialIndex->EnumSubset(
+        this->spReader.get(), planeCoordinate, roi, onlyLayer0,
+        [&](int index, const libCZI::DirectorySubBlockInfo &info) {
+          return funcEnum(index, info);
+        });
+  }
+
+  std::shared_ptr<libCZI::ISubBlock> ReadSubBlock(int index) override {
+    return this->spReader->ReadSubBlock(index);
+  }
+
+  bool TryGetSubBlockInfoOfArbitrarySubBlockInChannel(
+      int channelIndex, libCZI::SubBlockInfo &info) override {
+    return this->spSpatialIndex->TryGetSubBlockInfoOfArbitrarySubBlockInChannel(
+        this->spReader.get(), channelIndex, info);
+  }
+
+  bool TryGetSubBlockInfo(int index,
+                          libCZI::SubBlockInfo *info) const override {
+    return this->spReader->TryGetSubBlockInfo(index, info);
+  }
+
+  libCZI::SubBlockStatistics GetStatistics() override {
+    return this->spReader->GetStatistics();
+  }
+
+  libCZI::PyramidStatistics GetPyramidStatistics() override {
+    return this->spReader->GetPyramidStatistics();
+  }
+};
@@ -0,0 +1,108 @@
+#include "WorkerPool.h"
+
+#include <algorithm>
+
+#ifndef _WIN32
+#include <pthread.h>
+#endif
+
+CWorkerPool *CWorkerPool::instance = nullptr;
+
+/*static*/ CWorkerPool &CWorkerPool::GetInstance() {
+  static std::once_flag created;
+  std::call_once(created, [] {
+    instance = new CWorkerPool();
+#ifndef _WIN32
+    // the pool of the parent process (without its threads, and maybe with its
+    // mutex locked) is abandoned in the child
+    pthread_atfork(nullptr, nullptr, [] { instance = new CWorkerPool(); });
+#endif
+  });
+
+  return *instance;
+}
+
+void CWorkerPool::Run(size_t count, int numThreads,
+                      const std::function<void(size_t)> &func) {
+  const size_t threadCount =
+      std::min(count, static_cast<size_t>(std::max(numThreads, 1)));
+  if (threadCount <= 1) {
+    for (size_t index = 0; index < count; ++index) {
+      func(index);
+    }
+
+    return;
+  }
+
+  const auto job = std::make_shared<Job>();
+  job->count = count;
+  job->func = &func;
+  {
+    std::lock_guard<std::mutex> lock(this->mutex);
+    while (this->threads.size() < threadCount - 1) {
+      this->threads.emplace_back([this] { this->WorkerLoop(); });
+    }
+
+    for (size_t i = 1; i < threadCount; ++i) {
+      this->jobs.push_back(job);
+    }
+  }
+
+  this->jobsChanged.notify_all();
+  Work(*job);
+
+  // Threads of the pool taking the job later find no index left, and do not
+  // call func anymore.
+  std::unique_lock<std::mutex> lock(job->mutex);
+  job->finishedChanged.wait(lock, [&] { return job->finished == count; });
+  if (job->exception) {
+    std::rethrow_exception(job->exception);
+  }
+}
+
+/*static*/ void CWorkerPool::Work(Job &job) {
+  for (;;) {
+    const size_t index = job.nextIndex.fetch_add(1);
+    if (index >= job.count) {
+      return;
+    }
+
+    std::exception_ptr exception;
+    if (!job.failed) {
+      try {
+        (*job.func)(index);
+      } catch (...) {
+        exception = std::current_exception();
+        job.failed = true;
+      }
+    }
+
+    bool finished;
+    {
+      std::lock_guard<std::mutex> lock(job.mutex);
+      if (exception && !job.exception) {
+        job.exception = exception;
+      }
+
+      finished = ++job.finished == job.count;
+    }
+
+    if (finished) {
+      job.finishedChanged.notify_all();
+    }
+  }
+}
+
+void CWorkerPool::WorkerLoop() {
+  for (;;) {
+    std::shared_ptr<Job> job;
+    {
+      std::unique_lock<std::mutex> lock(this->mutex);
+      this->jobsChanged.wait(lock, [this] { return !this->jobs.empty(); });
+      job = std::move(this->jobs.front());
+      this->jobs.pop_front();
+    }
+
+    Work(*job);
+  }
+}
@@ -0,0 +1,61 @@
+#pragma once
+
+#include <atomic>
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+/// A pool of long-lived worker threads, shared by all readers of the module.
+/// The threads are started lazily, when a call first needs them, and are kept
+/// for later calls, so that parallel reads do not create threads each time.
+class CWorkerPool {
+public:
+  /// Returns the pool of the module. The pool is never destroyed, its threads
+  /// end with the process. A child process created by fork (which does not
+  /// inherit the threads) gets a new pool.
+  static CWorkerPool &GetInstance();
+
+  /// Calls func for all indices from 0 to count-1, spread over up to numThreads
+  /// threads: the calling thread and up to numThreads-1 threads of the pool.
+  /// Returns when func returned for all indices. The first exception thrown
+  /// by func stops the processing of further indices and is rethrown.
+  /// As the calling thread processes indices as well, all indices are
+  /// processed even if all threads of the pool are busy (e.g. with calls of
+  /// other threads).
+  /// <param name="count">The number of indices.</param>
+  /// <param name="numThreads">The maximal number of threads.</param>
+  /// <param name="func">The function called for each index.</param>
+  void Run(size_t count, int numThreads,
+           const std::function<void(size_t)> &func);
+
+private:
+  struct Job {
+    size_t count = 0;
+    const std::function<void(size_t)> *func = nullptr;
+    std::atomic<size_t> nextIndex{0};
+    std::atomic<bool> failed{false};
+    std::mutex mutex;
+    std::condition_variable finishedChanged;
+    size_t finished = 0; ///< The number of indices processed (or skipped).
+    std::exception_ptr exception;
+  };
+
+  CWorkerPool() = default;
+
+  static CWorkerPool *instance;
+
+  /// Processes indices of the job until all of them are handed out.
+  static void Work(Job &job);
+  void WorkerLoop();
+
+  std::mutex mutex;
+  std::condition_variable jobsChanged;
+  std::deque<std::shared_ptr<Job>> jobs; ///< One entry per requested thread.
+  std::vector<std::thread> threads;
+};
@@ -0,0 +1,172 @@
+#include "WritePipeline.h"
+
+CWritePipeline::CWritePipeline(int compressionThreads,
+                               CompressFunction compress, WriteFunction write,
+                               std::uint64_t maxQueuedBytes)
+    : compress(std::move(compress)), write(std::move(write)),
+      maxQueuedBytes(maxQueuedBytes) {
+  for (int i = 0; i < compressionThreads; ++i) {
+    this->compressionThreads.emplace_back([this] { this->CompressLoop(); });
+  }
+
+  this->writerThread = std::thread([this] { this->WriteLoop(); });
+}
+
+CWritePipeline::~CWritePipeline() { this->Shutdown(); }
+
+std::uint64_t CWritePipeline::Submit(TileToWrite tile) {
+  const auto size = tile.bitmap->GetSize();
+  auto entry = std::make_shared<Entry>();
+  entry->bytes = static_cast<std::uint64_t>(size.w) * size.h *
+                 libCZI::Utils::GetBytesPerPixel(tile.bitmap->GetPixelType());
+  entry->tile = std::move(tile);
+  {
+    std::unique_lock<std::mutex> lock(this->mutex);
+    this->writtenChanged.wait(lock, [&] {
+      return this->stopping || this->maxQueuedBytes == 0 ||
+             this->queuedBytes == 0 ||
+             this->queuedBytes + entry->bytes <= this->maxQueuedBytes;
+    });
+    if (this->stopping) {
+      throw std::runtime_error("The writer is closed.");
+    }
+
+    entry->ticket = this->nextTicket++;
+    this->queuedBytes += entry->bytes;
+    this->toCompress.push_back(entry);
+  }
+
+  this->toCompressChanged.notify_one();
+  return entry->ticket;
+}
+
+void CWritePipeline::WaitForTiles(const std::vector<std::uint64_t> &tickets) {
+  if (tickets.empty()) {
+    return;
+  }
+
+  const auto lastTicket = *std::max_element(tickets.cbegin(), tickets.cend());
+  std::unique_lock<std::mutex> lock(this->mutex);
+  this->writtenChanged.wait(lock,
+                            [&] { return this->nextToWrite > lastTicket; });
+
+  std::exception_ptr error;
+  for (const auto ticket : tickets) {
+    const auto ticketError = this->errors.find(ticket);
+    if (ticketError != this->errors.cend()) {
+      if (!error) {
+        error = ticketError->second;
+      }
+
+      this->errors.erase(ticketError);
+    }
+  }
+
+  if (error) {
+    std::rethrow_exception(error);
+  }
+}
+
+void CWritePipeline::Flush() {
+  std::unique_lock<std::mutex> lock(this->mutex);
+  const auto submitted = this->nextTicket;
+  this->writtenChanged.wait(lock,
+                            [&] { return this->nextToWrite >= submitted; });
+  if (!this->errors.empty()) {
+    const auto error = this->errors.cbegin()->second;
+    this->errors.clear();
+    std::rethrow_exception(error);
+  }
+}
+
+void CWritePipeline::Shutdown() {
+  {
+    std::lock_guard<std::mutex> lock(this->mutex);
+    if (this->stopping) {
+      return;
+    }
+
+    this->stopping = true;
+  }
+
+  this->toCompressChanged.notify_all();
+  this->compressedChanged.notify_all();
+  this->writtenChanged.notify_all();
+  for (auto &thread : this->compressionThreads) {
+    thread.join();
+  }
+
+  this->writerThread.join();
+}
+
+void CWritePipeline::CompressLoop() {
+  for (;;) {
+    std::shared_ptr<Entry> entry;
+    {
+      std::unique_lock<std::mutex> lock(this->mutex);
+      this->toCompressChanged.wait(
+          lock, [this] { return this->stopping || !this->toCompress.empty(); });
+      if (this->toCompress.empty()) {
+        return;
+      }
+
+      entry = this->toCompress.front();
+      this->toCompress.pop_front();
+    }
+
+    try {
+      this->compress(entry->tile);
+    } catch (...) {
+      entry->error = std::current_exception();
+    }
+
+    {
+      std::lock_guard<std::mutex> lock(this->mutex);
+      this->compressed.emplace(entry->ticket, entry);
+    }
+
+    this->compressedChanged.notify_one();
+  }
+}
+
+void CWritePipeline::WriteLoop() {
+  for (;;) {
+    std::shared_ptr<Entry> entry;
+    {
+      std::unique_lock<std::mutex> lock(this->mutex);
+      this->compressedChanged.wait(lock, [this] {
+        return this->compressed.count(this->nextToWrite) != 0 ||
+               (this->stopping && this->nextToWrite == this->nextTicket);
+      });
+      const auto next = this->compressed.find(this->nextToWrite);
+      if (next == this->compressed.end()) {
+        return;
+      }
+
+      entry = next->second;
+      this->compressed.erase(next);
+    }
+
+    if (!entry->error) {
+      try {
+        this->write(entry->tile);
+      } catch (...) {
+        entry->error = std::current_exception();
+      }
+    }
+
+    // the pixels and the compressed data are not needed anymore
+    entry->tile = TileToWrite();
+    {
+      std::lock_guard<std::mutex> lock(this->mutex);
+      if (entry->error) {
+        this->errors.emplace(entry->ticket, entry->error);
+      }
+
+      this->queuedBytes -= entry->bytes;
+      ++this->nextToWrite;
+    }
+
+    this->writtenChanged.notify_all();
+  }
+}
@@ -0,0 +1,106 @@
+#pragma once
+
+#include "inc_libCzi.h"
+#include <algorithm>
+#include <condition_variable>
+#include <cstdint>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+/// A tile to be added as a subblock to a CZI document.
+struct TileToWrite {
+  libCZI::CDimCoordinate coordinate;
+  std::shared_ptr<libCZI::IBitmapData> bitmap; ///< The pixels of the tile.
+  int x = 0;
+  int y = 0;
+  int m = 0;
+  libCZI::Utils::CompressionOption compressionOptions;
+  std::string subBlockMetadata;
+  std::shared_ptr<libCZI::IMemoryBlock>
+      compressedData; ///< The compressed pixels, if the tile is compressed.
+};
+
+/// A pipeline compressing tiles concurrently on a pool of threads, while a
+/// single writer thread adds them to the document in the order in which they
+/// were submitted. The resulting document is therefore the same as with
+/// compressing and writing the tiles one after the other.
+class CWritePipeline {
+public:
+  using CompressFunction = std::function<void(TileToWrite &)>;
+  using WriteFunction = std::function<void(const TileToWrite &)>;
+
+  /// Constructor, starts the threads of the pipeline.
+  /// <param name="compressionThreads">The number of threads compressing the
+  /// tiles.</param>
+  /// <param name="compress">The function compressing a tile.</param>
+  /// <param name="write">The function adding a (compressed) tile to the
+  /// document, only called by the writer thread.</param>
+  /// <param name="maxQueuedBytes">The maximal size of the pixels of the
+  /// submitted tiles not written yet, Submit blocks until there is room for
+  /// the next tile. 0 for no limit.</param>
+  CWritePipeline(int compressionThreads, CompressFunction compress,
+                 WriteFunction write, std::uint64_t maxQueuedBytes = 0);
+
+  /// Destructor, waits for the submitted tiles and stops the threads.
+  ~CWritePipeline();
+
+  /// Submits a tile to be compressed and written. Blocks while the submitted
+  /// tiles not written yet exceed the limit of queued bytes (a tile larger
+  /// than the limit is accepted when no other tile is queued).
+  /// <param name="tile">The tile.</param>
+  /// <returns>The ticket of the tile, identifying it in WaitForTiles.</returns>
+  std::uint64_t Submit(TileToWrite tile);
+
+  /// Waits until the given tiles are written and throws the error of the
+  /// first of them which failed, if any. The errors of the given tiles are
+  /// discarded afterwards.
+  /// <param name="tickets">The tickets of the tiles.</param>
+  void WaitForTiles(const std::vector<std::uint64_t> &tickets);
+
+  /// Waits until all submitted tiles are written and throws the error of the
+  /// first tile which failed and was not waited for, if any. The errors of all
+  /// tiles are discarded afterwards.
+  void Flush();
+
+  /// Waits until all submitted tiles are written and stops the threads. Errors
+  /// are not reported, no tiles can be submitted afterwards.
+  void Shutdown();
+
+private:
+  struct Entry {
+    std::uint64_t ticket;
+    std::uint64_t bytes;
+    TileToWrite tile;
+    std::exception_ptr error;
+  };
+
+  void CompressLoop();
+  void WriteLoop();
+
+  CompressFunction compress;
+  WriteFunction write;
+
+  std::mutex mutex;
+  std::condition_variable toCompressChanged;
+  std::condition_variable compressedChanged;
+  std::condition_variable writtenChanged;
+  std::deque<std::shared_ptr<Entry>> toCompress;
+  std::map<std::uint64_t, std::shared_ptr<Entry>> compressed;
+  std::map<std::uint64_t, std::exception_ptr> errors;
+  std::uint64_t nextTicket = 0;
+  std::uint64_t nextToWrite = 0; ///< All tiles before it are written.
+  std::uint64_t maxQueuedBytes;
+  std::uint64_t queuedBytes = 0;
+  bool stopping = false;
+
+  std::vector<std::thread> compressionThreads;
+  std::thread writerThread;
+};
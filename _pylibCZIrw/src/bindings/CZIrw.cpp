@@ -1,7 +1,9 @@
 #include "../api/CZIreadAPI.h"
 #include "../api/CZIwriteAPI.h"
 #include "../api/PImage.h"
+#include "../api/ReadPlan.h"
 #include "../api/SubBlockCache.h"
+#include "../api/SubBlockIndex.h"
 #include "../api/site.h"
 #include "PbHelper.h"
 
@@ -14,6 +16,9 @@
 
 namespace py = pybind11;
 
+// the subblock index is passed to Python as a buffer (instead of a list)
+PYBIND11_MAKE_OPAQUE(std::vector<SubBlockIndexEntry>)
+
 PYBIND11_MODULE(_pylibCZIrw, m) {
   py::class_<CZIreadAPI>(m, "czi_reader", py::module_local())
       .def(py::init([](const std::wstring &fileName) {
@@ -34,9 +39,65 @@ PYBIND11_MODULE(_pylibCZIrw, m) {
                               subBlockCacheOptions);
       }))
       .def("close", &CZIreadAPI::close)
+      .def("CreateSibling", &CZIreadAPI::CreateSibling)
       .def("GetXmlMetadata", &CZIreadAPI::GetXmlMetadata)
+      .def("GetAttachmentInfos", &CZIreadAPI::GetAttachmentInfos)
+      .def("ReadAttachment",
+           [](CZIreadAPI &self, int index) {
+             std::shared_ptr<libCZI::IAttachment> attachment;
+             {
+               py::gil_scoped_release release;
+               attachment = self.ReadAttachment(index);
+             }
+
+             const void *ptr;
+             size_t size;
+             attachment->DangerousGetRawData(ptr, size);
+             return py::bytes(static_cast<const char *>(ptr), size);
+           })
+      .def("OpenAttachedDocument",
+           [](CZIreadAPI &self, int index) {
+             py::gil_scoped_release release;
+             return self.OpenAttachedDocument(index);
+           })
       .def("GetSubBlockStats", &CZIreadAPI::GetSubBlockStats)
+      .def("GetPyramidLayerStatistics",
+           [](CZIreadAPI &self) {
+             py::gil_scoped_release release;
+             return self.GetPyramidLayerStatistics();
+           })
+      .def("GetSubBlockIndex",
+           [](CZIreadAPI &self) {
+             py::gil_scoped_release release;
+             return self.GetSubBlockIndex();
+           })
+      .def("QuerySubBlocks",
+           [](CZIreadAPI &self, libCZI::IntRect roi,
+              const std::string &coordinateString,
+              const std::wstring &SceneIndexes, bool onlyLayer0) {
+             py::gil_scoped_release release;
+             return self.QuerySubBlocks(roi, coordinateString, SceneIndexes,
+                                        onlyLayer0);
+           })
+      .def("ReadSubBlock",
+           [](CZIreadAPI &self, int index) {
+             py::gil_scoped_release release;
+             return self.ReadSubBlock(index);
+           })
+      .def("ReadSubBlocks",
+           [](CZIreadAPI &self, const std::vector<int> &indices,
+              int numThreads) {
+             py::gil_scoped_release release;
+             return self.ReadSubBlocks(indices, numThreads);
+           })
+      .def("ReadSubBlockBitmaps",
+           [](CZIreadAPI &self, const std::vector<int> &indices,
+              int numThreads) {
+             py::gil_scoped_release release;
+             return self.ReadSubBlockBitmaps(indices, numThreads);
+           })
       .def("GetDimensionSize", &CZIreadAPI::GetDimensionSize)
+      .def("GetDimensionBounds", &CZIreadAPI::GetDimensionBounds)
       .def("GetChannelPixelType", &CZIreadAPI::GetChannelPixelType)
       .def("GetSingleChannelScalingTileAccessorData",
            [](CZIreadAPI &self, libCZI::PixelType pixeltype,
@@ -56,15 +117,154 @@ PYBIND11_MODULE(_pylibCZIrw, m) {
                  pixeltype, roi, bgColor, zoom, coordinateString, SceneIndexes);
              return result;
            })
-      .def("GetCacheInfo", &CZIreadAPI::GetCacheInfo);
+      .def("GetSingleChannelScalingTileAccessorDataInto",
+           [](CZIreadAPI &self, py::buffer destination,
+              libCZI::PixelType pixeltype, libCZI::IntRect roi,
+              libCZI::RgbFloatColor bgColor, float zoom,
+              const std::string &coordinateString,
+              const std::wstring &SceneIndexes, int numThreads) {
+             // the buffer is requested writable, its memory is used directly
+             // as the destination of the composition
+             const py::buffer_info info = destination.request(true);
+             const auto bitmap =
+                 PbHelper::BufferInfoToBitmapView(info, pixeltype);
+             py::gil_scoped_release release;
+             self.GetSingleChannelScalingTileAccessorDataInto(
+                 bitmap.get(), roi, bgColor, zoom, coordinateString,
+                 SceneIndexes, numThreads);
+           })
+      .def("GetSingleChannelScalingTileAccessorDataStackInto",
+           [](CZIreadAPI &self, py::buffer destination,
+              libCZI::PixelType pixeltype, libCZI::IntRect roi,
+              libCZI::RgbFloatColor bgColor, float zoom,
+              const std::vector<std::string> &coordinateStrings,
+              const std::wstring &SceneIndexes, int numThreads) {
+             // the buffer is requested writable, each of its planes is used
+             // directly as the destination of one composition
+             const py::buffer_info info = destination.request(true);
+             const auto bitmaps =
+                 PbHelper::BufferInfoToBitmapViews(info, pixeltype);
+             py::gil_scoped_release release;
+             self.GetSingleChannelScalingTileAccessorDataStackInto(
+                 bitmaps, roi, bgColor, zoom, coordinateStrings, SceneIndexes,
+                 numThreads);
+           })
+      .def("GetPyramidLayerTileAccessorDataInto",
+           [](CZIreadAPI &self, py::buffer destination,
+              libCZI::PixelType pixeltype, int x, int y,
+              libCZI::RgbFloatColor bgColor, int minificationFactor,
+              int pyramidLayer, const std::string &coordinateString,
+              const std::wstring &SceneIndexes) {
+             const py::buffer_info info = destination.request(true);
+             const auto bitmap =
+                 PbHelper::BufferInfoToBitmapView(info, pixeltype);
+             py::gil_scoped_release release;
+             self.GetPyramidLayerTileAccessorDataInto(
+                 bitmap.get(), x, y, bgColor, minificationFactor, pyramidLayer,
+                 coordinateString, SceneIndexes);
+           })
+      .def("GetDisplaySettings", &CZIreadAPI::GetDisplaySettings)
+      .def("GetMultiChannelCompositeInto",
+           [](CZIreadAPI &self, py::buffer destination, libCZI::IntRect roi,
+              float zoom, const std::string &coordinateString,
+              const std::wstring &SceneIndexes,
+              const std::optional<std::map<int, ChannelDisplaySettingsStruct>>
+                  &displaySettings,
+              int numThreads) {
+             const py::buffer_info info = destination.request(true);
+             const auto bitmap = PbHelper::BufferInfoToBitmapView(
+                 info, libCZI::PixelType::Bgr24);
+             py::gil_scoped_release release;
+             self.GetMultiChannelCompositeInto(bitmap.get(), roi, zoom,
+                                               coordinateString, SceneIndexes,
+                                               displaySettings, numThreads);
+           })
+      .def("CalcSize", &CZIreadAPI::CalcSize)
+      .def("PrepareRead", &CZIreadAPI::PrepareRead)
+      .def("GetSingleChannelScalingTileAccessorDataBatch",
+           [](CZIreadAPI &self, libCZI::PixelType pixeltype,
+              const std::vector<libCZI::IntRect> &rois,
+              libCZI::RgbFloatColor bgColor, float zoom,
+              const std::vector<std::string> &coordinateStrings,
+              const std::wstring &SceneIndexes) {
+             // The GIL is released once for the whole batch (c.f. the comment
+             // in GetSingleChannelScalingTileAccessorData above).
+             py::gil_scoped_release release;
+             auto result = self.GetSingleChannelScalingTileAccessorDataBatch(
+                 pixeltype, rois, bgColor, zoom, coordinateStrings,
+                 SceneIndexes);
+             return result;
+           })
+      .def("GetCacheInfo", &CZIreadAPI::GetCacheInfo)
+      .def("ResetCacheStatistics", &CZIreadAPI::ResetCacheStatistics);
+
+  // The ROI of a read plan is passed as separate integers, so that no IntRect
+  // needs to be created in Python for every read.
+  py::class_<CReadPlan>(m, "ReadPlan", py::module_local())
+      .def("GetPixelType", &CReadPlan::GetPixelType)
+      .def("Read",
+           [](CReadPlan &self, int x, int y, int w, int h) {
+             // c.f. the comment in GetSingleChannelScalingTileAccessorData
+             py::gil_scoped_release release;
+             return self.Read(libCZI::IntRect{x, y, w, h});
+           })
+      .def("ReadInto", [](CReadPlan &self, py::buffer destination, int x, int y,
+                          int w, int h) {
+        const py::buffer_info info = destination.request(true);
+        const auto bitmap =
+            PbHelper::BufferInfoToBitmapView(info, self.GetPixelType());
+        py::gil_scoped_release release;
+        self.ReadInto(bitmap.get(), libCZI::IntRect{x, y, w, h});
+      });
 
   py::class_<CZIwriteAPI>(m, "czi_writer", py::module_local())
       .def(py::init<const std::wstring &, const std::string &>())
+      .def(py::init<const std::wstring &, const std::string &, int>())
+      .def(py::init<const std::wstring &, const std::string &, int,
+                    std::uint64_t>())
       .def(py::init<const std::wstring &>())
-      .def("close", &CZIwriteAPI::close)
+      .def("close",
+           [](CZIwriteAPI &self) {
+             py::gil_scoped_release release;
+             self.close();
+           })
       .def("WriteMetadata", &CZIwriteAPI::WriteMetadata)
-      .def("AddTile", &CZIwriteAPI::AddTile)
-      .def("AddTileEx", &CZIwriteAPI::AddTileEx);
+      // The PImage borrows the memory of the numpy array (without copying
+      // it), which AddTile and AddTileEx compress and write without holding
+      // the GIL. So another Python thread could modify the array meanwhile,
+      // it must not be modified (or resized) until the call returned. The
+      // bitmap is not kept afterwards. SubmitTile keeps it until the tile is
+      // written, and only copies it with a limit of the queued bytes.
+      .def("AddTile",
+           [](CZIwriteAPI &self, const std::string &coordinateString,
+              const PImage *plane, int x, int y, int m,
+              const std::string &retiling_id) {
+             py::gil_scoped_release release;
+             return self.AddTile(coordinateString, plane, x, y, m, retiling_id);
+           })
+      .def("AddTileEx",
+           [](CZIwriteAPI &self, const std::string &coordinateString,
+              const PImage *plane, int x, int y, int m,
+              const std::string &compressionOptions,
+              const std::string &retiling_id) {
+             py::gil_scoped_release release;
+             return self.AddTileEx(coordinateString, plane, x, y, m,
+                                   compressionOptions, retiling_id);
+           })
+      .def("SubmitTile",
+           [](CZIwriteAPI &self, const std::string &coordinateString,
+              const PImage *plane, int x, int y, int m,
+              const std::string &compressionOptions,
+              const std::string &retiling_id) {
+             py::gil_scoped_release release;
+             return self.SubmitTile(coordinateString, plane, x, y, m,
+                                    compressionOptions, retiling_id);
+           })
+      .def("WaitForTiles",
+           [](CZIwriteAPI &self, const std::vector<std::uint64_t> &tickets) {
+             py::gil_scoped_release release;
+             self.WaitForTiles(tickets);
+           });
 
   py::class_<PImage>(m, "PImage", py::buffer_protocol(), py::module_local())
       .def(py::init([](py::buffer b, libCZI::PixelType pixel_type) {
@@ -95,6 +295,20 @@ PYBIND11_MODULE(_pylibCZIrw, m) {
              m.get_itemsize()});
       });
 
+  // The payload of a subblock is exposed as a (read-only) buffer of bytes,
+  // which refers to the memory of the subblock.
+  py::class_<libCZI::ISubBlock, std::shared_ptr<libCZI::ISubBlock>>(
+      m, "SubBlock", py::buffer_protocol(), py::module_local())
+      .def_buffer([](libCZI::ISubBlock &subBlock) {
+        const void *ptr;
+        size_t size;
+        subBlock.DangerousGetRawData(libCZI::ISubBlock::MemBlkType::Data, ptr,
+                                     size);
+        return py::buffer_info(const_cast<void *>(ptr), 1,
+                               py::format_descriptor<std::uint8_t>::format(), 1,
+                               {size}, {1}, true);
+      });
+
   py::class_<libCZI::SubBlockStatistics>(m, "SubBlockStatistics",
                                          py::module_local())
       .def(py::init<>())
@@ -120,6 +334,11 @@ PYBIND11_MODULE(_pylibCZIrw, m) {
       .def_readwrite("g", &libCZI::RgbFloatColor::g)
       .def_readwrite("r", &libCZI::RgbFloatColor::r);
 
+  py::class_<libCZI::IntSize>(m, "IntSize", py::module_local())
+      .def(py::init<>())
+      .def_readwrite("w", &libCZI::IntSize::w)
+      .def_readwrite("h", &libCZI::IntSize::h);
+
   py::class_<libCZI::IntRect>(m, "IntRect", py::module_local())
       .def(py::init<>())
       .def_readwrite("x", &libCZI::IntRect::x)
@@ -217,7 +436,91 @@ PYBIND11_MODULE(_pylibCZIrw, m) {
   py::class_<SubBlockCacheInfo>(m, "SubBlockCacheInfo", py::module_local())
       .def(py::init<>())
       .def_readwrite("elements_count", &SubBlockCacheInfo::elementsCount)
-      .def_readwrite("memory_usage", &SubBlockCacheInfo::memoryUsage);
+      .def_readwrite("memory_usage", &SubBlockCacheInfo::memoryUsage)
+      .def_readwrite("hits", &SubBlockCacheInfo::hits)
+      .def_readwrite("misses", &SubBlockCacheInfo::misses)
+      .def_readwrite("evictions", &SubBlockCacheInfo::evictions)
+      .def_readwrite("bytes_from_cache", &SubBlockCacheInfo::bytesFromCache)
+      .def_readwrite("bytes_read_from_stream",
+                     &SubBlockCacheInfo::bytesReadFromStream)
+      .def_readwrite("decode_time_saved", &SubBlockCacheInfo::decodeTimeSaved);
+
+  py::class_<PyramidLayerStatistics>(m, "PyramidLayerStatistics",
+                                     py::module_local())
+      .def(py::init<>())
+      .def_readonly("scene", &PyramidLayerStatistics::scene)
+      .def_readonly("minificationFactor",
+                    &PyramidLayerStatistics::minificationFactor)
+      .def_readonly("pyramidLayer", &PyramidLayerStatistics::pyramidLayer)
+      .def_readonly("subBlockCount", &PyramidLayerStatistics::subBlockCount)
+      .def_readonly("bitmapBytes", &PyramidLayerStatistics::bitmapBytes);
+
+  // The subblock index is exposed as a buffer of bytes, which is interpreted
+  // as a structured numpy array with the following dtype. (The dtype is given
+  // as the arguments of numpy.dtype, so that it does not depend on the numpy
+  // version pybind11 is built for.)
+  py::class_<std::vector<SubBlockIndexEntry>>(
+      m, "SubBlockIndex", py::buffer_protocol(), py::module_local())
+      .def_buffer([](std::vector<SubBlockIndexEntry> &entries) {
+        return py::buffer_info(
+            entries.data(), 1, py::format_descriptor<std::uint8_t>::format(), 1,
+            {entries.size() * sizeof(SubBlockIndexEntry)}, {1}, true);
+      });
+
+  py::dict subBlockIndexDtype;
+  subBlockIndexDtype["names"] = std::vector<std::string>{"file_position",
+                                                         "index",
+                                                         "Z",
+                                                         "C",
+                                                         "T",
+                                                         "R",
+                                                         "S",
+                                                         "I",
+                                                         "H",
+                                                         "V",
+                                                         "B",
+                                                         "x",
+                                                         "y",
+                                                         "width",
+                                                         "height",
+                                                         "physical_width",
+                                                         "physical_height",
+                                                         "m_index",
+                                                         "pixel_type",
+                                                         "compression",
+                                                         "minification_factor",
+                                                         "pyramid_layer"};
+  subBlockIndexDtype["formats"] = std::vector<std::string>{
+      "u8", "i4", "i4", "i4", "i4", "i4", "i4", "i4", "i4", "i4", "i4",
+      "i4", "i4", "i4", "i4", "i4", "i4", "i4", "u1", "u1", "u1", "u1"};
+  subBlockIndexDtype["offsets"] =
+      std::vector<std::size_t>{offsetof(SubBlockIndexEntry, filePosition),
+                               offsetof(SubBlockIndexEntry, index),
+                               offsetof(SubBlockIndexEntry, z),
+                               offsetof(SubBlockIndexEntry, c),
+                               offsetof(SubBlockIndexEntry, t),
+                               offsetof(SubBlockIndexEntry, r),
+                               offsetof(SubBlockIndexEntry, s),
+                               offsetof(SubBlockIndexEntry, i),
+                               offsetof(SubBlockIndexEntry, h),
+                               offsetof(SubBlockIndexEntry, v),
+                               offsetof(SubBlockIndexEntry, b),
+                               offsetof(SubBlockIndexEntry, x),
+                               offsetof(SubBlockIndexEntry, y),
+                               offsetof(SubBlockIndexEntry, width),
+                               offsetof(SubBlockIndexEntry, height),
+                               offsetof(SubBlockIndexEntry, physicalWidth),
+                               offsetof(SubBlockIndexEntry, physicalHeight),
+                               offsetof(SubBlockIndexEntry, mIndex),
+                               offsetof(SubBlockIndexEntry, pixelType),
+                               offsetof(SubBlockIndexEntry, compression),
+                               offsetof(SubBlockIndexEntry, minificationFactor),
+                               offsetof(SubBlockIndexEntry, pyramidLayer)};
+  subBlockIndexDtype["itemsize"] = sizeof(SubBlockIndexEntry);
+  m.attr("SUBBLOCK_INDEX_DTYPE") = subBlockIndexDtype;
+  m.attr("SUBBLOCK_NO_COORDINATE") = SubBlockIndexEntry::kNoCoordinate;
+  m.attr("SUBBLOCK_INVALID_PYRAMID_LAYER") =
+      SubBlockIndexEntry::kInvalidPyramidLayer;
 
   // perform one-time-initialization of libCZI
   OneTimeSiteInitialization();
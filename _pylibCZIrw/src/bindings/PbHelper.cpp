@@ -22,21 +22,77 @@ std::string PbHelper::get_format(libCZI::PixelType pixelType) {
 std::shared_ptr<libCZI::IBitmapData>
 PbHelper::BufferToBitmap(const py::buffer &buffer,
                          libCZI::PixelType pixelType) {
-
   py::buffer_info info = buffer.request();
+  if (info.ndim != 3) {
+    throw std::runtime_error("Incompatible buffer dimension!");
+  }
+
+  if (info.itemsize * info.shape[2] !=
+      libCZI::Utils::GetBytesPerPixel(pixelType)) {
+    throw std::invalid_argument("Incorrect Channel dimension!");
+  }
+
+  // the strides of dimensions of extent 1 are irrelevant (and e.g. 0 for a
+  // dimension added with np.newaxis)
+  const auto pixelSize = info.itemsize * info.shape[2];
+  const auto rowSize = pixelSize * info.shape[1];
+  if ((info.shape[2] != 1 && info.strides[2] != info.itemsize) ||
+      (info.shape[1] != 1 && info.strides[1] != pixelSize) ||
+      (info.shape[0] != 1 && info.strides[0] < rowSize)) {
+    throw std::runtime_error("Incompatible buffer strides!");
+  }
+
+  const auto stride = static_cast<std::uint32_t>(
+      info.shape[0] != 1 ? info.strides[0] : rowSize);
+  return std::make_shared<CBufferBitmap>(std::move(info), pixelType, stride);
+}
+
+std::shared_ptr<libCZI::IBitmapData>
+PbHelper::BufferInfoToBitmapView(const py::buffer_info &info,
+                                 libCZI::PixelType pixelType) {
+  if (info.ndim != 3) {
+    throw std::runtime_error("Incompatible buffer dimension!");
+  }
+
+  if (info.strides[2] != info.itemsize ||
+      info.strides[1] != info.itemsize * info.shape[2] ||
+      info.strides[0] < info.strides[1] * info.shape[1]) {
+    throw std::runtime_error("Incompatible buffer strides!");
+  }
 
   uint32_t width = info.shape[1];
   uint32_t height = info.shape[0];
   uint32_t stride = info.strides[0];
 
-  auto bm =
-      std::make_shared<CMemBitmapWrapper>(pixelType, width, height, stride);
+  return std::make_shared<CBitmapView>(info.ptr, pixelType, width, height,
+                                       stride);
+}
 
-  libCZI::ScopedBitmapLockerSP lckBm{bm};
+std::vector<std::shared_ptr<libCZI::IBitmapData>>
+PbHelper::BufferInfoToBitmapViews(const py::buffer_info &info,
+                                  libCZI::PixelType pixelType) {
+  if (info.ndim != 4) {
+    throw std::runtime_error("Incompatible buffer dimension!");
+  }
 
-  // This is no valid long term solution, should investigate other ways to
-  // handle this without copying.
-  memcpy(lckBm.ptrDataRoi, info.ptr, (size_t)(lckBm.size));
+  if (info.strides[3] != info.itemsize ||
+      info.strides[2] != info.itemsize * info.shape[3] ||
+      info.strides[1] < info.strides[2] * info.shape[2] ||
+      info.strides[0] < 0) {
+    throw std::runtime_error("Incompatible buffer strides!");
+  }
+
+  uint32_t width = info.shape[2];
+  uint32_t height = info.shape[1];
+  uint32_t stride = info.strides[1];
+
+  std::vector<std::shared_ptr<libCZI::IBitmapData>> bitmaps;
+  bitmaps.reserve(info.shape[0]);
+  for (py::ssize_t plane = 0; plane < info.shape[0]; ++plane) {
+    bitmaps.push_back(std::make_shared<CBitmapView>(
+        static_cast<char *>(info.ptr) + plane * info.strides[0], pixelType,
+        width, height, stride));
+  }
 
-  return bm;
+  return bitmaps;
 }
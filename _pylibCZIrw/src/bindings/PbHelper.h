@@ -1,3 +1,4 @@
+#include "../api/BitmapView.h"
 #include "../api/CZIreadAPI.h"
 #include "include_python.h"
 #include <pybind11/chrono.h>
@@ -6,53 +7,86 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <memory>
+
 namespace py = pybind11;
 
 /// This namespace is dedicated to helper functions
 /// for pybind11 usage.
 namespace PbHelper {
 
-class CMemBitmapWrapper : public libCZI::IBitmapData {
+/// Bitmap operating directly on the memory of a Python buffer (e.g. a numpy
+/// array), without copying it. It holds the buffer (and thereby a reference to
+/// the object exporting it), so the memory stays alive as long as the bitmap.
+/// Rows may be strided, pixels within a row have to be tightly packed.
+class CBufferBitmap : public CBitmapView {
 private:
-  void *ptrData;
-  libCZI::PixelType pixeltype;
-  std::uint32_t width;
-  std::uint32_t height;
-  std::uint32_t stride;
+  std::unique_ptr<py::buffer_info> info;
 
 public:
-  CMemBitmapWrapper(libCZI::PixelType pixeltype, std::uint32_t width,
-                    std::uint32_t height, std::uint32_t stride)
-      : pixeltype(pixeltype), width(width), height(height), stride(stride) {
-    size_t s = this->stride * static_cast<size_t>(height);
-    this->ptrData = malloc(s);
-  }
+  CBufferBitmap(py::buffer_info info, libCZI::PixelType pixeltype,
+                std::uint32_t stride)
+      : CBitmapView(info.ptr, pixeltype,
+                    static_cast<std::uint32_t>(info.shape[1]),
+                    static_cast<std::uint32_t>(info.shape[0]), stride),
+        info(std::make_unique<py::buffer_info>(std::move(info))) {}
 
-  virtual ~CMemBitmapWrapper() { free(this->ptrData); }
+  /// Releases the buffer, which drops a reference to the exporting Python
+  /// object and therefore needs the GIL. The last reference to the bitmap is
+  /// usually dropped by the owning PImage (with the GIL held), but it may be
+  /// dropped on a native thread as well, which then takes the GIL. Once the
+  /// interpreter is finalizing, taking the GIL would hang (or terminate) a
+  /// native thread, so the buffer is leaked instead.
+  virtual ~CBufferBitmap() {
+    if (Py_IsInitialized() && PyGILState_Check()) {
+      this->info.reset();
+      return;
+    }
 
-  virtual libCZI::PixelType GetPixelType() const { return this->pixeltype; }
+    if (!Py_IsInitialized() || IsFinalizing()) {
+      static_cast<void>(this->info.release());
+      return;
+    }
 
-  virtual libCZI::IntSize GetSize() const {
-    return libCZI::IntSize{this->width, this->height};
+    py::gil_scoped_acquire acquire;
+    this->info.reset();
   }
 
-  virtual libCZI::BitmapLockInfo Lock() {
-    libCZI::BitmapLockInfo bitmapLockInfo;
-    bitmapLockInfo.ptrData = this->ptrData;
-    bitmapLockInfo.ptrDataRoi = this->ptrData;
-    bitmapLockInfo.stride = this->stride;
-    bitmapLockInfo.size = this->stride * static_cast<size_t>(this->height);
-    return bitmapLockInfo;
+private:
+  static bool IsFinalizing() {
+#if PY_VERSION_HEX >= 0x030D0000
+    return Py_IsFinalizing() != 0;
+#else
+    return _Py_IsFinalizing() != 0;
+#endif
   }
-
-  virtual void Unlock() {}
 };
 
 /// Returns format descriptor corresponding to each libCZI::PixelType.
 /// This is used for pybind11 buffer_protocol.
 std::string get_format(libCZI::PixelType pixelType);
 
+/// Returns a bitmap operating directly on the memory of the given buffer
+/// (without copying it), which keeps the buffer alive. The buffer must be
+/// 3-dimensional (y, x, channels) with tightly packed pixels of the given
+/// pixel type, its rows may be strided.
 std::shared_ptr<libCZI::IBitmapData>
 BufferToBitmap(const py::buffer &buffer, libCZI::PixelType pixelType);
 
+/// Returns a bitmap operating directly on the memory described by the given
+/// buffer info (without copying it). The buffer must be 3-dimensional (y, x,
+/// channels) with tightly packed pixels, its rows may be strided. The buffer
+/// info must outlive the returned bitmap.
+std::shared_ptr<libCZI::IBitmapData>
+BufferInfoToBitmapView(const py::buffer_info &info,
+                       libCZI::PixelType pixelType);
+
+/// Returns one bitmap per plane of the given 4-dimensional buffer info (plane,
+/// y, x, channels), each operating directly on the memory of its plane
+/// (without copying it). Each plane has to fulfill the requirements of
+/// BufferInfoToBitmapView. The buffer info must outlive the returned bitmaps.
+std::vector<std::shared_ptr<libCZI::IBitmapData>>
+BufferInfoToBitmapViews(const py::buffer_info &info,
+                        libCZI::PixelType pixelType);
+
 } // namespace PbHelper
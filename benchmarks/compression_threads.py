@@ -0,0 +1,68 @@
+"""Benchmark of writing large zstd compressed data with a growing number of compression threads.
+
+Writes a large image, which the writer divides into several subblocks, once with the subblocks compressed one after
+the other and once per number of compression threads, and checks that the compressed subblocks are the same.
+
+Usage: python benchmarks/compression_threads.py [--size 12000] [--level 6] [--threads 1 2 4 8]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from pylibCZIrw.czi import create_czi, open_czi
+
+
+def write(path: str, data: np.ndarray, level: int, compression_threads: Optional[int]) -> float:
+    """Writes data to path, returns the elapsed time in seconds."""
+    start = time.perf_counter()
+    with create_czi(
+        path, compression_options=f"zstd1:ExplicitLevel={level}", compression_threads=compression_threads
+    ) as czi_document:
+        czi_document.write(data)
+    return time.perf_counter() - start
+
+
+def read_payloads(path: str) -> List[bytes]:
+    """Returns the compressed payloads of all subblocks of the document at path."""
+    with open_czi(path) as czi_document:
+        indices = czi_document.subblock_index()["index"]
+        return [bytes(payload) for payload in czi_document.read_subblocks(indices, decode=False)]
+
+
+def main() -> None:
+    """Writes the image serially and with each number of compression threads, and prints the times and speedups."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=12000, help="width and height of the image")
+    parser.add_argument("--level", type=int, default=6, help="zstd compression level")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    # a smooth gradient with noise, compressing about as well as typical microscopy images
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0, 4000, args.size, dtype=np.float32)
+    data = (gradient[None, :, None] + rng.integers(0, 64, (args.size, args.size, 1))).astype(np.uint16)
+    size_mb = data.nbytes / 1e6
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        serial_path = os.path.join(temp_directory, "serial.czi")
+        serial = write(serial_path, data, args.level, None)
+        print(f"{'serial':>10}: {serial:6.2f} s ({size_mb / serial:6.1f} MB/s)")
+        expected = read_payloads(serial_path)
+
+        for threads in args.threads:
+            path = os.path.join(temp_directory, f"threads_{threads}.czi")
+            elapsed = write(path, data, args.level, threads)
+            same = read_payloads(path) == expected
+            print(
+                f"{f'threads={threads}':>10}: {elapsed:6.2f} s ({size_mb / elapsed:6.1f} MB/s, "
+                f"{serial / elapsed:.1f}x), same subblocks: {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
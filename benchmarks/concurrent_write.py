@@ -0,0 +1,86 @@
+"""Benchmark of Python work running concurrently to a large zstd compressed write.
+
+Writes a mosaic of noise tiles with zstd compression while a second Python thread counts in a loop (standing in for
+e.g. the thread draining a camera). As the compression and the writing run without holding the GIL, the counting
+thread keeps most of its throughput during the write. Writing the tiles from several threads additionally compresses
+them in parallel.
+
+Usage: python benchmarks/concurrent_write.py [--tiles 8] [--threads 1 4]
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import numpy as np
+
+from pylibCZIrw.czi import create_czi
+
+TILE_SIZE = 1024
+
+
+def count_during(work: Callable[[], None]) -> float:
+    """Runs work while counting in a Python loop on another thread, returns the counts per second."""
+    stop = threading.Event()
+    counts = [0]
+
+    def count() -> None:
+        while not stop.is_set():
+            counts[0] += 1
+
+    counter = threading.Thread(target=count)
+    start = time.perf_counter()
+    counter.start()
+    work()
+    stop.set()
+    counter.join()
+    return counts[0] / (time.perf_counter() - start)
+
+
+def write_mosaic(path: str, tiles: List[np.ndarray], tiles_per_row: int, threads: int) -> None:
+    """Writes the zstd compressed mosaic of tiles to path, with the given number of writing threads."""
+    with create_czi(path, compression_options="zstd1:ExplicitLevel=1") as czi_document:
+
+        def write_tile(index: int) -> None:
+            y, x = divmod(index, tiles_per_row)
+            czi_document.write(tiles[index], location=(x * TILE_SIZE, y * TILE_SIZE))
+
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(write_tile, range(len(tiles))))
+
+
+def main() -> None:
+    """Prints the throughput of the counting thread while idle and while writing with each number of threads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tiles", type=int, default=8, help="number of tiles per row and column of the mosaic")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    tiles: List[np.ndarray] = [
+        rng.integers(0, 4096, (TILE_SIZE, TILE_SIZE), dtype=np.uint16) for _ in range(args.tiles * args.tiles)
+    ]
+    size_mb = sum(tile.nbytes for tile in tiles) / 1e6
+
+    idle = count_during(lambda: time.sleep(1.0))
+    print(f"{'idle':>10}: {idle / 1e6:6.2f} M counts/s")
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        for threads in args.threads:
+            path = os.path.join(temp_directory, f"mosaic_{threads}.czi")
+            start = time.perf_counter()
+            counting = count_during(functools.partial(write_mosaic, path, tiles, args.tiles, threads))
+            elapsed = time.perf_counter() - start
+            print(
+                f"{f'threads={threads}':>10}: {counting / 1e6:6.2f} M counts/s ({counting / idle:.0%} of idle), "
+                f"wrote {size_mb:.0f} MB in {elapsed:.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of walking the tiles of a plane with a loop over read() compared to iter_tiles() with prefetch.
+
+Writes a zstd compressed mosaic of noise tiles and walks it in a regular grid of overlapping tiles, simulating the
+processing of each tile (e.g. a model) by sleeping. The loop over read() alternates decoding and processing, while
+iter_tiles() decodes the next tiles on worker threads during the processing of the current one.
+
+Usage: python benchmarks/iter_tiles.py [--prefetch 1 2 4] [--processing-ms 5]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from pylibCZIrw.czi import CziReader, create_czi, open_czi
+
+TILE_SIZE = 512
+TILES = 8
+OVERLAP = 32
+
+
+def write_mosaic(path: str) -> None:
+    """Writes a square mosaic of TILES x TILES zstd compressed noise tiles to path."""
+    rng = np.random.default_rng(0)
+    with create_czi(path, compression_options="zstd1:ExplicitLevel=1") as czi_document:
+        for y, x in np.ndindex(TILES, TILES):
+            tile = rng.integers(0, 4096, (TILE_SIZE, TILE_SIZE), dtype=np.uint16)
+            czi_document.write(tile, location=(x * TILE_SIZE, y * TILE_SIZE))
+
+
+def main() -> None:
+    """Writes the mosaic and prints the time of walking its tiles with read() and with iter_tiles() per prefetch."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefetch", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--processing-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    tile_size, overlap = (TILE_SIZE, TILE_SIZE), (OVERLAP, OVERLAP)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        path = os.path.join(temp_directory, "mosaic.czi")
+        write_mosaic(path)
+        with open_czi(path) as czi_document:
+            tiles = CziReader._create_tiles(czi_document.total_bounding_rectangle, tile_size, overlap)
+
+            start = time.perf_counter()
+            for tile in tiles:
+                czi_document.read(roi=tile)
+                time.sleep(args.processing_ms / 1000)
+            loop = time.perf_counter() - start
+            print(f"{'read loop':>12}: {loop:6.2f} s")
+
+            for prefetch in args.prefetch:
+                start = time.perf_counter()
+                for _ in czi_document.iter_tiles(tile_size, overlap, prefetch=prefetch):
+                    time.sleep(args.processing_ms / 1000)
+                iterated = time.perf_counter() - start
+                print(f"{f'prefetch={prefetch}':>12}: {iterated:6.2f} s ({loop / iterated:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
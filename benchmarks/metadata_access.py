@@ -0,0 +1,78 @@
+"""Benchmark of repeated metadata access.
+
+Writes a document with large metadata (many custom attributes) and measures the access to the metadata: without
+caching (reading and parsing the metadata on every access, as before the metadata was cached), the first (cached)
+access, repeated accesses, and the access to the commonly used fields only (metadata_fields).
+
+Usage: python benchmarks/metadata_access.py [--custom-attributes 50000]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+from typing import Any, Callable
+
+import numpy as np
+import xmltodict
+
+from pylibCZIrw.czi import create_czi, open_czi
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Returns the median time of func in milliseconds."""
+    return float(np.median(timeit.repeat(func, number=1, repeat=repeat))) * 1e3
+
+
+def main() -> None:
+    """Writes the document with large metadata and prints the time of each kind of metadata access."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--custom-attributes", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        path = os.path.join(temp_directory, "metadata.czi")
+        with create_czi(path) as czi_document:
+            for c in range(4):
+                czi_document.write(np.zeros((16, 16), dtype=np.uint8), plane={"C": c})
+            czi_document.write_metadata(
+                channel_names={c: f"Channel {c}" for c in range(4)},
+                scale_x=0.1,
+                scale_y=0.1,
+                custom_attributes={f"key{i}": f"value {i}" for i in range(args.custom_attributes)},
+            )
+
+        def first_access(attribute: str) -> float:
+            def access() -> None:
+                with open_czi(path) as czi_document:
+                    getattr(czi_document, attribute)
+
+            return measure(access, args.repeat)
+
+        with open_czi(path) as czi_document:
+            raw_metadata = czi_document.raw_metadata
+            print(f"metadata size: {len(raw_metadata) / 2**20:.1f} MiB")
+
+            def uncached() -> None:
+                xmltodict.parse(czi_document._czi_reader.GetXmlMetadata())
+
+            def uncached_three_times() -> None:
+                for _ in range(3):
+                    uncached()
+
+            results = {
+                "metadata, uncached": measure(uncached, args.repeat),
+                "metadata, first access": first_access("metadata"),
+                "metadata, repeated access": measure(lambda: czi_document.metadata, 100),
+                "custom_attributes_metadata, uncached": measure(uncached_three_times, args.repeat),
+                "custom_attributes_metadata, first access": first_access("custom_attributes_metadata"),
+                "metadata_fields, first access": first_access("metadata_fields"),
+                "metadata_fields, repeated access": measure(lambda: czi_document.metadata_fields, 100),
+            }
+        for name, milliseconds in results.items():
+            print(f"{name:<42} {milliseconds:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark of the per-call overhead of read() compared to the reads of a read plan.
+
+Writes a mosaic of tiles and measures the time of reading small rois at varying origins of the same plane, once with
+read() (which prepares the plane, pixel type, scene and background pixel on every call) and once with the reads of a
+plan returned by prepare() (which only pass their roi). Small rois make the per-call overhead dominate.
+
+Usage: python benchmarks/read_plan.py [--sizes 1 16 256] [--reads 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from functools import partial
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+
+from pylibCZIrw.czi import create_czi, open_czi
+
+TILE_SIZE = 256
+TILES = 8
+
+
+def write_mosaic(path: str) -> None:
+    """Writes a square mosaic of TILES x TILES tiles on two channels to path."""
+    tile = np.zeros((TILE_SIZE, TILE_SIZE), dtype=np.uint16)
+    with create_czi(path) as czi_document:
+        for c in range(2):
+            for y, x in np.ndindex(TILES, TILES):
+                czi_document.write(tile, plane={"C": c}, location=(x * TILE_SIZE, y * TILE_SIZE), scene=0)
+
+
+def read_square(read: Callable[[int, int, int, int], Any], x: int, y: int, size: int) -> Any:
+    """Reads the square roi of the given size at (x, y) with read(x, y, w, h)."""
+    return read(x, y, size, size)
+
+
+def time_per_call(func: Callable[[int, int, int], Any], origins: List[Tuple[int, int]], size: int) -> float:
+    """Returns the mean time of func(x, y, size) over all origins in microseconds."""
+    start = time.perf_counter()
+    for x, y in origins:
+        func(x, y, size)
+    return (time.perf_counter() - start) / len(origins) * 1e6
+
+
+def main() -> None:
+    """Writes the mosaic and prints the time per call of read() and of the reads of a plan for each roi size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 16, 256])
+    parser.add_argument("--reads", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'roi size':>8} {'read [us]':>10} {'plan.read [us]':>15} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as temp_directory:
+        path = os.path.join(temp_directory, "mosaic.czi")
+        write_mosaic(path)
+        with open_czi(path) as czi_document:
+            plane = {"C": 1}
+            for size in args.sizes:
+                origins = [(int(x), int(y)) for x, y in rng.integers(0, TILES * TILE_SIZE - size, (args.reads, 2))]
+                plan = czi_document.prepare(plane=plane, scene=0, pixel_type="Gray16")
+                read = time_per_call(
+                    lambda x, y, size: czi_document.read(
+                        roi=(x, y, size, size), plane=plane, scene=0, pixel_type="Gray16"
+                    ),
+                    origins,
+                    size,
+                )
+                plan_read = time_per_call(partial(read_square, plan.read), origins, size)
+                print(f"{size:>8} {read:>10.1f} {plan_read:>15.1f} {read / plan_read:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark of the lookup of the subblocks intersecting a ROI, for a growing number of subblocks.
+
+Writes mosaics of small tiles (with several channels and time points) and measures the time of query_subblocks() and
+of read() for a single-tile roi, which both look up the subblocks in the spatial index. For comparison, the time of a
+linear scan (in numpy) over the subblock directory is reported as well.
+
+Usage: python benchmarks/subblock_lookup.py [--counts 1000 10000 100000]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+from functools import partial
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from pylibCZIrw.czi import create_czi, open_czi
+
+TILE_SIZE = 16
+PLANES = {"C": 2, "T": 5}
+
+
+def write_mosaic(path: str, subblock_count: int) -> None:
+    """Writes a square mosaic of about subblock_count subblocks (over all planes) to path."""
+    side = max(int(np.sqrt(subblock_count / np.prod(list(PLANES.values())))), 1)
+    tile = np.zeros((TILE_SIZE, TILE_SIZE), dtype=np.uint8)
+    with create_czi(path) as czi_document:
+        for c, t in np.ndindex(*PLANES.values()):
+            for y, x in np.ndindex(side, side):
+                czi_document.write(tile, plane={"C": c, "T": t}, location=(x * TILE_SIZE, y * TILE_SIZE))
+
+
+def linear_scan(index: np.ndarray, roi: Tuple[int, int, int, int], plane: Dict[str, int]) -> np.ndarray:
+    """Returns the subblocks of the subblock directory index intersecting roi in plane, by a scan over all of them."""
+    mask = (
+        (index["x"] < roi[0] + roi[2])
+        & (index["x"] + index["width"] > roi[0])
+        & (index["y"] < roi[1] + roi[3])
+        & (index["y"] + index["height"] > roi[1])
+        & (index["C"] == plane["C"])
+        & (index["T"] == plane["T"])
+    )
+    return index[mask]
+
+
+def median_time(func: Callable[[], Any], repeat: int = 200) -> float:
+    """Returns the median time of func in microseconds."""
+    return float(np.median(timeit.repeat(func, number=1, repeat=repeat))) * 1e6
+
+
+def main() -> None:
+    """Writes the mosaics and prints the times of the lookups for each number of subblocks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'subblocks':>10} {'query [us]':>11} {'read [us]':>10} {'linear scan [us]':>17}")
+    with tempfile.TemporaryDirectory() as temp_directory:
+        for count in args.counts:
+            path = os.path.join(temp_directory, f"mosaic_{count}.czi")
+            write_mosaic(path, count)
+            with open_czi(path) as czi_document:
+                index = czi_document.subblock_index()
+                center = czi_document.total_bounding_rectangle.w // 2
+                roi = (center, center, TILE_SIZE, TILE_SIZE)
+                plane = {"C": 1, "T": 3}
+                # the first lookup builds the spatial index
+                czi_document.query_subblocks(roi, plane)
+                query = median_time(partial(czi_document.query_subblocks, roi, plane))
+                read = median_time(partial(czi_document.read, roi=roi, plane=plane))
+                scan = median_time(partial(linear_scan, index, roi, plane))
+                print(f"{len(index):>10} {query:>11.1f} {read:>10.1f} {scan:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of the subblock size chosen by the tile_size of the writer, for random access reads.
+
+Writes a large zstd compressed image with a single write, divided into subblocks by each tile_size (and by the
+default division without a tile_size), and measures the time of reading random regions aligned to a grid of 512 and
+1024 pixels, as requested by a tile server. CziWriter.AUTO_TILE_SIZE is chosen from this benchmark.
+
+Usage: python benchmarks/tile_size.py [--size 8192] [--tile-sizes 256 512 1024 2048] [--reads 200]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pylibCZIrw.czi import create_czi, open_czi
+
+
+def write(path: str, data: np.ndarray, tile_size: Optional[Tuple[int, int]]) -> float:
+    """Writes data to path with the given tile_size, returns the elapsed time in seconds."""
+    start = time.perf_counter()
+    with create_czi(path, compression_options="zstd1:ExplicitLevel=1", tile_size=tile_size) as czi_document:
+        czi_document.write(data)
+    return time.perf_counter() - start
+
+
+def read_regions(path: str, region_size: int, reads: int) -> float:
+    """Reads random regions of region_size aligned to a grid of region_size, returns the mean time in ms."""
+    rng = np.random.default_rng(0)
+    with open_czi(path) as czi_document:
+        bounding_rectangle = czi_document.total_bounding_rectangle
+        columns, rows = bounding_rectangle.w // region_size, bounding_rectangle.h // region_size
+        start = time.perf_counter()
+        for _ in range(reads):
+            x, y = rng.integers(0, columns) * region_size, rng.integers(0, rows) * region_size
+            czi_document.read(roi=(x, y, region_size, region_size))
+        return (time.perf_counter() - start) / reads * 1000
+
+
+def main() -> None:
+    """Writes the image with each tile_size and prints the write time, subblock count and time of the random reads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=8192, help="width and height of the image")
+    parser.add_argument("--tile-sizes", type=int, nargs="+", default=[256, 512, 1024, 2048])
+    parser.add_argument("--reads", type=int, default=200, help="number of reads per region size")
+    args = parser.parse_args()
+
+    # a smooth gradient with noise, compressing about as well as typical microscopy images
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0, 4000, args.size, dtype=np.float32)
+    data = (gradient[None, :, None] + rng.integers(0, 64, (args.size, args.size, 1))).astype(np.uint16)
+
+    tile_sizes = [None] + [(tile_size, tile_size) for tile_size in args.tile_sizes]
+    print(f"{'tile_size':>12} {'write [s]':>10} {'subblocks':>10} {'read 512 [ms]':>14} {'read 1024 [ms]':>15}")
+    with tempfile.TemporaryDirectory() as temp_directory:
+        for tile_size in tile_sizes:
+            path = os.path.join(temp_directory, f"{tile_size}.czi")
+            elapsed = write(path, data, tile_size)
+            with open_czi(path) as czi_document:
+                subblocks = len(czi_document.subblock_index())
+            read_512 = read_regions(path, 512, args.reads)
+            read_1024 = read_regions(path, 1024, args.reads)
+            name = "default" if tile_size is None else f"{tile_size[0]}x{tile_size[1]}"
+            print(f"{name:>12} {elapsed:10.2f} {subblocks:10d} {read_512:14.2f} {read_1024:15.2f}")
+
+
+if __name__ == "__main__":
+    main()
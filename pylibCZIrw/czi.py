@@ -4,17 +4,45 @@ The open method will create a czi document.
 This czi document can be use to read and write czi.
 """
 
+import asyncio
 import contextlib
+import copy
+import io
+import itertools
+import os
+import queue
+import threading
 import uuid
-from dataclasses import dataclass
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import astuple, dataclass
 from enum import Enum
 from os import makedirs
 from os.path import abspath, dirname, isfile
-from typing import Any, Callable, Dict, Generator, NamedTuple, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from xml.etree import ElementTree  # nosec B405
 
 import numpy as np
 import validators
 import xmltodict
+from numpy.lib.recfunctions import repack_fields
 
 import _pylibCZIrw
 
@@ -105,9 +133,76 @@ class ChannelDisplaySettingsDataClass:
     white_point: float
 
 
+@dataclass(frozen=True)
+class ChannelMetadata:
+    """ChannelMetadata class.
+
+    The commonly used information on a channel, as found in the metadata of a document. Fields missing in the metadata
+    are None.
+    """
+
+    index: int  # The index of the channel (its C coordinate).
+    id: Optional[str]  # The id of the channel, e.g. "Channel:0".
+    name: Optional[str]  # The name of the channel.
+    pixel_type: Optional[str]  # The pixel type of the channel, e.g. "Gray16".
+    color: Optional[str]  # The color of the channel as ARGB hex string, e.g. "#FFFF0000".
+    fluor: Optional[str]  # The name of the fluorophore.
+    excitation_wavelength: Optional[float]  # The excitation wavelength, as stored in the metadata.
+    emission_wavelength: Optional[float]  # The emission wavelength, as stored in the metadata.
+    exposure_time: Optional[float]  # The exposure time, as stored in the metadata.
+
+
+@dataclass(frozen=True)
+class AcquisitionMetadata:
+    """AcquisitionMetadata class.
+
+    The commonly used information on the acquisition of a document, as found in its metadata. Fields missing in the
+    metadata are None.
+    """
+
+    acquisition_date_and_time: Optional[str]  # The date and time of the acquisition (ISO 8601).
+    microscope: Optional[str]  # The name of the (first) microscope.
+    objective: Optional[str]  # The name of the (first) objective.
+    objective_magnification: Optional[float]  # The nominal magnification of the objective.
+    objective_na: Optional[float]  # The numerical aperture of the objective.
+    immersion: Optional[str]  # The immersion medium of the objective.
+
+
+@dataclass(frozen=True)
+class CziMetadata:
+    """CziMetadata class.
+
+    The commonly used fields of the metadata of a document, see CziReader.metadata_fields.
+    """
+
+    scaling: Dict[str, float]  # The extent of a pixel per dimension (e.g. "X", "Y", "Z"), as stored in the metadata.
+    channels: Tuple[ChannelMetadata, ...]  # The channels, in the order of the metadata.
+    acquisition: AcquisitionMetadata  # The information on the acquisition.
+
+
+@dataclass(frozen=True)
+class PyramidLayer:
+    """PyramidLayer class.
+
+    The statistics of one pyramid layer of a scene, see CziReader.pyramid_layers.
+    """
+
+    layer: int  # The pyramid layer number (0 for the layer with the full resolution).
+    minification_factor: int  # The factor between adjacent pyramid layers (0 for layer 0).
+    downscale_factor: int  # The factor by which the layer is downscaled compared to layer 0.
+    subblock_count: int  # The number of subblocks in the layer.
+    nbytes: int  # The size of the decoded bitmaps of the subblocks in the layer in bytes.
+
+
 class CziReader:
     """CziReader class.
 
+    _filepath : str
+        File path (or url) of the document.
+    _file_input_type : ReaderFileInputTypes
+        The type of file input of the document.
+    _cache_options : Optional[CacheOptions]
+        The configuration of the subblock cache.
     _czi_reader : object
         c++ bonded object, corresponding to an instance of the CZIreadAPI class.
     _stats : object
@@ -118,6 +213,20 @@ class CziReader:
         In fact S is a filter and SHOULD NOT be considered as a plane dimension.
     PIXEL_TYPES : Dict[str, int]
         Dictionary matching a pixel type with the c++ libCZI::PixelType enum value.
+    PIXEL_TYPES_NUMPY : Dict[str, Tuple[str, int]]
+        Dictionary matching a pixel type with the numpy dtype and the number of channels of its bitmap.
+    SUBBLOCK_INDEX_DTYPE : np.dtype
+        The dtype of the records of the subblock index (with all dimensions).
+    SUBBLOCK_NO_COORDINATE : int
+        Coordinate of a subblock in the subblock index in a dimension it has no coordinate in.
+    SUBBLOCK_INVALID_PYRAMID_LAYER : int
+        Pyramid layer of a subblock in the subblock index whose pyramid layer could not be determined.
+    DASK_MIN_CHUNK_SIZE : int
+        The minimal width and height of the chunks of to_dask(chunks="auto"), subblock borders closer to each other
+        are merged (e.g. the borders of subblocks jittered between planes).
+    DASK_READERS_PER_THREAD : int
+        The maximal number of documents kept open by each thread computing the chunks of dask arrays, the least
+        recently used one is closed when another one is opened.
     """
 
     BLACK_COLOR = Color(0, 0, 0)
@@ -131,6 +240,15 @@ class CziReader:
         "Bgr96Float": 8,  # BGR-color 4 byte float triples (memory order B, G, R).
     }
 
+    PIXEL_TYPES_NUMPY: Dict[str, Tuple[str, int]] = {
+        "Gray8": ("uint8", 1),
+        "Gray16": ("uint16", 1),
+        "Gray32Float": ("float32", 1),
+        "Bgr24": ("uint8", 3),
+        "Bgr48": ("uint16", 3),
+        "Bgr96Float": ("float32", 3),
+    }
+
     CZI_DIMS: Dict[str, int] = {
         "Z": 1,  # The Z-dimension.
         "C": 2,  # The C-dimension ("channel").
@@ -146,6 +264,13 @@ class CziReader:
         CacheType.Standard: _pylibCZIrw.CacheType.Standard,
     }
 
+    SUBBLOCK_INDEX_DTYPE = np.dtype(_pylibCZIrw.SUBBLOCK_INDEX_DTYPE)
+    SUBBLOCK_NO_COORDINATE: int = _pylibCZIrw.SUBBLOCK_NO_COORDINATE
+    SUBBLOCK_INVALID_PYRAMID_LAYER: int = _pylibCZIrw.SUBBLOCK_INVALID_PYRAMID_LAYER
+
+    DASK_MIN_CHUNK_SIZE: int = 32
+    DASK_READERS_PER_THREAD: int = 4
+
     def __init__(
         self,
         filepath: str,
@@ -163,6 +288,9 @@ class CziReader:
         cache_options:
             The configuration of a subblock cache to be used.
         """
+        self._filepath = filepath
+        self._file_input_type = file_input_type
+        self._cache_options = cache_options
         libczi_cache_options = self._create_default_cache_options(cache_options=cache_options)
         if file_input_type is ReaderFileInputTypes.Curl:
             if validators.url(filepath):
@@ -179,6 +307,92 @@ class CziReader:
             libczi_cache_options.cacheOnlyCompressed = True
             self._czi_reader = _pylibCZIrw.czi_reader(filepath, libczi_cache_options)
         self._stats = self._czi_reader.GetSubBlockStats()
+        self._owns_czi_reader = True
+        _live_readers.add(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns the state for pickling, which only consists of the arguments for opening the document (the native
+        reader cannot be pickled).
+
+        Returns
+        ----------
+        : Dict[str, Any]
+            The state of the reader
+        """
+        return {
+            "_filepath": self._filepath,
+            "_file_input_type": self._file_input_type,
+            "_cache_options": self._cache_options,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores the state of an unpickled reader. The document is opened lazily, on first use.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state of the reader
+        """
+        self.__dict__.update(state)
+        _live_readers.add(self)
+
+    def __getattr__(self, name: str) -> Any:
+        """Opens the document lazily, when the native reader is accessed for the first time after unpickling or after a
+        fork. The native reader is shared by all readers of the document opened lazily in the same process, so that
+        the document is opened only once per process. It is closed once all readers sharing it are closed (or by
+        close_process_readers()).
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute
+        Returns
+        ----------
+        : Any
+            The attribute
+        :raises AttributeError: if the attribute is not the native reader of a reader which can be opened lazily
+        """
+        if name != "_czi_reader" or "_filepath" not in self.__dict__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        key = _get_reader_key(self._filepath, self._file_input_type, self._cache_options)
+        with _process_readers_lock:
+            # another thread may have opened the document meanwhile
+            if "_czi_reader" not in self.__dict__:
+                if key not in _process_readers:
+                    _process_readers[key] = CziReader(
+                        self._filepath, self._file_input_type, cache_options=self._cache_options
+                    )
+                    _process_reader_users[key] = 0
+                _process_reader_users[key] += 1
+                self.__dict__["_process_reader_key"] = key
+                self._owns_czi_reader = False
+                self._czi_reader = _process_readers[key]._czi_reader
+        return self.__dict__["_czi_reader"]
+
+    @property
+    def _stats(self) -> _pylibCZIrw.SubBlockStatistics:
+        """Returns the subblock statistics of the document, which are read on first use (opening the document lazily,
+        see __getattr__).
+
+        Returns
+        ----------
+        : _pylibCZIrw.SubBlockStatistics
+            The subblock statistics
+        """
+        if "_subblock_stats" not in self.__dict__:
+            self._subblock_stats = self._czi_reader.GetSubBlockStats()
+        return self._subblock_stats
+
+    @_stats.setter
+    def _stats(self, stats: _pylibCZIrw.SubBlockStatistics) -> None:
+        """Sets the subblock statistics of the document.
+
+        Parameters
+        ----------
+        stats : _pylibCZIrw.SubBlockStatistics
+            The subblock statistics
+        """
+        self._subblock_stats = stats
 
     @classmethod
     def _create_default_cache_options(cls, cache_options: Optional[CacheOptions]) -> _pylibCZIrw.SubBlockCacheOptions:
@@ -193,8 +407,34 @@ class CziReader:
         return sub_block_cache_options
 
     def close(self) -> None:
-        """Close the document and finalize the reading"""
-        self._czi_reader.close()
+        """Close the document and finalize the reading.
+        A native reader shared with other readers of the process (see __getattr__) stays open for them, and is closed
+        along with the last of them."""
+        self.__dict__.pop("_metadata_cache", None)
+        if self.__dict__.get("_owns_czi_reader", False):
+            self._czi_reader.close()
+        process_reader_key = self.__dict__.pop("_process_reader_key", None)
+        if process_reader_key is not None:
+            _release_process_reader(process_reader_key)
+
+    def _create_sibling(self) -> "CziReader":
+        """Creates a reader for the same document, operating on the same stream and sharing the subblock cache.
+        The sibling has its own native reader, so that both can be used concurrently.
+
+        Returns
+        ----------
+        : CziReader
+            The sibling reader
+        """
+        sibling = type(self).__new__(type(self))
+        sibling._filepath = self._filepath
+        sibling._file_input_type = self._file_input_type
+        sibling._cache_options = self._cache_options
+        sibling._czi_reader = self._czi_reader.CreateSibling()
+        sibling._stats = self._stats
+        sibling._owns_czi_reader = True
+        _live_readers.add(sibling)
+        return sibling
 
     @staticmethod
     def _compute_index_ranges(
@@ -218,6 +458,52 @@ class CziReader:
             "Y": (rectangle.y, rectangle.y + rectangle.h),
         }
 
+    @property
+    def dimension_bounds(self) -> Dict[str, Tuple[int, int]]:
+        """Returns the range of each dimension (keys of CZI_DIMS and "S") present in the czi document.
+
+        Unlike total_bounding_box, the ranges start at the actual start index of the dimension, which is not
+        necessarily 0. The dimension bounds are read once and cached.
+
+        Returns
+        ----------
+        : Dict[str, Tuple[int, int]]
+            Dictionary containing the range (start, end) of each dimension present in the czi document
+            for example: {'C': (0, 3), 'S': (0, 2), 'Z': (1, 5)}
+        """
+        return dict(self._dimension_bounds)
+
+    @property
+    def _dimension_bounds(self) -> Dict[str, Tuple[int, int]]:
+        """Returns the cached ranges of the dimensions (see dimension_bounds), which must not be modified.
+
+        Returns
+        ----------
+        : Dict[str, Tuple[int, int]]
+            Dictionary containing the range (start, end) of each dimension present in the czi document
+        """
+        return self._get_cached_metadata(
+            "dimension_bounds",
+            lambda: {
+                dim: (start, start + size) for dim, (start, size) in self._czi_reader.GetDimensionBounds().items()
+            },
+        )
+
+    def _get_dimension_size(self, dim: str) -> int:
+        """Returns the size of the given dimension, 0 if it is not present in the czi document.
+
+        Parameters
+        ----------
+        dim : str
+            The dimension (a key of CZI_DIMS or "S")
+        Returns
+        ----------
+        : int
+            The size of the dimension
+        """
+        start, end = self._dimension_bounds.get(dim, (0, 0))
+        return end - start
+
     @property
     def total_bounding_box(self) -> Dict[str, Tuple[int, int]]:
         """Returns the total bounding box of the czi document.
@@ -243,8 +529,8 @@ class CziReader:
         # 1 even if not present in the CziReader document
 
         # Getting CZI_DIMS size
-        for dim, dim_index in self.CZI_DIMS.items():
-            dimension_size = self._czi_reader.GetDimensionSize(_pylibCZIrw.DimensionIndex(dim_index))
+        for dim in self.CZI_DIMS:
+            dimension_size = self._get_dimension_size(dim)
             if dimension_size > 0:
                 total_bounding_box[dim] = (0, dimension_size)
 
@@ -279,8 +565,8 @@ class CziReader:
         }
 
         # Getting CZI_DIMS size
-        for dim, dim_index in self.CZI_DIMS.items():
-            dimension_size = self._czi_reader.GetDimensionSize(_pylibCZIrw.DimensionIndex(dim_index))
+        for dim in self.CZI_DIMS:
+            dimension_size = self._get_dimension_size(dim)
             if dimension_size > 0:
                 total_bounding_box_layer0[dim] = (0, dimension_size)
         # Getting X Y
@@ -312,7 +598,7 @@ class CziReader:
         """
         scenes_bounding_rectangle = {}
 
-        n_scenes_metadata = self._czi_reader.GetDimensionSize(_pylibCZIrw.DimensionIndex.S)
+        n_scenes_metadata = self._get_dimension_size("S")
         n_scene_bounding_boxes = len(self._stats.sceneBoundingBoxes)
         if n_scenes_metadata != n_scene_bounding_boxes:
             raise ValueError(
@@ -407,27 +693,220 @@ class CziReader:
 
         return total_bounding_rectangle_layer0
 
+    @property
+    def pyramid_layers(self) -> Dict[Optional[int], Tuple[PyramidLayer, ...]]:
+        """Get the pyramid layers of each scene, i.e. the downscale factor, number of subblocks and size of the
+        decoded bitmaps of each layer. Subblocks whose pyramid layer cannot be determined are not counted. The pyramid
+        layers are determined from the subblock directory once and cached.
+
+        Returns
+        ----------
+        pyramid_layers : Dict[Optional[int], Tuple[PyramidLayer, ...]]
+            Dictionary matching the scene index (None for subblocks without scene) with its pyramid layers, ordered by
+            layer number. For example: {0: (PyramidLayer(layer=0, ...), PyramidLayer(layer=1, ...))}
+        """
+
+        def create_pyramid_layers() -> Dict[Optional[int], Tuple[PyramidLayer, ...]]:
+            pyramid_layers: Dict[Optional[int], List[PyramidLayer]] = {}
+            for statistics in self._czi_reader.GetPyramidLayerStatistics():
+                scene = None if statistics.scene == self.SUBBLOCK_NO_COORDINATE else statistics.scene
+                pyramid_layers.setdefault(scene, []).append(
+                    PyramidLayer(
+                        layer=statistics.pyramidLayer,
+                        minification_factor=statistics.minificationFactor,
+                        downscale_factor=statistics.minificationFactor**statistics.pyramidLayer,
+                        subblock_count=statistics.subBlockCount,
+                        nbytes=statistics.bitmapBytes,
+                    )
+                )
+            return {scene: tuple(layers) for scene, layers in pyramid_layers.items()}
+
+        return dict(self._get_cached_metadata("pyramid_layers", create_pyramid_layers))
+
+    def _get_minification_factor(self, pyramid_layer: int, scene: Optional[int]) -> int:
+        """Get the minification factor to read the given pyramid layer with.
+
+        Parameters
+        ----------
+        pyramid_layer : int
+            The pyramid layer number
+        scene : Optional[int]
+            Scene index, the pyramid layers of all scenes are considered if None
+        Returns
+        ----------
+        minification_factor : int
+            The factor between adjacent pyramid layers (of the scene)
+        :raises ValueError: if the pyramid layer does not exist (in the scene)
+        """
+        pyramid_layers = self.pyramid_layers
+        layers = [
+            layer
+            for layers_of_scene in (pyramid_layers.values() if scene is None else [pyramid_layers.get(scene, ())])
+            for layer in layers_of_scene
+        ]
+        if pyramid_layer not in {layer.layer for layer in layers}:
+            raise ValueError(f"The pyramid layer {pyramid_layer} does not exist in the czi document")
+        # Layer 0 is read with the minification factor of the other layers, so that they are told apart correctly
+        minification_factors = [layer.minification_factor for layer in layers if layer.layer > 0]
+        return minification_factors[0] if minification_factors else 2
+
+    def _get_cached_metadata(self, key: str, create: Callable[[], Any]) -> Any:
+        """Returns the cached metadata for key, creating it (once) if it is not cached yet. The cache is cleared when
+        the reader is closed.
+
+        Parameters
+        ----------
+        key : str
+            The key of the cached metadata
+        create : Callable[[], Any]
+            Creates the metadata, if it is not cached yet
+        Returns
+        ----------
+        : Any
+            The cached metadata
+        """
+        cache = self.__dict__.setdefault("_metadata_cache", {})
+        if key not in cache:
+            cache[key] = create()
+        return cache[key]
+
     @property
     def raw_metadata(self) -> str:
-        """Get the raw xml metadata of the czi document and returns it as a string
+        """Get the raw xml metadata of the czi document and returns it as a string.
+        The metadata segment is read once and cached.
 
         Returns
         ----------
         : str
             XMl Metadata stored as a string
         """
-        return self._czi_reader.GetXmlMetadata()
+        return self._get_cached_metadata("raw", self._czi_reader.GetXmlMetadata)
 
     @property
     def metadata(self) -> Dict[str, Any]:
-        """Get the raw metadata parsed in a dictionary
+        """Get the raw metadata parsed in a dictionary.
+        The metadata is parsed on first access and cached, each access returns a copy of it (which the caller may
+        modify). Use metadata_fields for the commonly used fields, which does not require the conversion of the whole
+        metadata to a dictionary.
+
+        Returns
+        ----------
+        :
+            All available metadata in a dict
+        """
+        return copy.deepcopy(self._metadata_dict)
+
+    @property
+    def _metadata_dict(self) -> Dict[str, Any]:
+        """Get the cached metadata dictionary, which is shared by all accesses and must not be modified.
 
         Returns
         ----------
         :
             All available metadata in a dict
         """
-        return xmltodict.parse(self.raw_metadata)
+        return self._get_cached_metadata("dict", lambda: xmltodict.parse(self.raw_metadata))
+
+    @property
+    def metadata_fields(self) -> CziMetadata:
+        """Get the commonly used fields of the metadata (scaling, channels and acquisition).
+        The fields are extracted from the xml metadata on first access and cached. This is much faster than metadata
+        for large metadata, since the metadata is not converted to a dictionary.
+
+        Returns
+        ----------
+        : CziMetadata
+            The commonly used fields of the metadata
+        """
+        return self._get_cached_metadata("fields", lambda: self._parse_metadata_fields(self.raw_metadata))
+
+    @property
+    def display_settings(self) -> Dict[int, ChannelDisplaySettingsDataClass]:
+        """Get the display settings stored in the metadata, which read_composite applies by default. Only the tinting
+        modes none and Color can be determined, the gradation curve (e.g. a gamma) is not contained.
+
+        Returns
+        ----------
+        : Dict[int, ChannelDisplaySettingsDataClass]
+            Dictionary matching the channel index with its display settings (empty if there are none)
+        """
+        display_settings = self._get_cached_metadata("display_settings", self._czi_reader.GetDisplaySettings)
+        return {
+            channel: ChannelDisplaySettingsDataClass(
+                is_enabled=setting.isEnabled,
+                tinting_mode=(
+                    TintingMode.Color if setting.tintingMode == _pylibCZIrw.TintingModeEnum.Color else TintingMode.none
+                ),
+                tinting_color=Rgb8Color(setting.tintingColor.r, setting.tintingColor.g, setting.tintingColor.b),
+                black_point=setting.blackPoint,
+                white_point=setting.whitePoint,
+            )
+            for channel, setting in display_settings.items()
+        }
+
+    @staticmethod
+    def _parse_metadata_fields(raw_metadata: str) -> CziMetadata:
+        """Extracts the commonly used fields from the xml metadata.
+
+        Parameters
+        ----------
+        raw_metadata : str
+            The xml metadata
+        Returns
+        ----------
+        : CziMetadata
+            The commonly used fields of the metadata
+        """
+        # The metadata is parsed by expat, as by xmltodict for metadata.
+        root = ElementTree.fromstring(raw_metadata)  # nosec B314
+
+        def text(element: Optional[ElementTree.Element], path: str) -> Optional[str]:
+            found = None if element is None else element.find(path)
+            return None if found is None or found.text is None else found.text.strip()
+
+        def number(element: Optional[ElementTree.Element], path: str) -> Optional[float]:
+            value = text(element, path)
+            try:
+                return None if value is None else float(value)
+            except ValueError:
+                return None
+
+        scaling: Dict[str, float] = {}
+        for distance in root.iterfind("Metadata/Scaling/Items/Distance"):
+            dim, value = distance.get("Id"), number(distance, "Value")
+            if dim and value is not None:
+                scaling[dim] = value
+
+        display_colors = {
+            channel.get("Id"): text(channel, "Color")
+            for channel in root.iterfind("Metadata/DisplaySetting/Channels/Channel")
+        }
+        channels = tuple(
+            ChannelMetadata(
+                index=index,
+                id=channel.get("Id"),
+                name=channel.get("Name"),
+                pixel_type=text(channel, "PixelType"),
+                color=text(channel, "Color") or display_colors.get(channel.get("Id")),
+                fluor=text(channel, "Fluor"),
+                excitation_wavelength=number(channel, "ExcitationWavelength"),
+                emission_wavelength=number(channel, "EmissionWavelength"),
+                exposure_time=number(channel, "ExposureTime"),
+            )
+            for index, channel in enumerate(root.iterfind("Metadata/Information/Image/Dimensions/Channels/Channel"))
+        )
+
+        microscope = root.find("Metadata/Information/Instrument/Microscopes/Microscope")
+        objective = root.find("Metadata/Information/Instrument/Objectives/Objective")
+        acquisition = AcquisitionMetadata(
+            acquisition_date_and_time=text(root, "Metadata/Information/Image/AcquisitionDateAndTime"),
+            microscope=None if microscope is None else microscope.get("Name"),
+            objective=None if objective is None else objective.get("Name"),
+            objective_magnification=number(objective, "NominalMagnification"),
+            objective_na=number(objective, "LensNA"),
+            immersion=text(objective, "Immersion"),
+        )
+        return CziMetadata(scaling=scaling, channels=channels, acquisition=acquisition)
 
     @property
     def custom_attributes_metadata(self) -> Optional[Dict[str, Any]]:
@@ -441,10 +920,9 @@ class CziReader:
         : raises ValueError: If the type of value is not supported, raises an error.
         """
         custom_attribute = None
-        if "CustomAttributes" in self.metadata["ImageDocument"]["Metadata"]["Information"]:
-            custom_attribute_metadata = self.metadata["ImageDocument"]["Metadata"]["Information"]["CustomAttributes"][
-                "KeyValue"
-            ]
+        information = self._metadata_dict["ImageDocument"]["Metadata"]["Information"]
+        if "CustomAttributes" in information:
+            custom_attribute_metadata = information["CustomAttributes"]["KeyValue"]
             custom_attribute = {}
             for key, value in custom_attribute_metadata.items():
                 if value["@Type"] == "Int32":
@@ -652,11 +1130,7 @@ class CziReader:
         : Dict [str, int]
             Example: If the czi contains T,Z,H will return {"T":0,"H":0,"Z":0}
         """
-        return {
-            dim: 0
-            for dim, dim_index in self.CZI_DIMS.items()
-            if self._czi_reader.GetDimensionSize(_pylibCZIrw.DimensionIndex(dim_index)) > 1
-        }
+        return {dim: 0 for dim in self.CZI_DIMS if self._get_dimension_size(dim) > 1}
 
     def _create_plane_coords(
         self,
@@ -685,6 +1159,74 @@ class CziReader:
 
         return default_plane
 
+    def _create_roi_plane_coords(
+        self,
+        rois: Sequence[Any],
+        planes: Optional[Union[Dict[str, int], Sequence[Optional[Dict[str, int]]]]],
+    ) -> List[Dict[str, int]]:
+        """Generates valid plane coordinates (see _create_plane_coords()) for each of the rois, from the plane
+        coordinates of all rois or one per roi.
+
+        Parameters
+        ----------
+        rois : Sequence[Any]
+            Regions of Interest
+        planes : Optional[Union[Dict[str, int], Sequence[Optional[Dict[str, int]]]]]
+            Plane coordinates of all rois, or of each roi (in the order of rois)
+        Returns
+        ----------
+        : List[Dict[str, int]]
+            Plane coordinates of each roi
+        :raises ValueError: if planes is a sequence of another length than rois
+        """
+        if planes is None or isinstance(planes, dict):
+            plane = self._create_plane_coords(planes)
+            return [plane] * len(rois)
+        if len(planes) != len(rois):
+            raise ValueError(f"There are {len(planes)} planes for {len(rois)} ROIs, one plane per ROI is needed.")
+        return [self._create_plane_coords(plane) for plane in planes]
+
+    def _create_stack_planes(
+        self,
+        dims: str,
+        plane: Optional[Dict[str, int]],
+    ) -> Tuple[List[int], List[Dict[str, int]]]:
+        """Generates the plane coordinates of all planes of a stack spanned by the plane dimensions in dims.
+        The coordinates of the dimensions not in dims are taken from plane (see _create_plane_coords).
+
+        Parameters
+        ----------
+        dims : str
+            The plane dimensions to be stacked (keys of CZI_DIMS), followed by "YX".
+        plane : Dict[str, int]
+            Plane coordinates of the dimensions which are not stacked
+        Returns
+        ----------
+        : Tuple[List[int], List[Dict[str, int]]]
+            The size of each stacked dimension (1 if it is not present in the document), and the plane coordinates of
+            all planes of the stack (in C order of the stacked dimensions), from the start to the end of each stacked
+            dimension.
+        :raises ValueError: if dims is invalid
+        """
+        stack_dims = dims[:-2]
+        if (
+            not dims.endswith("YX")
+            or len(set(stack_dims)) != len(stack_dims)
+            or any(dim not in self.CZI_DIMS for dim in stack_dims)
+        ):
+            raise ValueError(
+                f"dims must consist of distinct plane dimensions ({', '.join(self.CZI_DIMS.keys())}) followed by YX"
+            )
+        base_plane = self._create_plane_coords(plane)
+        stack_ranges = [range(*self._dimension_bounds.get(dim, (0, 1))) for dim in stack_dims]
+        stack_sizes = [len(stack_range) for stack_range in stack_ranges]
+        planes = []
+        for indexes in itertools.product(*stack_ranges):
+            stack_plane = dict(base_plane)
+            stack_plane.update((dim, index) for dim, index in zip(stack_dims, indexes) if dim in base_plane)
+            planes.append(stack_plane)
+        return stack_sizes, planes
+
     def _get_pixel_type(
         self,
         pixel_type: Optional[str],
@@ -710,14 +1252,45 @@ class CziReader:
             # document
         return pixel_type
 
+    def _get_stack_pixel_type(
+        self,
+        pixel_type: Optional[str],
+        planes: List[Dict[str, int]],
+    ) -> str:
+        """Get the pixel_type of the channels of the specified planes if needed, otherwise returns the pixel_type
+        provided by the user.
+
+        Parameters
+        ----------
+        pixel_type: str
+            Pixel type
+        planes : List[Dict[str, int]]
+            Plane coordinates of the planes read together (e.g. of a stack)
+        Returns
+        ----------
+        pixel_type: str
+            Pixel type
+        :raises ValueError: if pixel_type is not provided and the channels of the planes have different pixel types
+        """
+        if not pixel_type:
+            channels = {stack_plane.get("C", 0) for stack_plane in planes}
+            pixel_types = {self._get_pixel_type(None, {"C": channel}) for channel in channels}
+            if len(pixel_types) > 1:
+                raise ValueError(
+                    f"The channels of the planes have different pixel types ({', '.join(sorted(pixel_types))}), "
+                    "a pixel_type must be specified"
+                )
+            pixel_type = pixel_types.pop()
+        return pixel_type
+
     @classmethod
     def _get_array_from_bitmap(
         cls,
         pixel_data: _pylibCZIrw.PImage,
     ) -> np.ndarray:
-        """Converts the bitmap stored in pixel_data to a np.array and creates a color channel.
-        In the buffer pointed by pixel_data, the values are not regrouped in a specific color channel, that's why we
-        need to perform a reshape: (m,n,1) if grayscale / (m,n,3) if rgb
+        """Converts the bitmap stored in pixel_data to a np.array without copying it.
+        The shape (m,n,1) if grayscale / (m,n,3) if rgb and the strides are taken from the buffer exposed by
+        pixel_data, and the returned array keeps pixel_data alive through its base.
 
         Parameters
         ----------
@@ -729,29 +1302,52 @@ class CziReader:
         : np.ndarray
             The bitmap converted to a numpy array and reshaped by splitting the color channel
         """
-        if len(np.array(pixel_data).shape) == 2:
+        np_pixel_data = np.asarray(pixel_data)
+        if np_pixel_data.ndim != 3:
             raise ValueError("Incorrect shape")
-        return np.array(pixel_data, copy=False)
+        return np_pixel_data
 
-    def get_cache_info(self) -> _pylibCZIrw.SubBlockCacheInfo:
-        """Provide information on the subblock cache
+    @classmethod
+    def _check_out_array(
+        cls,
+        out: np.ndarray,
+        pixel_type: str,
+        size: Tuple[int, int],
+    ) -> None:
+        """Checks that out can be used as destination of a composition of the given size.
 
+        Parameters
         ----------
-        : _pylibczirw.SubBlockCacheInfo
-            A SubBlockCacheInfo object representing the cache information
+        out : np.ndarray
+            The destination array provided by the user
+        pixel_type : str
+            Pixel type of the composition
+        size : Tuple[int, int]
+            Height and width of the composition
+        Returns
+        ----------
+        :raises ValueError: if out is not writable, has the wrong dtype or shape, or its pixels are not contiguous
         """
-        return self._czi_reader.GetCacheInfo()
-
-    def read(
+        dtype, channels = cls.PIXEL_TYPES_NUMPY[pixel_type]
+        expected_shape = (*size, channels)
+        if not isinstance(out, np.ndarray) or not out.flags.writeable:
+            raise ValueError("out must be a writable numpy array")
+        if out.dtype != np.dtype(dtype):
+            raise ValueError(f"out has dtype {out.dtype}, expected {dtype} for pixel type {pixel_type}")
+        if out.shape != expected_shape:
+            raise ValueError(f"out has shape {out.shape}, expected {expected_shape}")
+        if out.strides[2] != out.itemsize or out.strides[1] != out.itemsize * channels or out.strides[0] < 0:
+            raise ValueError("out must have contiguous pixels within its rows (only rows may be strided)")
+
+    def _get_read_nbytes(
         self,
         roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
         plane: Optional[Dict[str, int]] = None,
         scene: Optional[int] = None,
         zoom: Optional[float] = None,
         pixel_type: Optional[str] = None,
-        background_pixel: Union[Tuple[float, float, float], Color] = BLACK_COLOR,
-    ) -> np.ndarray:
-        """Access Pixel data of the CziReader document and returns it as a np.ndarray
+    ) -> int:
+        """Returns the number of bytes of the pixel data read() returns for the given arguments, without reading it.
 
         Parameters
         ----------
@@ -762,64 +1358,1501 @@ class CziReader:
         scene : Optional[int]
             Scene index
         zoom : float
-            A float between 0 (excluded) and 1 that specifies the zoom factor
+            Zoom factor
         pixel_type : Optional[str]
             The pixel type of the returned data.
-        background_pixel : Union[Tuple[float, float, float], Color]
-            Specifies the color of the background pixels (pixels with no data)
-            This value should always be an rgb float (range 0-1) and will be automatically converted to the bitmap data
-            type.
-
         Returns
         ----------
-        pixel_data : np.ndarray
-            The pixel data as a numpy array.
+        : int
+            The number of bytes of the pixel data
         """
-        # Casting possible tuples to namedtuple
-        if roi:
-            roi = Rectangle(*roi)
-        if not isinstance(background_pixel, Color):
-            background_pixel = Color(*background_pixel)
-
-        # Generating possibly non specified values
         plane = self._create_plane_coords(plane)
         pixel_type = self._get_pixel_type(pixel_type, plane)
-        roi = self._create_roi(roi, scene)
+        roi_libczi = self._format_roi(self._create_roi(Rectangle(*roi) if roi else None, scene))
+        size = self._czi_reader.CalcSize(roi_libczi, 1.0 if zoom is None else float(zoom))
+        dtype, channels = self.PIXEL_TYPES_NUMPY[pixel_type]
+        return size.w * size.h * channels * np.dtype(dtype).itemsize
 
-        # Formatting parameters for the low level call
-        roi_libczi = self._format_roi(roi)
-        background_pixel_libczi = self._format_background_pixel(background_pixel)
-        plane_libczi = self._format_plane(plane)
-        pixel_type_libczi = self._format_pixel_type(pixel_type)
-        scene_libczi = "" if scene is None else str(scene)
-        zoom_libczi = 1.0 if zoom is None else float(zoom)
+    @staticmethod
+    def _create_tiles(roi: Rectangle, tile_size: Tuple[int, int], overlap: Tuple[int, int] = (0, 0)) -> List[Rectangle]:
+        """Divides roi into tiles of tile_size (row by row), which overlap their neighbors by overlap. The tiles at the
+        right and bottom border are cropped to roi.
 
-        # Getting the bitmap
-        pixel_data = self._czi_reader.GetSingleChannelScalingTileAccessorData(
-            pixel_type_libczi,
-            roi_libczi,
-            background_pixel_libczi,
-            zoom_libczi,
-            plane_libczi,
-            scene_libczi,
-        )
-        # Converting to numpy array
-        np_pixel_data = self._get_array_from_bitmap(pixel_data)
+        Parameters
+        ----------
+        roi : Rectangle
+            Region of Interest
+        tile_size : Tuple[int, int]
+            Height and width of the tiles
+        overlap : Tuple[int, int]
+            Vertical and horizontal overlap of adjacent tiles
+        Returns
+        ----------
+        : List[Rectangle]
+            The tiles
+        :raises ValueError: if the tile width or height is not positive, or the overlap is not smaller than the tiles
+        """
+        tile_h, tile_w = tile_size
+        overlap_h, overlap_w = overlap
+        if tile_w < 1 or tile_h < 1:
+            raise ValueError("The tile width and height must be positive.")
+        if not (0 <= overlap_w < tile_w and 0 <= overlap_h < tile_h):
+            raise ValueError("The overlap must not be negative and smaller than the tile width and height.")
+        # The last tile of a row (or column) is the first one reaching the border of roi
+        x_end = roi.x + (max(roi.w - overlap_w, 1) if roi.w > 0 else 0)
+        y_end = roi.y + (max(roi.h - overlap_h, 1) if roi.h > 0 else 0)
+        return [
+            Rectangle(x, y, min(tile_w, roi.x + roi.w - x), min(tile_h, roi.y + roi.h - y))
+            for y in range(roi.y, y_end, tile_h - overlap_h)
+            for x in range(roi.x, x_end, tile_w - overlap_w)
+        ]
 
-        return np_pixel_data
+    def get_cache_info(self) -> _pylibCZIrw.SubBlockCacheInfo:
+        """Provide information on the subblock cache and its statistics since the cache was created (or the statistics
+        were reset): the hits, misses, evictions, bytes served from the cache, bytes read from the stream and the time
+        saved by the hits (estimated by the time it took to read and decode the subblocks found in the cache).
 
+        ----------
+        : _pylibczirw.SubBlockCacheInfo
+            A SubBlockCacheInfo object representing the cache information
+        """
+        return self._czi_reader.GetCacheInfo()
 
-class CziWriter:
-    """CziWriter class.
+    def reset_cache_stats(self) -> None:
+        """Resets the statistics of the subblock cache (see get_cache_info) to zero, the content of the cache is kept.
+        The statistics are shared by all readers sharing the cache, e.g. the readers of a pool.
+        """
+        self._czi_reader.ResetCacheStatistics()
+
+    def subblock_index(self) -> np.ndarray:
+        """Returns the subblock directory of the document, with one record per subblock (in the order of the
+        subblock directory). The records are read by one pass over the subblock directory, no subblock is read.
+
+        The fields of the records are:
+            file_position : the position of the subblock in the file
+            index : the index of the subblock, as used by libCZI
+            one field per dimension (keys of CZI_DIMS and "S") present in the document : the coordinate of the
+                subblock, SUBBLOCK_NO_COORDINATE if the subblock has no coordinate in the dimension
+            x, y, width, height : the logical rectangle of the subblock
+            physical_width, physical_height : the size of the stored bitmap
+            m_index : the M-index of the subblock (-2**31 or 2**31-1 if it is invalid)
+            pixel_type : the value of the _pylibCZIrw.PixelType of the subblock
+            compression : the libCZI compression mode (0: uncompressed, 1: jpg, 4: jpgxr, 5/6: zstd, 255: invalid)
+            minification_factor : the factor between adjacent pyramid layers (0 for pyramid layer 0)
+            pyramid_layer : the pyramid layer the subblock belongs to (SUBBLOCK_INVALID_PYRAMID_LAYER if it could not
+                be determined)
 
-    _czi_writer : object
-        c++ bonded object, corresponding to an instance of the CZIwriteAPI class.
-    _m_dict : Dict[str, int]
-        Dictionary matching a plane with the greatest m_index of subblocks already written in this Plane.
-    GRAY_MAPPING : Dict[str, int]
-        Dictionary matching a np.dtype with the corresponding libCZI PixelType for gray-level images.
+        Returns
+        ----------
+        : np.ndarray
+            One-dimensional structured array of the subblock records
+        """
+        return self._get_subblock_records(self._czi_reader.GetSubBlockIndex())
+
+    def query_subblocks(
+        self,
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+    ) -> np.ndarray:
+        """Returns the subblocks of the given plane(s) intersecting the given roi, with the same fields as
+        subblock_index() (in the order of the subblock directory). The subblocks are looked up in a spatial index
+        over the subblock directory, which is built on first use (by read() or query_subblocks()) and shared by all
+        readers of the document created from this one.
+
+        Parameters
+        ----------
+        roi : Optional[Union[Tuple[int, int, int, int], Rectangle]]
+            Region of Interest. Defaults to the bounding rectangle of the scene if specified, or of the whole document
+            otherwise.
+        plane : Optional[Dict[str, int]]
+            Plane coordinates to filter the subblocks by. Only the given dimensions are compared, so that e.g.
+            {"C": 1} returns the subblocks of all Z and T of channel 1. Defaults to the subblocks of all planes.
+        scene : Optional[int]
+            Scene index. Subblocks of other scenes are excluded (subblocks without a scene index are not).
+
+        Returns
+        ----------
+        : np.ndarray
+            One-dimensional structured array of the subblock records
+        :raises ValueError: if the scene index does not exist in the document
+        """
+        roi = self._create_roi(Rectangle(*roi) if roi else None, scene)
+        return self._get_subblock_records(
+            self._czi_reader.QuerySubBlocks(
+                self._format_roi(roi),
+                self._format_plane(plane or {}),
+                "" if scene is None else str(scene),
+                False,
+            )
+        )
+
+    def _get_subblock_records(self, subblock_index: _pylibCZIrw.SubBlockIndex) -> np.ndarray:
+        """Converts the subblock index returned by the native reader to a structured array, without copying it if
+        possible. The fields of the dimensions not present in the document are dropped.
+
+        Parameters
+        ----------
+        subblock_index : _pylibCZIrw.SubBlockIndex
+            The subblock index returned by the native reader
+        Returns
+        ----------
+        : np.ndarray
+            One-dimensional structured array of the subblock records
+        """
+        records = np.frombuffer(subblock_index, dtype=self.SUBBLOCK_INDEX_DTYPE)
+        unused_dims = [dim for dim in self.CZI_DIMS if self._get_dimension_size(dim) == 0]
+        if not self._stats.sceneBoundingBoxes:
+            unused_dims.append("S")
+        if not unused_dims:
+            return records
+        return repack_fields(records[[name for name in records.dtype.names if name not in unused_dims]])
+
+    def read_subblock(self, index: int, decode: bool = True) -> Union[np.ndarray, memoryview]:
+        """Reads a single subblock, exactly as it is stored in the document (without composition, background fill or
+        pixel type conversion).
+
+        Parameters
+        ----------
+        index : int
+            The index of the subblock, as given by the "index" field of subblock_index()
+        decode : bool
+            Whether to decode the subblock (True) or to return its payload as stored in the file (False)
+
+        Returns
+        ----------
+        : Union[np.ndarray, memoryview]
+            If decode is True, the stored bitmap of the subblock (of its physical size and pixel type) as an array of
+            shape (m,n,1) if grayscale / (m,n,3) if rgb, referring to the decoded bitmap without copying it.
+            Otherwise, the (compressed) payload of the subblock as a read-only memoryview of bytes, referring to the
+            memory of the subblock without copying it.
+        :raises ValueError: if there is no subblock with this index
+        """
+        return self.read_subblocks([index], decode=decode)[0]
+
+    def read_subblocks(
+        self, indices: Sequence[int], decode: bool = True, num_threads: int = 1
+    ) -> List[Union[np.ndarray, memoryview]]:
+        """Reads several subblocks (see read_subblock()). The subblocks are read (and decoded) without holding the
+        GIL, by up to num_threads threads.
+
+        Parameters
+        ----------
+        indices : Sequence[int]
+            The indices of the subblocks, as given by the "index" field of subblock_index()
+        decode : bool
+            Whether to decode the subblocks (True) or to return their payloads as stored in the file (False)
+        num_threads : int
+            The maximal number of threads (the calling thread included) reading the subblocks.
+
+        Returns
+        ----------
+        : List[Union[np.ndarray, memoryview]]
+            The bitmaps or payloads of the subblocks (see read_subblock()), in the order of the indices
+        :raises ValueError: if there is no subblock with one of the indices, or num_threads is not positive
+        """
+        if num_threads < 1:
+            raise ValueError("num_threads must be positive")
+        indices = [int(index) for index in indices]
+        if decode:
+            return [
+                self._get_array_from_bitmap(bitmap)
+                for bitmap in self._czi_reader.ReadSubBlockBitmaps(indices, num_threads)
+            ]
+        return [memoryview(sub_block) for sub_block in self._czi_reader.ReadSubBlocks(indices, num_threads)]
+
+    def read(
+        self,
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = BLACK_COLOR,
+        out: Optional[np.ndarray] = None,
+        num_threads: int = 1,
+        pyramid_layer: Optional[int] = None,
+    ) -> np.ndarray:
+        """Access Pixel data of the CziReader document and returns it as a np.ndarray
+
+        Parameters
+        ----------
+        roi : Optional[Union[Tuple[int, int, int, int], Rectangle]]
+            Region of Interest
+        plane : Optional[Dict[str, int]]
+            Plane coordinates
+        scene : Optional[int]
+            Scene index
+        zoom : float
+            A float between 0 (excluded) and 1 that specifies the zoom factor
+        pixel_type : Optional[str]
+            The pixel type of the returned data.
+        background_pixel : Union[Tuple[float, float, float], Color]
+            Specifies the color of the background pixels (pixels with no data)
+            This value should always be an rgb float (range 0-1) and will be automatically converted to the bitmap data
+            type.
+        out : Optional[np.ndarray]
+            If provided, the pixel data is composed directly into this array and no new array is allocated. It must be
+            writable, have the dtype of the pixel type and the shape (height, width, channels) of the result (for a
+            zoom other than 1, the size of the result may differ from the size of roi by rounding). Rows may be
+            strided, e.g. out can be a slice of a larger array, but the pixels within a row must be contiguous.
+        num_threads : int
+            The number of threads composing the pixel data. With more than one thread (and a zoom of 1), the roi is
+            split into horizontal stripes which are composed concurrently. Other zoom factors are composed by a single
+            thread.
+        pyramid_layer : Optional[int]
+            If specified, the subblocks of this pyramid layer (see pyramid_layers) are read without any scaling
+            instead of choosing the layer by the zoom factor (which cannot be specified then). The roi is given in
+            pixels of layer 0, and the result is downscaled by the downscale factor of the layer (rounding down).
+
+        Returns
+        ----------
+        pixel_data : np.ndarray
+            The pixel data as a numpy array (out, if it was provided).
+        :raises ValueError: if out does not match the result of the read, or if the pyramid layer does not exist or is
+            specified together with zoom
+        """
+        # Casting possible tuples to namedtuple
+        if roi:
+            roi = Rectangle(*roi)
+        if not isinstance(background_pixel, Color):
+            background_pixel = Color(*background_pixel)
+
+        # Generating possibly non specified values
+        plane = self._create_plane_coords(plane)
+        pixel_type = self._get_pixel_type(pixel_type, plane)
+        roi = self._create_roi(roi, scene)
+
+        # Formatting parameters for the low level call
+        roi_libczi = self._format_roi(roi)
+        background_pixel_libczi = self._format_background_pixel(background_pixel)
+        plane_libczi = self._format_plane(plane)
+        pixel_type_libczi = self._format_pixel_type(pixel_type)
+        scene_libczi = "" if scene is None else str(scene)
+        zoom_libczi = 1.0 if zoom is None else float(zoom)
+
+        if pyramid_layer is not None:
+            if zoom is not None:
+                raise ValueError("Only one of zoom and pyramid_layer can be specified")
+            minification_factor = self._get_minification_factor(pyramid_layer, scene)
+            downscale_factor = minification_factor**pyramid_layer
+            size = (roi.h // downscale_factor, roi.w // downscale_factor)
+            if out is None:
+                dtype, channels = self.PIXEL_TYPES_NUMPY[pixel_type]
+                out = np.empty((*size, channels), dtype=dtype)
+            else:
+                self._check_out_array(out, pixel_type, size)
+            self._czi_reader.GetPyramidLayerTileAccessorDataInto(
+                out,
+                pixel_type_libczi,
+                roi.x,
+                roi.y,
+                background_pixel_libczi,
+                minification_factor,
+                pyramid_layer,
+                plane_libczi,
+                scene_libczi,
+            )
+            return out
+
+        if out is None and num_threads > 1:
+            # The stripes are composed concurrently into one destination, which needs to be allocated up front
+            dtype, channels = self.PIXEL_TYPES_NUMPY[pixel_type]
+            size = self._czi_reader.CalcSize(roi_libczi, zoom_libczi)
+            out = np.empty((size.h, size.w, channels), dtype=dtype)
+
+        if out is not None:
+            # Composing directly into the memory of out
+            size = self._czi_reader.CalcSize(roi_libczi, zoom_libczi)
+            self._check_out_array(out, pixel_type, (size.h, size.w))
+            self._czi_reader.GetSingleChannelScalingTileAccessorDataInto(
+                out,
+                pixel_type_libczi,
+                roi_libczi,
+                background_pixel_libczi,
+                zoom_libczi,
+                plane_libczi,
+                scene_libczi,
+                num_threads,
+            )
+            return out
+
+        # Getting the bitmap
+        pixel_data = self._czi_reader.GetSingleChannelScalingTileAccessorData(
+            pixel_type_libczi,
+            roi_libczi,
+            background_pixel_libczi,
+            zoom_libczi,
+            plane_libczi,
+            scene_libczi,
+        )
+        # Converting to numpy array
+        np_pixel_data = self._get_array_from_bitmap(pixel_data)
+
+        return np_pixel_data
+
+    def read_composite(
+        self,
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        display_settings: Optional[Dict[int, ChannelDisplaySettingsDataClass]] = None,
+        num_threads: int = 1,
+    ) -> np.ndarray:
+        """Access the multi-channel composite of the CziReader document, i.e. the enabled channels with their black
+        and white points and tinting applied and added up, as a Bgr24 image. The composition is done by the native
+        library, each channel is read in its own pixel type (with a black background) and no float temporaries are
+        created.
+
+        Parameters
+        ----------
+        roi : Optional[Union[Tuple[int, int, int, int], Rectangle]]
+            Region of Interest
+        plane : Optional[Dict[str, int]]
+            Plane coordinates, the C coordinate is ignored
+        scene : Optional[int]
+            Scene index
+        zoom : float
+            A float between 0 (excluded) and 1 that specifies the zoom factor
+        display_settings : Optional[Dict[int, ChannelDisplaySettingsDataClass]]
+            The display settings of the channels to compose, keyed by channel index. Defaults to the display settings
+            stored in the document (including their gradation curve).
+        num_threads : int
+            The number of threads reading the channels concurrently
+
+        Returns
+        ----------
+        pixel_data : np.ndarray
+            The composite as a numpy array of shape (height, width, 3) and dtype uint8, in BGR order.
+        :raises ValueError: if display_settings is None and the document has no display settings, or if a channel to
+            compose has a pixel type which is not supported by the composition (e.g. Gray32Float)
+        """
+        if roi:
+            roi = Rectangle(*roi)
+        plane = self._create_plane_coords(plane)
+        roi = self._create_roi(roi, scene)
+
+        roi_libczi = self._format_roi(roi)
+        zoom_libczi = 1.0 if zoom is None else float(zoom)
+        display_settings_libczi = (
+            None
+            if display_settings is None
+            else {channel: CziWriter._create_display_setting(setting) for channel, setting in display_settings.items()}
+        )
+
+        size = self._czi_reader.CalcSize(roi_libczi, zoom_libczi)
+        out = np.empty((size.h, size.w, 3), dtype=np.uint8)
+        self._czi_reader.GetMultiChannelCompositeInto(
+            out,
+            roi_libczi,
+            zoom_libczi,
+            self._format_plane(plane),
+            "" if scene is None else str(scene),
+            display_settings_libczi,
+            num_threads,
+        )
+        return out
+
+    def prepare(
+        self,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = BLACK_COLOR,
+    ) -> "ReadPlan":
+        """Prepares reads of the same plane, scene, zoom, pixel type and background pixel, which only differ in their
+        roi. The parameters are validated, formatted and parsed by the native library once, so that the reads of the
+        returned plan only pass their roi (e.g. for serving many tiles of the same plane).
+
+        Parameters
+        ----------
+        plane : Optional[Dict[str, int]]
+            Plane coordinates
+        scene : Optional[int]
+            Scene index
+        zoom : float
+            A float between 0 (excluded) and 1 that specifies the zoom factor
+        pixel_type : Optional[str]
+            The pixel type of the returned data.
+        background_pixel : Union[Tuple[float, float, float], Color]
+            Specifies the color of the background pixels (pixels with no data)
+            This value should always be an rgb float (range 0-1) and will be automatically converted to the bitmap data
+            type.
+
+        Returns
+        ----------
+        read_plan : ReadPlan
+            The prepared reads, see ReadPlan.read().
+        """
+        if not isinstance(background_pixel, Color):
+            background_pixel = Color(*background_pixel)
+
+        # Generating possibly non specified values
+        plane = self._create_plane_coords(plane)
+        pixel_type = self._get_pixel_type(pixel_type, plane)
+        if scene is not None and scene not in self.scenes_bounding_rectangle:
+            raise ValueError("The scene index provided does not mach existing scenes in the czi document")
+
+        zoom_libczi = 1.0 if zoom is None else float(zoom)
+        read_plan = self._czi_reader.PrepareRead(
+            self._format_pixel_type(pixel_type),
+            self._format_background_pixel(background_pixel),
+            zoom_libczi,
+            self._format_plane(plane),
+            "" if scene is None else str(scene),
+        )
+        return ReadPlan(self, read_plan, pixel_type, zoom_libczi)
+
+    def read_many(
+        self,
+        rois: Sequence[Optional[Union[Tuple[int, int, int, int], Rectangle]]],
+        planes: Optional[Union[Dict[str, int], Sequence[Optional[Dict[str, int]]]]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = BLACK_COLOR,
+        stack: bool = False,
+    ) -> Union[List[np.ndarray], np.ndarray]:
+        """Access Pixel data of several ROIs (of the same or different planes) in a single call.
+        The pixel type, background pixel, scene and zoom are prepared once and shared by all ROIs, each distinct plane
+        is parsed once, and the whole batch is composed in one call into the native library (which does not hold the
+        GIL meanwhile).
+
+        Parameters
+        ----------
+        rois : Sequence[Optional[Union[Tuple[int, int, int, int], Rectangle]]]
+            Regions of Interest. A None entry is treated as in read(), i.e. it defaults to the bounding rectangle of
+            the scene (if specified) or of the whole document.
+        planes : Optional[Union[Dict[str, int], Sequence[Optional[Dict[str, int]]]]]
+            Plane coordinates of all ROIs, or a sequence of the plane coordinates of each ROI (in the order of rois,
+            e.g. for a batch of tiles of several channels)
+        scene : Optional[int]
+            Scene index
+        zoom : float
+            A float between 0 (excluded) and 1 that specifies the zoom factor
+        pixel_type : Optional[str]
+            The pixel type of the returned data.
+        background_pixel : Union[Tuple[float, float, float], Color]
+            Specifies the color of the background pixels (pixels with no data)
+            This value should always be an rgb float (range 0-1) and will be automatically converted to the bitmap data
+            type.
+        stack : bool
+            If True, the results are stacked into a single array with the ROI index as first dimension. This requires
+            all ROIs to result in the same shape.
+
+        Returns
+        ----------
+        pixel_data : Union[List[np.ndarray], np.ndarray]
+            The pixel data of each ROI as a list of numpy arrays (in the order of rois), or as one stacked numpy array.
+        :raises ValueError: if stack is True and the ROIs result in different shapes, if planes is a sequence of
+            another length than rois, or if pixel_type is not provided and the channels of the planes have different
+            pixel types
+        """
+        if not isinstance(background_pixel, Color):
+            background_pixel = Color(*background_pixel)
+
+        # Generating possibly non specified values
+        roi_planes = self._create_roi_plane_coords(rois, planes)
+        pixel_type = self._get_stack_pixel_type(pixel_type, roi_planes or [self._create_plane_coords(None)])
+        rois_libczi = [self._format_roi(self._create_roi(Rectangle(*roi) if roi else None, scene)) for roi in rois]
+
+        # Formatting parameters for the low level call
+        background_pixel_libczi = self._format_background_pixel(background_pixel)
+        planes_libczi = [self._format_plane(plane) for plane in roi_planes]
+        pixel_type_libczi = self._format_pixel_type(pixel_type)
+        scene_libczi = "" if scene is None else str(scene)
+        zoom_libczi = 1.0 if zoom is None else float(zoom)
+
+        # Getting the bitmaps
+        pixel_data = self._czi_reader.GetSingleChannelScalingTileAccessorDataBatch(
+            pixel_type_libczi,
+            rois_libczi,
+            background_pixel_libczi,
+            zoom_libczi,
+            planes_libczi,
+            scene_libczi,
+        )
+        # Converting to numpy arrays
+        np_pixel_data = [self._get_array_from_bitmap(bitmap) for bitmap in pixel_data]
+
+        if stack:
+            if len({array.shape for array in np_pixel_data}) > 1:
+                raise ValueError("The ROIs result in arrays of different shapes, they cannot be stacked.")
+            return np.stack(np_pixel_data)
+        return np_pixel_data
+
+    def iter_tiles(
+        self,
+        tile_size: Tuple[int, int],
+        overlap: Tuple[int, int] = (0, 0),
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = BLACK_COLOR,
+        prefetch: int = 2,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[Tuple[Rectangle, np.ndarray]]:
+        """Iterates over a regular grid of tiles of roi (row by row), e.g. for whole slide inference. The next tiles
+        are read and decoded on worker threads (by their own readers of the document, which share the subblock cache)
+        while the current one is processed. See CziReader.read() for the arguments not listed here.
+
+        Parameters
+        ----------
+        tile_size : Tuple[int, int]
+            Height and width of the tiles (in the coordinate system of roi), in the order of the axes of the pixel
+            data and of CziWriter's tile_size. The tiles at the right and bottom border are cropped to roi.
+        overlap : Tuple[int, int]
+            Vertical and horizontal overlap of adjacent tiles
+        prefetch : int
+            The maximal number of tiles read ahead. With 0, each tile is read when it is requested.
+        max_bytes : Optional[int]
+            The budget of bytes of pixel data of the tiles read ahead (not counting the tile being processed). A tile
+            exceeding the budget on its own is read ahead when no other tile is.
+
+        Returns
+        ----------
+        : Iterator[Tuple[Rectangle, np.ndarray]]
+            The tiles and their pixel data
+        :raises ValueError: if the tile size or overlap is invalid, or the scene does not exist
+        """
+        upcoming = deque(
+            self._create_tiles(self._create_roi(Rectangle(*roi) if roi else None, scene), tile_size, overlap)
+        )
+        if prefetch < 1:
+            read_plan = self.prepare(plane, scene, zoom, pixel_type, background_pixel)
+            for tile in upcoming:
+                yield tile, read_plan.read(*tile)
+            return
+
+        readers = [self._create_sibling() for _ in range(prefetch)]
+        try:
+            read_plans: queue.Queue = queue.Queue()
+            for reader in readers:
+                read_plans.put(reader.prepare(plane, scene, zoom, pixel_type, background_pixel))
+
+            def read_tile(tile: Rectangle) -> np.ndarray:
+                read_plan = read_plans.get()
+                try:
+                    return read_plan.read(*tile)
+                finally:
+                    read_plans.put(read_plan)
+
+            with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="pylibCZIrw") as executor:
+                pending: Deque[Tuple[Rectangle, int, Future]] = deque()
+
+                def read_ahead() -> None:
+                    while upcoming and len(pending) < prefetch:
+                        nbytes = (
+                            0
+                            if max_bytes is None
+                            else self._get_read_nbytes(upcoming[0], plane, scene, zoom, pixel_type)
+                        )
+                        if max_bytes is not None and pending and sum(n for _, n, _ in pending) + nbytes > max_bytes:
+                            return
+                        tile = upcoming.popleft()
+                        pending.append((tile, nbytes, executor.submit(read_tile, tile)))
+
+                try:
+                    read_ahead()
+                    while pending:
+                        tile, _, future = pending.popleft()
+                        pixel_data = future.result()
+                        read_ahead()
+                        yield tile, pixel_data
+                finally:
+                    for _, _, future in pending:
+                        future.cancel()
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def read_stack(
+        self,
+        dims: str = "TZCYX",
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = BLACK_COLOR,
+        num_threads: int = 1,
+    ) -> np.ndarray:
+        """Access Pixel data of all planes spanned by the given dimensions and returns it as one np.ndarray
+        The array is allocated once and every plane is composed directly into it by the native library, in a loop
+        which does not hold the GIL.
+
+        Parameters
+        ----------
+        dims : str
+            The plane dimensions to be stacked (keys of CZI_DIMS) in the order of the returned array, followed by
+            "YX". Dimensions not present in the document are of size 1.
+        roi : Optional[Union[Tuple[int, int, int, int], Rectangle]]
+            Region of Interest
+        plane : Optional[Dict[str, int]]
+            Plane coordinates of the dimensions which are not stacked
+        scene : Optional[int]
+            Scene index
+        zoom : float
+            A float between 0 (excluded) and 1 that specifies the zoom factor
+        pixel_type : Optional[str]
+            The pixel type of the returned data. Defaults to the pixel type of the channels of the stack, which must
+            all have the same pixel type.
+        background_pixel : Union[Tuple[float, float, float], Color]
+            Specifies the color of the background pixels (pixels with no data)
+            This value should always be an rgb float (range 0-1) and will be automatically converted to the bitmap data
+            type.
+        num_threads : int
+            The number of threads composing the planes.
+
+        Returns
+        ----------
+        pixel_data : np.ndarray
+            The pixel data as a numpy array with one axis per dimension of dims, followed by the pixel components
+            (1 if grayscale / 3 if rgb), e.g. of shape (T, Z, C, Y, X, 1) for dims="TZCYX".
+        :raises ValueError: if dims is invalid, or pixel_type is not given and the stacked channels have different
+            pixel types
+        """
+        if roi:
+            roi = Rectangle(*roi)
+        if not isinstance(background_pixel, Color):
+            background_pixel = Color(*background_pixel)
+
+        # Generating possibly non specified values
+        stack_sizes, planes = self._create_stack_planes(dims, plane)
+        pixel_type = self._get_stack_pixel_type(pixel_type, planes)
+        roi = self._create_roi(roi, scene)
+
+        # Formatting parameters for the low level call
+        roi_libczi = self._format_roi(roi)
+        background_pixel_libczi = self._format_background_pixel(background_pixel)
+        planes_libczi = [self._format_plane(stack_plane) for stack_plane in planes]
+        pixel_type_libczi = self._format_pixel_type(pixel_type)
+        scene_libczi = "" if scene is None else str(scene)
+        zoom_libczi = 1.0 if zoom is None else float(zoom)
+
+        # Allocating the stack and composing all planes into it
+        dtype, channels = self.PIXEL_TYPES_NUMPY[pixel_type]
+        size = self._czi_reader.CalcSize(roi_libczi, zoom_libczi)
+        np_pixel_data = np.empty((*stack_sizes, size.h, size.w, channels), dtype=dtype)
+        self._czi_reader.GetSingleChannelScalingTileAccessorDataStackInto(
+            np_pixel_data.reshape((len(planes), size.h, size.w, channels)),
+            pixel_type_libczi,
+            roi_libczi,
+            background_pixel_libczi,
+            zoom_libczi,
+            planes_libczi,
+            scene_libczi,
+            num_threads,
+        )
+
+        return np_pixel_data
+
+    def thumbnail(
+        self,
+        max_size: Tuple[int, int] = (256, 256),
+        channels: Optional[Sequence[int]] = None,
+        source: str = "auto",
+    ) -> np.ndarray:
+        """Get a thumbnail (overview image) of the whole czi document, which fits into max_size (keeping the aspect
+        ratio). The thumbnail is never larger than the document (or attachment) itself.
+
+        Parameters
+        ----------
+        max_size : Tuple[int, int]
+            The maximal width and height of the thumbnail
+        channels : Optional[Sequence[int]]
+            The channels (C coordinates) to create the thumbnail of, from the pyramid. Defaults to the default plane.
+        source : str
+            "thumbnail" or "label" use the attachment of this name, which is either an image (e.g. a JPG, decoded by
+            Pillow and returned as Bgr24) or an embedded czi document (whose thumbnail is created from its pyramid).
+            "pyramid" composes the thumbnail from the coarsest pyramid layer present in all scenes which is at least
+            of the size of the thumbnail, and scales it down to the size of the thumbnail (by nearest neighbor).
+            "auto" uses the thumbnail attachment if present and channels is None (and Pillow is installed, if the
+            attachment is an image), and the pyramid otherwise.
+
+        Returns
+        ----------
+        thumbnail : np.ndarray
+            The thumbnail as a numpy array of shape (height, width, 1 or 3), with one more leading axis for the channels
+            if channels are specified.
+        :raises ValueError: if source is invalid, the requested attachment does not exist or the document is empty
+        :raises ImportError: if the requested attachment is an image and Pillow is not installed
+        """
+        if source not in ("auto", "thumbnail", "label", "pyramid"):
+            raise ValueError(f"Invalid source {source}, possible values are: auto, thumbnail, label, pyramid")
+        if source in ("thumbnail", "label") or (source == "auto" and channels is None):
+            name = "Label" if source == "label" else "Thumbnail"
+            attachments = {
+                attachment_name: (index, content_file_type)
+                for index, attachment_name, content_file_type in self._czi_reader.GetAttachmentInfos()
+            }
+            if name in attachments:
+                index, content_file_type = attachments[name]
+                if content_file_type == "CZI":
+                    attached_document = self._open_attached_document(index)
+                    try:
+                        return attached_document.thumbnail(max_size, source="pyramid")
+                    finally:
+                        attached_document.close()
+                try:
+                    from PIL import Image  # pylint: disable=import-outside-toplevel
+                except ImportError as error:
+                    if source != "auto":
+                        raise ImportError(
+                            "Decoding image attachments requires Pillow, it can be installed with: "
+                            "pip install pylibCZIrw[thumbnail]"
+                        ) from error
+                else:
+                    with Image.open(io.BytesIO(self._czi_reader.ReadAttachment(index))) as image:
+                        rgb_image = image.convert("RGB")
+                    rgb_image.thumbnail(max_size)
+                    return np.ascontiguousarray(np.asarray(rgb_image)[:, :, ::-1])
+            elif source != "auto":
+                raise ValueError(f"The czi document has no {name} attachment")
+
+        roi = self.total_bounding_rectangle_no_pyramid
+        if roi.w <= 0 or roi.h <= 0:
+            raise ValueError("The czi document has no pixel data to create a thumbnail of")
+        zoom = min(max_size[0] / roi.w, max_size[1] / roi.h, 1.0)
+        height, width = max(int(roi.h * zoom), 1), max(int(roi.w * zoom), 1)
+        # The coarsest pyramid layer (with the same downscale factor) in all scenes which is large enough
+        common_layers = set.intersection(
+            *(
+                {(layer.layer, layer.downscale_factor) for layer in layers_of_scene}
+                for layers_of_scene in self.pyramid_layers.values()
+            )
+        )
+        pyramid_layer, downscale_factor = max(
+            (
+                (layer, downscale_factor)
+                for layer, downscale_factor in common_layers
+                if roi.w // downscale_factor >= width and roi.h // downscale_factor >= height
+            ),
+            key=lambda layer: layer[1],
+            default=(0, 1),
+        )
+        rows = np.arange(height) * (roi.h // downscale_factor) // height
+        columns = np.arange(width) * (roi.w // downscale_factor) // width
+        thumbnails = []
+        for channel in [None] if channels is None else channels:
+            plane = None if channel is None else {"C": channel}
+            data = self.read(roi=roi, plane=plane, pyramid_layer=pyramid_layer)
+            thumbnails.append(data[np.ix_(rows, columns)])
+        return thumbnails[0] if channels is None else np.stack(thumbnails)
+
+    def _open_attached_document(self, index: int) -> "CziReader":
+        """Opens the czi document embedded in the attachment with the given index (e.g. the label image), which is
+        read from memory. The reader is meant for immediate use only, e.g. it cannot be pickled.
+
+        Parameters
+        ----------
+        index : int
+            The index of the attachment
+        Returns
+        ----------
+        : CziReader
+            The reader of the embedded czi document
+        """
+        attached_document = type(self).__new__(type(self))
+        attached_document._czi_reader = self._czi_reader.OpenAttachedDocument(index)
+        attached_document._stats = attached_document._czi_reader.GetSubBlockStats()
+        attached_document._owns_czi_reader = True
+        return attached_document
+
+    @classmethod
+    def _get_chunk_edges(cls, start: int, end: int, subblock_starts: List[int]) -> List[int]:
+        """Returns the edges of the chunks of to_dask(chunks="auto") along one axis, at the subblock starts within
+        [start, end]. Edges closer than DASK_MIN_CHUNK_SIZE to the previous edge or to end are dropped.
+
+        Parameters
+        ----------
+        start : int
+            The start of the roi along the axis
+        end : int
+            The end of the roi along the axis
+        subblock_starts : List[int]
+            The starts of the subblocks along the axis
+        Returns
+        ----------
+        : List[int]
+            The edges of the chunks, from start to end
+        """
+        edges = [start]
+        for edge in sorted(set(subblock_starts)):
+            if edge - edges[-1] >= cls.DASK_MIN_CHUNK_SIZE and end - edge >= cls.DASK_MIN_CHUNK_SIZE:
+                edges.append(edge)
+        if end > start:
+            edges.append(end)
+        return edges
+
+    def to_dask(
+        self,
+        dims: str = "TZCYX",
+        chunks: Union[str, Tuple[int, int]] = "auto",
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = BLACK_COLOR,
+    ) -> Any:
+        """Returns a lazy dask array of all planes spanned by the given dimensions (see read_stack()).
+        Each chunk covers one plane and a part of the roi. The chunks only refer to the document by its file path, the
+        document is opened lazily by the workers computing them (once per worker thread and process, and again if the
+        file was rewritten). Each worker thread keeps up to DASK_READERS_PER_THREAD documents open, until it exits or
+        close_dask_readers() is called.
+
+        Requires dask to be installed.
+
+        Parameters
+        ----------
+        dims : str
+            The plane dimensions to be stacked (keys of CZI_DIMS) in the order of the returned array, followed by
+            "YX". Dimensions not present in the document are of size 1.
+        chunks : Union[str, Tuple[int, int]]
+            "auto" to align the chunks with the subblocks (of pyramid layer 0) of the stacked planes, so that each
+            subblock is decoded by (mostly) one chunk only. Borders of subblocks closer to each other than
+            DASK_MIN_CHUNK_SIZE are merged. Otherwise the height and width of the chunks.
+        roi : Optional[Union[Tuple[int, int, int, int], Rectangle]]
+            Region of Interest
+        plane : Optional[Dict[str, int]]
+            Plane coordinates of the dimensions which are not stacked
+        scene : Optional[int]
+            Scene index
+        pixel_type : Optional[str]
+            The pixel type of the returned data. Defaults to the pixel type of the channels of the stack, which must
+            all have the same pixel type.
+        background_pixel : Union[Tuple[float, float, float], Color]
+            Specifies the color of the background pixels (pixels with no data)
+            This value should always be an rgb float (range 0-1) and will be automatically converted to the bitmap data
+            type.
+
+        Returns
+        ----------
+        : dask.array.Array
+            The pixel data as a dask array with one axis per dimension of dims, followed by the pixel components
+            (1 if grayscale / 3 if rgb).
+        :raises ImportError: if dask is not installed
+        :raises ValueError: if dims or chunks are invalid, or pixel_type is not given and the stacked channels have
+            different pixel types
+        """
+        try:
+            import dask.array  # pylint: disable=import-outside-toplevel
+            from dask.base import tokenize  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError(
+                "to_dask requires dask, it can be installed with: pip install pylibCZIrw[dask]"
+            ) from error
+
+        if not isinstance(background_pixel, Color):
+            background_pixel = Color(*background_pixel)
+        stack_sizes, planes = self._create_stack_planes(dims, plane)
+        pixel_type = self._get_stack_pixel_type(pixel_type, planes)
+        roi = self._create_roi(Rectangle(*roi) if roi else None, scene)
+
+        if chunks == "auto":
+            # the subblocks of the stacked planes, i.e. of the coordinates of the dimensions which are not stacked
+            subblocks = self._get_subblock_records(
+                self._czi_reader.QuerySubBlocks(
+                    self._format_roi(roi),
+                    self._format_plane({dim: index for dim, index in planes[0].items() if dim not in dims}),
+                    "" if scene is None else str(scene),
+                    True,
+                )
+            )
+            x_edges = self._get_chunk_edges(roi.x, roi.x + roi.w, subblocks["x"].tolist())
+            y_edges = self._get_chunk_edges(roi.y, roi.y + roi.h, subblocks["y"].tolist())
+        elif (
+            isinstance(chunks, tuple)
+            and len(chunks) == 2
+            and all(isinstance(size, int) and size > 0 for size in chunks)
+        ):
+            y_edges = list(range(roi.y, roi.y + roi.h, chunks[0])) + [roi.y + roi.h]
+            x_edges = list(range(roi.x, roi.x + roi.w, chunks[1])) + [roi.x + roi.w]
+        else:
+            raise ValueError('chunks must be "auto" or a tuple of the (positive) height and width of the chunks')
+
+        reader_args = (self._filepath, self._file_input_type, self._cache_options)
+        file_identity = _get_file_identity(self._filepath, self._file_input_type)
+        name = "read-czi-" + tokenize(
+            reader_args,
+            file_identity,
+            dims,
+            roi,
+            plane,
+            scene,
+            pixel_type,
+            background_pixel,
+            x_edges,
+            y_edges,
+        )
+        graph = {}
+        for stack_index, stack_plane in zip(np.ndindex(*stack_sizes), planes):
+            for y_index, (top, bottom) in enumerate(zip(y_edges, y_edges[1:])):
+                for x_index, (left, right) in enumerate(zip(x_edges, x_edges[1:])):
+                    graph[(name, *stack_index, y_index, x_index, 0)] = (
+                        _read_chunk,
+                        reader_args,
+                        file_identity,
+                        Rectangle(left, top, right - left, bottom - top),
+                        stack_plane,
+                        scene,
+                        pixel_type,
+                        background_pixel,
+                        len(stack_sizes),
+                    )
+
+        dtype, channels = self.PIXEL_TYPES_NUMPY[pixel_type]
+        dask_chunks = (
+            *((1,) * size for size in stack_sizes),
+            tuple(bottom - top for top, bottom in zip(y_edges, y_edges[1:])),
+            tuple(right - left for left, right in zip(x_edges, x_edges[1:])),
+            (channels,),
+        )
+        return dask.array.Array(graph, name, dask_chunks, dtype=dtype)
+
+
+class ReadPlan:
+    """ReadPlan class.
+
+    Reads of a czi document prepared by CziReader.prepare(), which share their plane, scene, zoom, pixel type and
+    background pixel and only differ in their roi.
+
+    _reader : CziReader
+        The reader which prepared the reads.
+    _read_plan : object
+        c++ bonded object, corresponding to an instance of the CReadPlan class.
+    pixel_type : str
+        The pixel type of the returned data.
+    _zoom : float
+        The zoom factor of the reads.
+    """
+
+    def __init__(self, reader: CziReader, read_plan: _pylibCZIrw.ReadPlan, pixel_type: str, zoom: float) -> None:
+        """Creates a read plan, should only be called through CziReader.prepare().
+
+        Parameters
+        ----------
+        reader : CziReader
+            The reader which prepared the reads.
+        read_plan : _pylibCZIrw.ReadPlan
+            The native read plan.
+        pixel_type : str
+            The pixel type of the returned data.
+        zoom : float
+            The zoom factor of the reads.
+        """
+        self._reader = reader
+        self._read_plan = read_plan
+        self.pixel_type = pixel_type
+        self._zoom = zoom
+
+    def read(self, x: int, y: int, w: int, h: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Access Pixel data of the given roi, see CziReader.read().
+
+        Parameters
+        ----------
+        x : int
+            The x coordinate of the roi
+        y : int
+            The y coordinate of the roi
+        w : int
+            The width of the roi
+        h : int
+            The height of the roi
+        out : Optional[np.ndarray]
+            If provided, the pixel data is composed directly into this array, c.f. CziReader.read().
+
+        Returns
+        ----------
+        pixel_data : np.ndarray
+            The pixel data as a numpy array (out, if it was provided).
+        :raises ValueError: if out does not match the result of the read
+        """
+        if out is None:
+            return np.asarray(self._read_plan.Read(x, y, w, h))
+
+        size = self._reader._czi_reader.CalcSize(CziReader._format_roi(Rectangle(x, y, w, h)), self._zoom)
+        CziReader._check_out_array(out, self.pixel_type, (size.h, size.w))
+        self._read_plan.ReadInto(out, x, y, w, h)
+        return out
+
+
+class CziReaderPool:
+    """CziReaderPool class.
+
+    A pool of CziReader objects for the same document, for reading it concurrently from many threads. All readers
+    operate on the same stream and share the subblock cache (if any), the document is only opened once. A reader is
+    checked out for the duration of a request, so that no reader is ever used by two threads at the same time.
+
+    _readers : List[CziReader]
+        All readers of the pool.
+    _available : queue.Queue
+        The readers which are currently not checked out.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        pool_size: int,
+        file_input_type: ReaderFileInputTypes = ReaderFileInputTypes.Standard,
+        cache_options: Optional[CacheOptions] = None,
+    ) -> None:
+        """Creates a pool of czi reader objects, should only be called through the open_czi_pool() function.
+
+        Parameters
+        ----------
+        filepath : str
+            File path.
+        pool_size : int
+            The number of readers in the pool, i.e. the maximal number of concurrent requests.
+        file_input_type : ReaderFileInputTypes
+            This is used to set if the filepath is to a local path or url. Defaults to local path.
+        cache_options:
+            The configuration of a subblock cache to be shared by all readers.
+        :raises ValueError: if pool_size is smaller than 1
+        """
+        if pool_size < 1:
+            raise ValueError("The pool size must be at least 1.")
+        first_reader = CziReader(filepath, file_input_type, cache_options=cache_options)
+        self._readers = [first_reader] + [first_reader._create_sibling() for _ in range(pool_size - 1)]
+        self._available: queue.Queue = queue.Queue()
+        for reader in self._readers:
+            self._available.put(reader)
+
+    @property
+    def pool_size(self) -> int:
+        """Returns the number of readers in the pool.
+
+        Returns
+        ----------
+        : int
+            The number of readers in the pool
+        """
+        return len(self._readers)
+
+    @contextlib.contextmanager
+    def reader(self, timeout: Optional[float] = None) -> Generator:
+        """Checks out a reader from the pool for the duration of the context, blocking until one is available.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            The maximal time (in seconds) to wait for a reader. Waits indefinitely if None.
+
+        Returns
+        ----------
+        : CziReader
+            The checked out reader
+        :raises TimeoutError: if no reader became available within the timeout
+        """
+        try:
+            reader = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No reader of the pool became available within the timeout.") from queue.Empty
+        try:
+            yield reader
+        finally:
+            self._available.put(reader)
+
+    def read(self, **kwargs: Any) -> np.ndarray:
+        """Reads with a reader checked out from the pool, see CziReader.read() for the arguments.
+
+        Returns
+        ----------
+        pixel_data : np.ndarray
+            The pixel data as a numpy array.
+        """
+        with self.reader() as reader:
+            return reader.read(**kwargs)
+
+    def get_cache_info(self) -> _pylibCZIrw.SubBlockCacheInfo:
+        """Provide information on the subblock cache shared by all readers of the pool
+
+        ----------
+        : _pylibczirw.SubBlockCacheInfo
+            A SubBlockCacheInfo object representing the cache information
+        """
+        return self._readers[0].get_cache_info()
+
+    def reset_cache_stats(self) -> None:
+        """Resets the statistics of the subblock cache shared by all readers of the pool to zero"""
+        self._readers[0].reset_cache_stats()
+
+    def close(self) -> None:
+        """Close all readers of the pool"""
+        for reader in self._readers:
+            reader.close()
+
+
+class AsyncCziReader:
+    """AsyncCziReader class.
+
+    asyncio front end for reading a czi document. The reads run on a dedicated executor whose threads each use a
+    reader of a CziReaderPool (the native reads do not hold the GIL), which limits the number of concurrent reads.
+    Additionally, the bytes of pixel data being read at the same time can be limited by a budget. Cancelling a read
+    which did not start yet removes it from the executor.
+
+    _pool : CziReaderPool
+        The pool of readers used by the executor threads.
+    _metadata_reader : CziReader
+        Reader used by the event loop thread to prepare reads (e.g. dividing a roi into tiles).
+    _executor : ThreadPoolExecutor
+        The executor running the reads.
+    _max_bytes : Optional[int]
+        The budget of bytes of pixel data being read at the same time, unlimited if None.
+    _bytes_in_flight : int
+        The bytes of pixel data of the reads submitted to the executor and not finished yet.
+    _budget_waiters : List[asyncio.Future]
+        Futures of the reads waiting for budget to become available.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        file_input_type: ReaderFileInputTypes = ReaderFileInputTypes.Standard,
+        cache_options: Optional[CacheOptions] = None,
+        max_concurrency: int = 4,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """Creates an asynchronous czi reader object, should only be called through the open_czi_async() function.
+
+        Parameters
+        ----------
+        filepath : str
+            File path.
+        file_input_type : ReaderFileInputTypes
+            This is used to set if the filepath is to a local path or url. Defaults to local path.
+        cache_options:
+            The configuration of a subblock cache shared by all reads.
+        max_concurrency : int
+            The maximal number of reads running at the same time.
+        max_bytes : Optional[int]
+            The budget of bytes of pixel data being read at the same time. A read exceeding the budget on its own is
+            run when no other read is in flight.
+        """
+        self._pool = CziReaderPool(filepath, max_concurrency, file_input_type, cache_options=cache_options)
+        self._metadata_reader = self._pool._readers[0]._create_sibling()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="pylibCZIrw")
+        self._max_bytes = max_bytes
+        self._bytes_in_flight = 0
+        self._budget_waiters: List[asyncio.Future] = []
+
+    @property
+    def reader(self) -> CziReader:
+        """Returns a reader for querying information on the document (e.g. bounding boxes or metadata), which
+        should only be used from the event loop thread.
+
+        Returns
+        ----------
+        : CziReader
+            The reader
+        """
+        return self._metadata_reader
+
+    async def _reserve_bytes(self, nbytes: int) -> None:
+        """Waits until the budget allows nbytes more bytes in flight and reserves them.
+
+        Parameters
+        ----------
+        nbytes : int
+            The number of bytes to reserve
+        """
+        while (
+            self._max_bytes is not None
+            and 0 < self._bytes_in_flight
+            and self._bytes_in_flight + nbytes > self._max_bytes
+        ):
+            waiter = asyncio.get_running_loop().create_future()
+            self._budget_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                self._budget_waiters.remove(waiter)
+        self._bytes_in_flight += nbytes
+
+    def _release_bytes(self, nbytes: int) -> None:
+        """Releases nbytes reserved bytes and wakes up the reads waiting for budget.
+
+        Parameters
+        ----------
+        nbytes : int
+            The number of bytes to release
+        """
+        self._bytes_in_flight -= nbytes
+        for waiter in self._budget_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _call_reader(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        """Calls the given method of a reader of the pool, runs on the executor.
+
+        Parameters
+        ----------
+        method : str
+            The name of the CziReader method
+        kwargs : Dict[str, Any]
+            The arguments of the method
+        Returns
+        ----------
+        : Any
+            The result of the method
+        """
+        with self._pool.reader() as reader:
+            return getattr(reader, method)(**kwargs)
+
+    async def _get_read_nbytes(
+        self,
+        rois: Sequence[Optional[Union[Tuple[int, int, int, int], Rectangle]]],
+        planes: Optional[Union[Dict[str, int], Sequence[Optional[Dict[str, int]]]]],
+        scene: Optional[int],
+        zoom: Optional[float],
+        pixel_type: Optional[str],
+    ) -> int:
+        """Returns the number of bytes of the pixel data of reads of rois, see CziReader._get_read_nbytes(). It is
+        computed on the executor, as it may access the stream of the document (e.g. a remote one).
+
+        Parameters
+        ----------
+        rois : Sequence[Optional[Union[Tuple[int, int, int, int], Rectangle]]]
+            Regions of Interest
+        planes : Optional[Union[Dict[str, int], Sequence[Optional[Dict[str, int]]]]]
+            Plane coordinates of all rois, or of each roi
+        scene : Optional[int]
+            Scene index
+        zoom : float
+            Zoom factor
+        pixel_type : Optional[str]
+            The pixel type of the returned data.
+        Returns
+        ----------
+        : int
+            The number of bytes of the pixel data
+        """
+
+        def get_read_nbytes() -> int:
+            with self._pool.reader() as reader:
+                roi_planes = reader._create_roi_plane_coords(rois, planes)
+                return sum(
+                    reader._get_read_nbytes(roi, plane, scene, zoom, pixel_type) for roi, plane in zip(rois, roi_planes)
+                )
+
+        return await asyncio.wrap_future(self._executor.submit(get_read_nbytes))
+
+    async def _run(self, nbytes: int, method: str, **kwargs: Any) -> Any:
+        """Runs the given method of a reader on the executor, once the budget allows it.
+
+        Parameters
+        ----------
+        nbytes : int
+            The number of bytes of pixel data the method returns
+        method : str
+            The name of the CziReader method
+        kwargs : Any
+            The arguments of the method
+        Returns
+        ----------
+        : Any
+            The result of the method
+        """
+        loop = asyncio.get_running_loop()
+        await self._reserve_bytes(nbytes)
+        try:
+            future = self._executor.submit(self._call_reader, method, kwargs)
+        except BaseException:
+            self._release_bytes(nbytes)
+            raise
+        # The budget is released once the read is finished (or was cancelled before it started), even if the
+        # awaiting coroutine was cancelled before.
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release_bytes, nbytes))
+        return await asyncio.wrap_future(future)
+
+    async def read(
+        self,
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = CziReader.BLACK_COLOR,
+    ) -> np.ndarray:
+        """Access Pixel data of the document asynchronously, see CziReader.read() for the arguments.
+
+        Returns
+        ----------
+        pixel_data : np.ndarray
+            The pixel data as a numpy array.
+        """
+        nbytes = 0 if self._max_bytes is None else await self._get_read_nbytes([roi], plane, scene, zoom, pixel_type)
+        return await self._run(
+            nbytes,
+            "read",
+            roi=roi,
+            plane=plane,
+            scene=scene,
+            zoom=zoom,
+            pixel_type=pixel_type,
+            background_pixel=background_pixel,
+        )
+
+    async def read_many(
+        self,
+        rois: Sequence[Optional[Union[Tuple[int, int, int, int], Rectangle]]],
+        planes: Optional[Union[Dict[str, int], Sequence[Optional[Dict[str, int]]]]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = CziReader.BLACK_COLOR,
+        stack: bool = False,
+    ) -> Union[List[np.ndarray], np.ndarray]:
+        """Access Pixel data of several ROIs asynchronously, see CziReader.read_many() for the arguments.
+
+        Returns
+        ----------
+        pixel_data : Union[List[np.ndarray], np.ndarray]
+            The pixel data of each ROI as a list of numpy arrays (in the order of rois), or as one stacked numpy array.
+        """
+        nbytes = 0 if self._max_bytes is None else await self._get_read_nbytes(rois, planes, scene, zoom, pixel_type)
+        return await self._run(
+            nbytes,
+            "read_many",
+            rois=rois,
+            planes=planes,
+            scene=scene,
+            zoom=zoom,
+            pixel_type=pixel_type,
+            background_pixel=background_pixel,
+            stack=stack,
+        )
+
+    async def iter_tiles(
+        self,
+        tile_size: Tuple[int, int],
+        overlap: Tuple[int, int] = (0, 0),
+        roi: Optional[Union[Tuple[int, int, int, int], Rectangle]] = None,
+        plane: Optional[Dict[str, int]] = None,
+        scene: Optional[int] = None,
+        zoom: Optional[float] = None,
+        pixel_type: Optional[str] = None,
+        background_pixel: Union[Tuple[float, float, float], Color] = CziReader.BLACK_COLOR,
+        prefetch: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[Rectangle, np.ndarray]]:
+        """Iterates asynchronously over the tiles of roi (row by row), the next tiles are read while the current one
+        is processed. See CziReader.read() for the arguments not listed here.
+
+        Parameters
+        ----------
+        tile_size : Tuple[int, int]
+            Height and width of the tiles (in the coordinate system of roi), in the order of the axes of the pixel
+            data and of CziWriter's tile_size. The tiles at the right and bottom border are cropped to roi.
+        overlap : Tuple[int, int]
+            Vertical and horizontal overlap of adjacent tiles
+        prefetch : Optional[int]
+            The maximal number of tiles read ahead, defaults to the maximal number of concurrent reads. With 0, each
+            tile is read when it is requested.
+        max_bytes : Optional[int]
+            The budget of bytes of pixel data of the tiles read ahead (not counting the tile being processed). A tile
+            exceeding the budget on its own is read ahead when no other tile is.
+
+        Returns
+        ----------
+        : AsyncIterator[Tuple[Rectangle, np.ndarray]]
+            The tiles and their pixel data
+        :raises ValueError: if the tile size or overlap is invalid, or the scene does not exist
+        """
+        upcoming = deque(
+            self._metadata_reader._create_tiles(
+                self._metadata_reader._create_roi(Rectangle(*roi) if roi else None, scene), tile_size, overlap
+            )
+        )
+        prefetch = self._pool.pool_size if prefetch is None else prefetch
+
+        async def get_nbytes(tile: Rectangle) -> int:
+            if max_bytes is None and self._max_bytes is None:
+                return 0
+            return await self._get_read_nbytes([tile], plane, scene, zoom, pixel_type)
+
+        def read_tile(tile: Rectangle, nbytes: int) -> Awaitable[np.ndarray]:
+            return self._run(
+                nbytes,
+                "read",
+                roi=tile,
+                plane=plane,
+                scene=scene,
+                zoom=zoom,
+                pixel_type=pixel_type,
+                background_pixel=background_pixel,
+            )
+
+        if prefetch < 1:
+            for tile in upcoming:
+                yield tile, await read_tile(tile, await get_nbytes(tile))
+            return
+
+        pending: Deque[Tuple[Rectangle, int, asyncio.Future]] = deque()
+        head_nbytes: Optional[int] = None  # of upcoming[0], kept while the budget does not allow reading it ahead
+
+        async def read_ahead() -> None:
+            nonlocal head_nbytes
+            while upcoming and len(pending) < prefetch:
+                if head_nbytes is None:
+                    head_nbytes = await get_nbytes(upcoming[0])
+                if max_bytes is not None and pending and sum(n for _, n, _ in pending) + head_nbytes > max_bytes:
+                    return
+                tile, nbytes, head_nbytes = upcoming.popleft(), head_nbytes, None
+                pending.append((tile, nbytes, asyncio.ensure_future(read_tile(tile, nbytes))))
+
+        try:
+            await read_ahead()
+            while pending:
+                tile, _, task = pending.popleft()
+                pixel_data = await task
+                await read_ahead()
+                yield tile, pixel_data
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+
+    async def close(self) -> None:
+        """Waits for the running reads to finish and closes the document"""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self._metadata_reader.close()
+        self._pool.close()
+
+
+class CziWriter:
+    """CziWriter class.
+
+    _czi_writer : object
+        c++ bonded object, corresponding to an instance of the CZIwriteAPI class.
+    _m_dict : Dict[str, int]
+        Dictionary matching a plane with the greatest m_index of subblocks already written in this Plane.
+    _m_dict_lock : threading.Lock
+        Lock guarding _m_dict, as write() may be called concurrently from multiple threads.
+    _compression_threads : Optional[int]
+        Number of native threads compressing the tiles, None if the tiles are compressed on the calling thread.
+    _pending_writes : Optional[queue.Queue]
+        The futures and tickets of the background writes not completed yet, None without background writing.
+    _completion_thread : Optional[threading.Thread]
+        Thread completing the futures of the background writes, None without background writing.
+    _background_error : Optional[Exception]
+        The first error of a background write since the last flush.
+    _tile_size : Optional[Tuple[int, int]]
+        The (height, width) of the grid the data is divided along, None for the division by _divide_data.
+    _retile_threshold : Optional[int]
+        The size (in bytes) up to which data is written as a single subblock, None for the default.
+    GRAY_MAPPING : Dict[str, int]
+        Dictionary matching a np.dtype with the corresponding libCZI PixelType for gray-level images.
     RGN_MAPPING : Dict[str, int]
         Dictionary matching a np.dtype with the corresponding libCZI PixelType for rgb-level images.
+    AUTO_TILE_SIZE : Tuple[int, int]
+        The (height, width) of the subblocks with tile_size="auto", see benchmarks/tile_size.py.
+    RETILE_THRESHOLD : int
+        The size (in bytes) above which data is divided into several subblocks, without a tile_size.
     """
 
     GRAY_MAPPING: Dict[np.dtype, _pylibCZIrw.PixelType] = {
@@ -834,7 +2867,21 @@ class CziWriter:
         np.dtype("float32"): _pylibCZIrw.PixelType(8),
     }
 
-    def __init__(self, filepath: str, compression_options: Optional[str] = None) -> None:
+    # With benchmarks/tile_size.py, 512x512 subblocks read regions of 512 pixels about 3x and regions of 1024
+    # pixels as fast as 1024x1024 subblocks, and an order of magnitude faster than the default division.
+    AUTO_TILE_SIZE: Tuple[int, int] = (512, 512)
+
+    RETILE_THRESHOLD: int = 10_000_000
+
+    def __init__(
+        self,
+        filepath: str,
+        compression_options: Optional[str] = None,
+        compression_threads: Optional[int] = None,
+        max_queued_bytes: Optional[int] = None,
+        tile_size: Optional[Union[Tuple[int, int], str]] = None,
+        retile_threshold: Optional[int] = None,
+    ) -> None:
         """Creates a czi writer object, should only be call through the create_czi() function.
 
         Parameters
@@ -844,24 +2891,118 @@ class CziWriter:
         compression_options : Optional[str]
             String representation of compression options to be used as default (for this instance). If
             not specified, uncompressed is used.
+        compression_threads : Optional[int]
+            Number of native threads compressing the tiles of a write concurrently. If not specified, the tiles are
+            compressed one after the other on the calling thread (or on a single native thread with background
+            writing).
+        max_queued_bytes : Optional[int]
+            If specified, the tiles are written in the background: write() returns a future as soon as the tiles are
+            queued, and blocks only while the queued tiles not written yet exceed this number of bytes.
+        tile_size : Optional[Union[Tuple[int, int], str]]
+            The (height, width) of the subblocks, "auto" for AUTO_TILE_SIZE. The data is divided along a grid of this
+            size aligned to the origin of the plane, so that the subblocks of all writes are aligned. If not
+            specified, data larger than RETILE_THRESHOLD is divided into subblocks of up to 1800 (rgb) or 3100 pixels.
+        retile_threshold : Optional[int]
+            The size (in bytes) up to which data is written as a single subblock. If not specified, RETILE_THRESHOLD
+            without a tile_size, and 0 (always divided along the grid) with a tile_size.
+
+        :raises ValueError: If compression_threads or max_queued_bytes is smaller than 1, if tile_size is invalid or if
+            retile_threshold is negative.
         """
-        czi_writer = (
-            _pylibCZIrw.czi_writer(filepath)
-            if compression_options is None
-            else _pylibCZIrw.czi_writer(filepath, compression_options)
-        )
+        if compression_threads is not None and compression_threads < 1:
+            raise ValueError("compression_threads must be at least 1.")
+        if max_queued_bytes is not None and max_queued_bytes < 1:
+            raise ValueError("max_queued_bytes must be at least 1.")
+        if retile_threshold is not None and retile_threshold < 0:
+            raise ValueError("retile_threshold must not be negative.")
+        self._tile_size = self._check_tile_size(tile_size)
+        self._retile_threshold = retile_threshold
+        if max_queued_bytes is not None and compression_threads is None:
+            compression_threads = 1
+        if compression_threads is not None:
+            czi_writer = _pylibCZIrw.czi_writer(
+                filepath, compression_options or "", compression_threads, max_queued_bytes or 0
+            )
+        elif compression_options is None:
+            czi_writer = _pylibCZIrw.czi_writer(filepath)
+        else:
+            czi_writer = _pylibCZIrw.czi_writer(filepath, compression_options)
 
         self._czi_writer: _pylibCZIrw.czi_writer = czi_writer
+        self._compression_threads = compression_threads
         self._m_dict: Dict[str, int] = {}
+        self._m_dict_lock = threading.Lock()
         self._metadata_writen = False
+        self._pending_writes: Optional[queue.Queue] = None
+        self._completion_thread: Optional[threading.Thread] = None
+        self._background_error: Optional[Exception] = None
+        if max_queued_bytes is not None:
+            self._pending_writes = queue.Queue()
+            self._completion_thread = threading.Thread(
+                target=self._complete_writes, args=(self._pending_writes,), daemon=True
+            )
+            self._completion_thread.start()
 
     def close(self) -> None:
-        """Close the document and finalize the writing"""
+        """Close the document and finalize the writing. With background writing, the queued tiles are written before.
+
+        :raises Exception: The first error of a background write since the last flush, otherwise the error of writing
+            the metadata or of closing the document.
+        """
+        background_error: Optional[Exception] = None
         try:  # pylint: disable=too-many-try-statements
+            if self._pending_writes is not None:
+                self._pending_writes.join()
+            background_error, self._background_error = self._background_error, None
             if not self._metadata_writen:
                 self.write_metadata()
         finally:
-            self._czi_writer.close()
+            try:
+                self._czi_writer.close()
+            finally:
+                if self._pending_writes is not None and self._completion_thread is not None:
+                    self._pending_writes.put(None)
+                    self._completion_thread.join()
+                # it occurred before any error of writing the metadata or closing, which is chained to it
+                if background_error is not None:
+                    raise background_error
+
+    def flush(self) -> None:
+        """Waits until the tiles of all background writes so far are written to the document.
+
+        :raises Exception: The first error of a background write since the last flush (also reported by the future
+            returned by the write).
+        """
+        if self._pending_writes is not None:
+            self._pending_writes.join()
+        error, self._background_error = self._background_error, None
+        if error is not None:
+            raise error
+
+    def _complete_writes(self, pending_writes: queue.Queue) -> None:
+        """Completes the futures of the background writes in the order of the writes, until None is queued.
+
+        Parameters
+        ----------
+        pending_writes : queue.Queue
+            The futures and tickets of the background writes
+        """
+        while True:
+            pending_write = pending_writes.get()
+            try:  # pylint: disable=too-many-try-statements
+                if pending_write is None:
+                    return
+                future, tickets = pending_write
+                try:
+                    self._czi_writer.WaitForTiles(tickets)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    if self._background_error is None:
+                        self._background_error = error
+                    future.set_exception(error)
+                else:
+                    future.set_result(True)
+            finally:
+                pending_writes.task_done()
 
     def _get_m_index(self, plane_libczi: str) -> int:
         """Compute next available m_index in the specified plane.
@@ -875,11 +3016,12 @@ class CziWriter:
         : int
            the m_index corresponding to the given plane
         """
-        if plane_libczi in self._m_dict:
-            self._m_dict[plane_libczi] = self._m_dict[plane_libczi] + 1
-        else:
-            self._m_dict[plane_libczi] = 0
-        return self._m_dict[plane_libczi]
+        with self._m_dict_lock:
+            if plane_libczi in self._m_dict:
+                self._m_dict[plane_libczi] = self._m_dict[plane_libczi] + 1
+            else:
+                self._m_dict[plane_libczi] = 0
+            return self._m_dict[plane_libczi]
 
     @staticmethod
     def _format_plane(plane: Dict[str, int]) -> str:
@@ -993,7 +3135,9 @@ class CziWriter:
     def _format_data(cls, data: np.ndarray) -> _pylibCZIrw.PImage:
         """Converts the data np.array to a c++ PImage object that will be sent to the writer.
         In order to convert the np.array to a PImage we have to reshape to 2D array and flatten the color dimension.
-        PixelType will be deducted from the shape and the dtype of the array.
+        PixelType will be deducted from the shape and the dtype of the array. The PImage refers to the memory of the
+        array (without copying it) if its pixels are tightly packed, rows may be strided (e.g. a part of a larger
+        array). Otherwise the array is copied.
 
         Parameters
         ----------
@@ -1007,6 +3151,8 @@ class CziWriter:
         """
         if len(data.shape) == 2:
             data = data[..., np.newaxis]
+        if data.ndim == 3 and not cls._has_packed_pixels(data):
+            data = np.ascontiguousarray(data)
 
         if cls._is_rgb(data):
             return _pylibCZIrw.PImage(data, cls.RGB_MAPPING[data.dtype])
@@ -1014,6 +3160,113 @@ class CziWriter:
             return _pylibCZIrw.PImage(cls._format_gray_data(data), cls.GRAY_MAPPING[data.dtype])
         raise ValueError("Incorrect Channel dimension!")
 
+    @staticmethod
+    def _has_packed_pixels(data: np.ndarray) -> bool:
+        """Whether the pixels of the (m,n,c) data are tightly packed within its rows, with positive row strides not
+        smaller than a row (as required to refer to its memory from a PImage). The strides of dimensions of extent 1
+        are irrelevant.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            image data
+        Returns
+        ----------
+        : bool
+            True if the pixels are tightly packed
+        """
+        height, width, channels = data.shape
+        pixel_size = data.itemsize * channels
+        return (
+            (channels == 1 or data.strides[2] == data.itemsize)
+            and (width == 1 or data.strides[1] == pixel_size)
+            and (height == 1 or data.strides[0] >= pixel_size * width)
+        )
+
+    @classmethod
+    def _check_tile_size(cls, tile_size: Optional[Union[Tuple[int, int], str]]) -> Optional[Tuple[int, int]]:
+        """Checks the tile size and resolves "auto".
+
+        Parameters
+        ----------
+        tile_size : Optional[Union[Tuple[int, int], str]]
+            The (height, width) of the subblocks, "auto" or None
+        Returns
+        ----------
+        : Optional[Tuple[int, int]]
+            The (height, width) of the subblocks, None if not specified
+
+        :raises ValueError: If tile_size is neither "auto" nor a (height, width) tuple of positive integers.
+        """
+        if tile_size is None:
+            return None
+        if isinstance(tile_size, str):
+            if tile_size != "auto":
+                raise ValueError(f'tile_size must be "auto" or a (height, width) tuple, not "{tile_size}".')
+            return cls.AUTO_TILE_SIZE
+        if len(tile_size) != 2 or any(int(extent) != extent or extent < 1 for extent in tile_size):
+            raise ValueError(f"tile_size must be a (height, width) tuple of positive integers, not {tile_size}.")
+        return int(tile_size[0]), int(tile_size[1])
+
+    @staticmethod
+    def _grid_cuts(start: int, extent: int, grid: int) -> List[Tuple[int, int]]:
+        """Divides the range [start, start + extent) along the multiples of grid.
+
+        Parameters
+        ----------
+        start : int
+            start of the range
+        extent : int
+            extent of the range
+        grid : int
+            grid spacing
+        Returns
+        ----------
+        : List[Tuple[int, int]]
+            (begin, end) of the parts, relative to start
+        """
+        cuts = [0, *range((start // grid + 1) * grid - start, extent, grid), extent]
+        return list(zip(cuts[:-1], cuts[1:]))
+
+    def _tile_data(
+        self, data: np.ndarray, location: Tuple[int, int], tile_size: Optional[Tuple[int, int]]
+    ) -> Iterator[Tuple[np.ndarray, Tuple[int, int]]]:
+        """Divides the data into the data of its subblocks.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            image data
+        location : Tuple[int, int]
+            Coordinates of the top-left corner of the data
+        tile_size : Optional[Tuple[int, int]]
+            The (height, width) of the grid the data is divided along, None for the division by _divide_data
+        Returns
+        ----------
+        : Iterator[Tuple[np.ndarray, Tuple[int, int]]]
+            The data of the subblocks and the coordinates of their top-left corners.
+        """
+        retile_threshold = self._retile_threshold
+        if retile_threshold is None:
+            retile_threshold = self.RETILE_THRESHOLD if tile_size is None else 0
+        if data.nbytes <= retile_threshold:
+            yield data, location
+            return
+
+        if tile_size is not None:
+            for top, bottom in self._grid_cuts(location[1], data.shape[0], tile_size[0]):
+                for left, right in self._grid_cuts(location[0], data.shape[1], tile_size[1]):
+                    yield data[top:bottom, left:right], (location[0] + left, location[1] + top)
+            return
+
+        curr_x, curr_y = location
+        for subarray in self._divide_data(data):
+            yield subarray, (curr_x, curr_y)
+            curr_x += subarray.shape[1]
+            if curr_x == data.shape[1] + location[0]:
+                curr_x = location[0]
+                curr_y += subarray.shape[0]
+
     @classmethod
     def _choose_max_extent(cls, data: np.ndarray) -> int:
         """Choose the maximum extent based on the number of channels
@@ -1080,9 +3333,18 @@ class CziWriter:
         plane: Optional[Dict[str, int]] = None,
         compression_options: Optional[str] = None,
         scene: int = 0,
-    ) -> bool:
+        tile_size: Optional[Union[Tuple[int, int], str]] = None,
+    ) -> Union[bool, "Future[bool]"]:
         """Write Pixel data to the CziWriter document.
 
+        The compression and the writing of the tiles run without holding the GIL, so other Python threads proceed
+        meanwhile, and calls from multiple threads compress their tiles in parallel. With compression threads, the
+        tiles of large data are also compressed in parallel, and written in the same order as without. The tiles
+        refer to the memory of data (if their rows are tightly packed) instead of copying it, also with compression
+        threads, so data must not be modified or resized (e.g. by another thread) until write() returned, it is not
+        referred to afterwards. Only with background writing, the data is copied into the queue of the writer and a
+        future is returned immediately.
+
         Parameters
         ----------
         data : np.ndarray
@@ -1095,48 +3357,70 @@ class CziWriter:
             String representation of compression options; if not specified, the writer's default is used.
         scene : Optional[int]
             Scene index
+        tile_size : Optional[Union[Tuple[int, int], str]]
+            The (height, width) of the subblocks, "auto" for AUTO_TILE_SIZE (see CziWriter()); if not specified, the
+            writer's default is used.
         Returns
         ----------
-        : bool
-            true if everything went fine, false otherwise.
+        : Union[bool, Future[bool]]
+            true if everything went fine, false otherwise. With background writing, always a future of it (already
+            completed if there was nothing to queue), raising the error of the write if it failed.
         """
         plane = self._create_plane(plane, scene)
         plane_libczi = self._format_plane(plane)
-        curr_x, curr_y = location
-        data_size = data.nbytes / 1000000
         retiling_id = str(uuid.uuid4())
+        tile_size = self._tile_size if tile_size is None else self._check_tile_size(tile_size)
 
-        subdata_generator = self._divide_data(data) if data_size > 10.0 else (item for item in [data])
-
-        for subarray in subdata_generator:
-            m_index = self._get_m_index(plane_libczi)
-            data_libczi = self._format_data(np.ascontiguousarray(subarray))
-            location_libczi = Location(curr_x, curr_y)
-            if compression_options is None:
-                if not self._czi_writer.AddTile(
-                    plane_libczi,
-                    data_libczi,
-                    location_libczi.x,
-                    location_libczi.y,
-                    m_index,
-                    retiling_id,
-                ):
-                    return False
+        tickets = []
+        try:  # pylint: disable=too-many-try-statements
+            for subarray, (curr_x, curr_y) in self._tile_data(data, location, tile_size):
+                m_index = self._get_m_index(plane_libczi)
+                data_libczi = self._format_data(subarray)
+                location_libczi = Location(curr_x, curr_y)
+                if self._compression_threads is not None:
+                    tickets.append(
+                        self._czi_writer.SubmitTile(
+                            plane_libczi,
+                            data_libczi,
+                            location_libczi.x,
+                            location_libczi.y,
+                            m_index,
+                            compression_options or "",
+                            retiling_id,
+                        )
+                    )
+                elif compression_options is None:
+                    if not self._czi_writer.AddTile(
+                        plane_libczi,
+                        data_libczi,
+                        location_libczi.x,
+                        location_libczi.y,
+                        m_index,
+                        retiling_id,
+                    ):
+                        return False
+                else:
+                    if not self._czi_writer.AddTileEx(  # pylint: disable=confusing-consecutive-elif, else-if-used
+                        plane_libczi,
+                        data_libczi,
+                        location_libczi.x,
+                        location_libczi.y,
+                        m_index,
+                        compression_options,
+                        retiling_id,
+                    ):
+                        return False
+        finally:
+            # without background writing, the submitted tiles refer to data, so they are written before returning
+            if tickets and self._pending_writes is None:
+                self._czi_writer.WaitForTiles(tickets)
+        if self._pending_writes is not None:
+            future: "Future[bool]" = Future()
+            if tickets:
+                self._pending_writes.put((future, tickets))
             else:
-                if not self._czi_writer.AddTileEx(  # pylint: disable=confusing-consecutive-elif, else-if-used
-                    plane_libczi,
-                    data_libczi,
-                    location_libczi.x,
-                    location_libczi.y,
-                    m_index,
-                    compression_options,
-                    retiling_id,
-                ):
-                    return False
-            curr_x += subarray.shape[1]
-            if curr_x == data.shape[1] + location[0]:
-                curr_x = location[0]
-                curr_y += subarray.shape[0]
+                future.set_result(True)
+            return future
         return True
 
     @staticmethod
@@ -1212,7 +3496,7 @@ class CziWriter:
         display_settings: Optional[Dict[int, ChannelDisplaySettingsDataClass]] = None,
     ) -> None:
         """Generates and write metadata according to all data writen so far in the CZI document.
-        Channels names can be specified optionally.
+        Channels names can be specified optionally. With background writing, waits for the queued tiles before.
 
         Parameters
         ----------
@@ -1238,6 +3522,8 @@ class CziWriter:
             Display settings that are not written will be set as 'empty', regardless of if they
             initially existed for that channel.
         """
+        if self._pending_writes is not None:
+            self._pending_writes.join()
         channel_names = channel_names or {}
         display_settings_dict = {}
         if display_settings:
@@ -1265,6 +3551,257 @@ class CziWriter:
         self._metadata_writen = True
 
 
+# All readers of the process, their native readers are invalidated in a child process after a fork.
+_live_readers: "weakref.WeakSet[CziReader]" = weakref.WeakSet()
+
+# The readers of documents opened lazily, by process (see CziReader.__getattr__) and by thread (see _get_thread_reader).
+# The readers by process are counted by the number of open readers using them.
+# The readers by thread are held by a thread-local _ThreadReaders, all of them are tracked for close_dask_readers().
+_process_readers: Dict[Tuple[Any, ...], CziReader] = {}
+_process_reader_users: Dict[Tuple[Any, ...], int] = {}
+_process_readers_lock = threading.Lock()
+_thread_local = threading.local()
+_all_thread_readers: "weakref.WeakSet[_ThreadReaders]" = weakref.WeakSet()
+
+
+def _close_thread_readers(
+    readers: "OrderedDict[Tuple[Any, ...], Tuple[Optional[Tuple[int, int]], CziReader]]",
+) -> None:
+    """Closes the readers of a thread computing the chunks of dask arrays.
+
+    Parameters
+    ----------
+    readers : OrderedDict[Tuple[Any, ...], Tuple[Optional[Tuple[int, int]], CziReader]]
+        The readers of the thread, by reader key, along with the identity of the file they were opened for
+    """
+    while readers:
+        _, (_, reader) = readers.popitem()
+        reader.close()
+
+
+class _ThreadReaders:
+    """The readers of a thread computing the chunks of dask arrays (see _get_thread_reader), in the order of their
+    last use. They are closed when the thread exits (and the thread-local holding them is released).
+    """
+
+    def __init__(self) -> None:
+        self.readers: "OrderedDict[Tuple[Any, ...], Tuple[Optional[Tuple[int, int]], CziReader]]" = OrderedDict()
+        self.finalizer = weakref.finalize(self, _close_thread_readers, self.readers)
+
+
+def _get_reader_key(
+    filepath: str,
+    file_input_type: ReaderFileInputTypes,
+    cache_options: Optional[CacheOptions],
+) -> Tuple[Any, ...]:
+    """Returns a hashable key for the arguments for opening a document.
+
+    Parameters
+    ----------
+    filepath : str
+        File path.
+    file_input_type : ReaderFileInputTypes
+        The type of file input.
+    cache_options : Optional[CacheOptions]
+        The configuration of a subblock cache to be used.
+
+    Returns
+    ----------
+    : Tuple[Any, ...]
+        The key
+    """
+    return filepath, file_input_type, None if cache_options is None else astuple(cache_options)
+
+
+def _release_process_reader(key: Tuple[Any, ...]) -> None:
+    """Releases the reader shared within the process by a closed reader (see CziReader.__getattr__), and closes it if
+    it is not used by another reader anymore.
+
+    Parameters
+    ----------
+    key : Tuple[Any, ...]
+        The key of the reader of the process
+    """
+    with _process_readers_lock:
+        if key not in _process_readers:
+            return
+        _process_reader_users[key] -= 1
+        if _process_reader_users[key] > 0:
+            return
+        del _process_reader_users[key]
+        process_reader = _process_readers.pop(key)
+    process_reader.close()
+
+
+def close_process_readers() -> None:
+    """Closes the documents opened lazily in this process by unpickled or inherited readers (see "Using readers in
+    other processes"), even if readers using them are not closed yet. These readers open the documents again on next
+    use. The documents are otherwise kept open until all readers using them are closed.
+
+    Must not be called while such readers are reading in this process.
+    """
+    with _process_readers_lock:
+        process_readers = list(_process_readers.values())
+        _process_readers.clear()
+        _process_reader_users.clear()
+        for reader in list(_live_readers):
+            if reader.__dict__.pop("_process_reader_key", None) is not None:
+                reader.__dict__.pop("_czi_reader", None)
+                reader.__dict__.pop("_owns_czi_reader", None)
+    for process_reader in process_readers:
+        process_reader.close()
+
+
+def _forget_inherited_readers() -> None:
+    """Invalidates the native readers inherited from the parent process, called in the child process after a fork.
+    The native readers are not closed (which would affect the parent process), the documents are opened again lazily.
+    """
+    global _process_readers_lock, _thread_local  # pylint: disable=global-statement
+    _process_readers_lock = threading.Lock()
+    _process_readers.clear()
+    _process_reader_users.clear()
+    for thread_readers in list(_all_thread_readers):
+        thread_readers.finalizer.detach()
+        thread_readers.readers.clear()
+    _all_thread_readers.clear()
+    _thread_local = threading.local()
+    for reader in list(_live_readers):
+        reader.__dict__.pop("_czi_reader", None)
+        reader.__dict__.pop("_owns_czi_reader", None)
+        reader.__dict__.pop("_process_reader_key", None)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_readers)
+
+
+def _get_file_identity(filepath: str, file_input_type: ReaderFileInputTypes) -> Optional[Tuple[int, int]]:
+    """Returns the modification time and size of a local file, which change when the file is rewritten.
+
+    Parameters
+    ----------
+    filepath : str
+        File path.
+    file_input_type : ReaderFileInputTypes
+        The type of file input.
+
+    Returns
+    ----------
+    : Optional[Tuple[int, int]]
+        The modification time (in ns) and size of the file, None if it is not a local file
+    """
+    if file_input_type is not ReaderFileInputTypes.Standard:
+        return None
+    stat = os.stat(filepath)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_thread_reader(
+    filepath: str,
+    file_input_type: ReaderFileInputTypes,
+    cache_options: Optional[CacheOptions],
+    file_identity: Optional[Tuple[int, int]],
+) -> CziReader:
+    """Returns a reader for the given document, which is only used by the calling thread. The document is opened on
+    the first call of a thread, and kept open for later calls until the thread exits, close_dask_readers() is called or
+    it is the least recently used of more than CziReader.DASK_READERS_PER_THREAD documents of the thread. If it was
+    opened for another identity of the (local) file, i.e. the file was rewritten, it is opened again.
+
+    Parameters
+    ----------
+    filepath : str
+        File path.
+    file_input_type : ReaderFileInputTypes
+        The type of file input.
+    cache_options : Optional[CacheOptions]
+        The configuration of a subblock cache to be used.
+    file_identity : Optional[Tuple[int, int]]
+        The identity of the file the reader is requested for (see _get_file_identity).
+
+    Returns
+    ----------
+    : CziReader
+        The reader of the calling thread
+    """
+    thread_readers: Optional[_ThreadReaders] = getattr(_thread_local, "readers", None)
+    if thread_readers is None:
+        thread_readers = _ThreadReaders()
+        _thread_local.readers = thread_readers
+        with _process_readers_lock:
+            _all_thread_readers.add(thread_readers)
+    readers = thread_readers.readers
+    key = _get_reader_key(filepath, file_input_type, cache_options)
+    entry = readers.pop(key, None)
+    if entry is not None and entry[0] != file_identity:
+        entry[1].close()
+        entry = None
+    if entry is None:
+        entry = file_identity, CziReader(filepath, file_input_type, cache_options=cache_options)
+    readers[key] = entry
+    while len(readers) > CziReader.DASK_READERS_PER_THREAD:
+        _, (_, reader) = readers.popitem(last=False)
+        reader.close()
+    return entry[1]
+
+
+def close_dask_readers() -> None:
+    """Closes the documents opened in this process for computing the chunks of dask arrays (see CziReader.to_dask()).
+    The documents are kept open by the threads computing the chunks (up to CziReader.DASK_READERS_PER_THREAD per
+    thread, until the thread exits), for computing further chunks. Closing them releases their file handles (e.g. for
+    deleting the files), later computations open the documents again.
+
+    Must not be called while chunks are computed in this process. In a dask distributed cluster, it has to be called in
+    the workers, e.g. by client.run(close_dask_readers).
+    """
+    with _process_readers_lock:
+        all_thread_readers = list(_all_thread_readers)
+    for thread_readers in all_thread_readers:
+        _close_thread_readers(thread_readers.readers)
+
+
+def _read_chunk(
+    reader_args: Tuple[str, ReaderFileInputTypes, Optional[CacheOptions]],
+    file_identity: Optional[Tuple[int, int]],
+    roi: Rectangle,
+    plane: Dict[str, int],
+    scene: Optional[int],
+    pixel_type: str,
+    background_pixel: Color,
+    stack_ndim: int,
+) -> np.ndarray:
+    """Reads a chunk of a dask array created by CziReader.to_dask(), with the reader of the calling thread.
+
+    Parameters
+    ----------
+    reader_args : Tuple[str, ReaderFileInputTypes, Optional[CacheOptions]]
+        The arguments for opening the document.
+    file_identity : Optional[Tuple[int, int]]
+        The identity of the file when the dask array was created (see _get_file_identity).
+    roi : Rectangle
+        Region of Interest of the chunk
+    plane : Dict[str, int]
+        Plane coordinates of the chunk
+    scene : Optional[int]
+        Scene index
+    pixel_type : str
+        Pixel type
+    background_pixel : Color
+        Color of the background pixels
+    stack_ndim : int
+        The number of stacked dimensions
+
+    Returns
+    ----------
+    : np.ndarray
+        The pixel data of the chunk, with an axis of size 1 for each stacked dimension
+    """
+    reader = _get_thread_reader(*reader_args, file_identity)
+    pixel_data = reader.read(
+        roi=roi, plane=plane, scene=scene, pixel_type=pixel_type, background_pixel=background_pixel
+    )
+    return pixel_data[(np.newaxis,) * stack_ndim]
+
+
 @contextlib.contextmanager
 def open_czi(
     filepath: str,
@@ -1296,7 +3833,86 @@ def open_czi(
 
 
 @contextlib.contextmanager
-def create_czi(filepath: str, exist_ok: bool = False, compression_options: Optional[str] = None) -> Generator:
+def open_czi_pool(
+    filepath: str,
+    pool_size: int,
+    file_input_type: ReaderFileInputTypes = ReaderFileInputTypes.Standard,
+    cache_options: Optional[CacheOptions] = None,
+) -> Generator:
+    """Initialize a pool of czi reader objects for concurrent reads of the same document and returns it.
+
+    Parameters
+    ----------
+    filepath : str
+        File path.
+    pool_size : int
+        The number of readers in the pool, i.e. the maximal number of concurrent requests.
+    file_input_type : ReaderFileInputTypes, optional
+        The type of file input, default is local file.
+    cache_options : CacheOptions, optional
+        The configuration of a subblock cache shared by all readers. Per default no cache is used.
+
+    Returns
+    ----------
+     : CziReaderPool
+        The pool of CziReader documents
+    """
+    pool = CziReaderPool(filepath, pool_size, file_input_type, cache_options=cache_options)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+@contextlib.asynccontextmanager
+async def open_czi_async(
+    filepath: str,
+    file_input_type: ReaderFileInputTypes = ReaderFileInputTypes.Standard,
+    cache_options: Optional[CacheOptions] = None,
+    max_concurrency: int = 4,
+    max_bytes: Optional[int] = None,
+) -> AsyncGenerator:
+    """Initialize an asynchronous czi reader object and returns it. The document is opened without blocking the event
+    loop.
+
+    Parameters
+    ----------
+    filepath : str
+        File path.
+    file_input_type : ReaderFileInputTypes, optional
+        The type of file input, default is local file.
+    cache_options : CacheOptions, optional
+        The configuration of a subblock cache to be used. Per default no cache is used.
+    max_concurrency : int, optional
+        The maximal number of reads running at the same time.
+    max_bytes : int, optional
+        The budget of bytes of pixel data being read at the same time. Per default the budget is unlimited.
+
+    Returns
+    ----------
+     : AsyncCziReader
+        The asynchronous CziReader document
+    """
+    reader = await asyncio.get_running_loop().run_in_executor(
+        None,
+        lambda: AsyncCziReader(filepath, file_input_type, cache_options, max_concurrency, max_bytes),
+    )
+    try:
+        yield reader
+    finally:
+        await reader.close()
+
+
+@contextlib.contextmanager
+def create_czi(
+    filepath: str,
+    exist_ok: bool = False,
+    compression_options: Optional[str] = None,
+    compression_threads: Optional[int] = None,
+    max_queued_bytes: Optional[int] = None,
+    tile_size: Optional[Union[Tuple[int, int], str]] = None,
+    retile_threshold: Optional[int] = None,
+) -> Generator:
     """Initialize a czi writer object and returns it. Opens the filepath and hands it over to the low-level function.
 
     Any missing intermediate directories are created in case they are missing.
@@ -1314,6 +3930,22 @@ def create_czi(filepath: str, exist_ok: bool = False, compression_options: Optio
         String representation of compression options to be used as default (for this instance). If
         not specified, uncompressed is used. The compression-options set here can still be overwritten with each
         individual call to the write function.
+    compression_threads : Optional[int]
+        Number of native threads compressing the tiles of a write concurrently, while a single writer thread adds
+        them to the document in order, so the document is the same as without. If not specified, the tiles are
+        compressed one after the other on the calling thread (or on a single native thread with background writing).
+    max_queued_bytes : Optional[int]
+        If specified, the tiles are written in the background: write() returns a future as soon as the tiles are
+        queued, and blocks only while the queued tiles not written yet exceed this number of bytes. flush() and
+        closing the writer wait for the queued tiles and raise the first error of a background write.
+    tile_size : Optional[Union[Tuple[int, int], str]]
+        The (height, width) of the subblocks, "auto" for CziWriter.AUTO_TILE_SIZE. The data of each write is divided
+        along a grid of this size aligned to the origin of the plane, so that reads of regions aligned to the grid hit
+        a predictable set of subblocks. If not specified, data larger than 10 MB is divided into subblocks of up to
+        1800 (rgb) or 3100 pixels. Can be overwritten with each individual call to the write function.
+    retile_threshold : Optional[int]
+        The size (in bytes) up to which data is written as a single subblock. If not specified, 10 MB without a
+        tile_size, and 0 (always divided along the grid) with a tile_size.
 
     Returns
     ----------
@@ -1321,13 +3953,17 @@ def create_czi(filepath: str, exist_ok: bool = False, compression_options: Optio
          CziWriter document as a czi object
 
     :raises FileExistsError: If exist_ok is False, i.e. no overwrite is allowed, and the file exists
+    :raises ValueError: If compression_threads or max_queued_bytes is smaller than 1, if tile_size is invalid or if
+        retile_threshold is negative.
 
     """
     filepath_abs = abspath(filepath)
     if not exist_ok and isfile(filepath_abs):
         raise FileExistsError(f"{filepath_abs} already exists and exist_ok is False.")
     makedirs(dirname(filepath_abs), exist_ok=True)
-    writer = CziWriter(filepath_abs, compression_options)
+    writer = CziWriter(
+        filepath_abs, compression_options, compression_threads, max_queued_bytes, tile_size, retile_threshold
+    )
     try:
         yield writer
     finally:
@@ -9,7 +9,17 @@ import numpy as np
 import pytest
 import xmltodict
 
-from pylibCZIrw.czi import CziReader, Rectangle, create_czi, open_czi
+from pylibCZIrw.czi import (
+    AcquisitionMetadata,
+    ChannelDisplaySettingsDataClass,
+    ChannelMetadata,
+    CziReader,
+    Rectangle,
+    Rgb8Color,
+    TintingMode,
+    create_czi,
+    open_czi,
+)
 
 working_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -274,7 +284,7 @@ def test_custom_attributes_write_error(custom_attributes: Optional[Dict[str, Any
         {"key1": {"@Type": "SomeType", "#text": 123}},
     ],
 )
-@patch("pylibCZIrw.czi.CziReader.metadata", new_callable=PropertyMock)
+@patch("pylibCZIrw.czi.CziReader._metadata_dict", new_callable=PropertyMock)
 def test_custom_attributes_read_error(
     metadata_patch: PropertyMock, custom_attributes: Optional[Dict[str, Any]]
 ) -> None:
@@ -288,6 +298,86 @@ def test_custom_attributes_read_error(
             _ = czi_reader.custom_attributes_metadata
 
 
+def test_metadata_cached() -> None:
+    """Test if the metadata is read and parsed once (with a copy returned on each access), and the cache is cleared on
+    close"""
+    with tempfile.TemporaryDirectory() as temp_directory:
+        with create_czi(os.path.join(temp_directory, "./test.czi")) as test_czi:
+            test_czi.write(np.zeros((10, 10), dtype=np.uint8))
+            test_czi.write_metadata(custom_attributes={"key1": 1})
+        czi_document = CziReader(os.path.join(temp_directory, "./test.czi"))
+        czi_reader = czi_document._czi_reader
+        with patch.object(czi_document, "_czi_reader", wraps=czi_reader) as czi_reader_mock:
+            with patch("pylibCZIrw.czi.xmltodict.parse", wraps=xmltodict.parse) as parse_mock:
+                assert czi_document.custom_attributes_metadata == {"key1": 1}
+                metadata = czi_document.metadata
+                assert metadata == czi_document.metadata
+                metadata["ImageDocument"].clear()
+                assert metadata != czi_document.metadata
+                assert czi_document.metadata_fields is czi_document.metadata_fields
+                assert czi_document.raw_metadata == czi_reader.GetXmlMetadata()
+                assert czi_reader_mock.GetXmlMetadata.call_count == 1
+                assert parse_mock.call_count == 1
+            czi_document.close()
+            assert "_metadata_cache" not in czi_document.__dict__
+
+
+def test_metadata_fields() -> None:
+    """Test the commonly used fields of the metadata"""
+    with tempfile.TemporaryDirectory() as temp_directory:
+        with create_czi(os.path.join(temp_directory, "./test.czi")) as test_czi:
+            for c in range(2):
+                test_czi.write(np.zeros((10, 10), dtype=np.uint16), plane={"C": c})
+            test_czi.write_metadata(
+                channel_names={0: "DAPI"},
+                scale_x=0.1,
+                scale_y=0.2,
+                display_settings={
+                    1: ChannelDisplaySettingsDataClass(
+                        True, TintingMode.Color, Rgb8Color(np.uint8(255), np.uint8(0), np.uint8(0)), 0.0, 1.0
+                    )
+                },
+            )
+        with open_czi(os.path.join(temp_directory, "./test.czi")) as czi_document:
+            fields = czi_document.metadata_fields
+            display_settings = czi_document.display_settings
+    assert sorted(display_settings) == [0, 1]
+    assert display_settings[1] == ChannelDisplaySettingsDataClass(
+        True, TintingMode.Color, Rgb8Color(np.uint8(255), np.uint8(0), np.uint8(0)), 0.0, 1.0
+    )
+    assert fields.scaling == {"X": 0.1, "Y": 0.2, "Z": 0.0}
+    assert [(channel.index, channel.id, channel.name) for channel in fields.channels] == [
+        (0, "Channel:0", "DAPI"),
+        (1, "Channel:1", None),
+    ]
+    assert [channel.pixel_type for channel in fields.channels] == ["Gray16", "Gray16"]
+    assert [channel.color for channel in fields.channels] == [None, "#FFFF0000"]
+    assert fields.acquisition == AcquisitionMetadata(None, None, None, None, None, None)
+
+    fields = CziReader._parse_metadata_fields("""<ImageDocument><Metadata><Information>
+        <Image>
+            <AcquisitionDateAndTime>2021-01-01T10:00:00Z</AcquisitionDateAndTime>
+            <Dimensions><Channels><Channel Id="Channel:0" Name="EGFP">
+                <Color>#FF00FF5B</Color><Fluor>EGFP</Fluor><ExposureTime>20000000</ExposureTime>
+                <ExcitationWavelength>488</ExcitationWavelength><EmissionWavelength>509</EmissionWavelength>
+            </Channel></Channels></Dimensions>
+        </Image>
+        <Instrument>
+            <Microscopes><Microscope Id="Microscope:1" Name="Axio Observer" /></Microscopes>
+            <Objectives><Objective Id="Objective:1" Name="Plan-Apochromat 20x/0.8">
+                <LensNA>0.8</LensNA><NominalMagnification>20</NominalMagnification><Immersion>Air</Immersion>
+            </Objective></Objectives>
+        </Instrument>
+        </Information></Metadata></ImageDocument>""")
+    assert fields.scaling == {}
+    assert fields.channels == (
+        ChannelMetadata(0, "Channel:0", "EGFP", None, "#FF00FF5B", "EGFP", 488.0, 509.0, 20000000.0),
+    )
+    assert fields.acquisition == AcquisitionMetadata(
+        "2021-01-01T10:00:00Z", "Axio Observer", "Plan-Apochromat 20x/0.8", 20.0, 0.8, "Air"
+    )
+
+
 def test_zoom() -> None:
     """Testing the zoom while reading the image."""
     with tempfile.TemporaryDirectory() as temp_directory:
@@ -1,14 +1,36 @@
 """Module implementing integration tests for the read function of the CziReader class"""
 
+import asyncio
+import itertools
+import multiprocessing
 import os
-from concurrent.futures import ThreadPoolExecutor
+import pickle
+import tempfile
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import numpy as np
 import pytest
 
-from pylibCZIrw.czi import CacheOptions, CacheType, ReaderFileInputTypes, open_czi
+from pylibCZIrw.czi import (
+    CacheOptions,
+    CacheType,
+    ChannelDisplaySettingsDataClass,
+    CziReader,
+    PyramidLayer,
+    ReaderFileInputTypes,
+    Rgb8Color,
+    TintingMode,
+    close_dask_readers,
+    close_process_readers,
+    create_czi,
+    open_czi,
+    open_czi_async,
+    open_czi_pool,
+)
 
 working_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -539,6 +561,1013 @@ def test_read_concurrently(
             np.testing.assert_array_equal(curr_plane_array, curr_expected)
 
 
+@pytest.mark.parametrize(
+    "rois, zoom, pixel_type",
+    [
+        ([(0, 0, 64, 64), (64, 0, 64, 64), (32, 100, 64, 64)], None, None),
+        ([(0, 0, 128, 128), (10, 20, 128, 128)], 0.5, "Gray16"),
+        ([(0, 0, 10, 10)], None, "Bgr24"),
+        ([None, (200, 150, 100, 100)], None, None),
+    ],
+)
+def test_read_many(
+    rois: List[Optional[Tuple[int, int, int, int]]],
+    zoom: Optional[float],
+    pixel_type: Optional[str],
+) -> None:
+    """Integration tests for read_many giving the same result as consecutive calls to read"""
+    data = np.random.randint(0, 255, (200, 250, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data, plane={"C": 0})
+            czi_document.write(data[::-1], plane={"C": 1})
+        with open_czi(czi_path) as czi_document:
+            for plane in ({"C": 0}, {"C": 1}):
+                expected = [czi_document.read(roi=roi, plane=plane, zoom=zoom, pixel_type=pixel_type) for roi in rois]
+                actual = czi_document.read_many(rois, planes=plane, zoom=zoom, pixel_type=pixel_type)
+                assert len(actual) == len(expected)
+                for curr_actual, curr_expected in zip(actual, expected):
+                    np.testing.assert_array_equal(curr_actual, curr_expected)
+
+            # one plane per ROI, e.g. tiles of several channels
+            planes = [{"C": index % 2} for index in range(len(rois))]
+            expected = [
+                czi_document.read(roi=roi, plane=plane, zoom=zoom, pixel_type=pixel_type)
+                for roi, plane in zip(rois, planes)
+            ]
+            actual = czi_document.read_many(rois, planes=planes, zoom=zoom, pixel_type=pixel_type)
+            assert len(actual) == len(expected)
+            for curr_actual, curr_expected in zip(actual, expected):
+                np.testing.assert_array_equal(curr_actual, curr_expected)
+            with pytest.raises(ValueError):
+                czi_document.read_many(rois, planes=planes + [{"C": 0}])
+
+
+def test_read_many_stack() -> None:
+    """Integration tests for read_many returning a stacked array"""
+    data = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    rois = [(0, 0, 50, 40), (50, 60, 50, 40), (20, 20, 50, 40)]
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            stacked = czi_document.read_many(rois, stack=True)
+            assert stacked.shape == (3, 40, 50, 3)
+            for index, (x, y, w, h) in enumerate(rois):
+                np.testing.assert_array_equal(stacked[index], data[y : y + h, x : x + w])
+            with pytest.raises(ValueError):
+                czi_document.read_many([(0, 0, 10, 10), (0, 0, 20, 10)], stack=True)
+
+
+def test_read_many_planes_pixel_types() -> None:
+    """Integration tests for read_many of ROIs of channels with different pixel types"""
+    gray8 = np.random.randint(0, 255, (30, 40, 1), dtype=np.uint8)
+    gray16 = np.random.randint(0, 65535, (30, 40, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(gray8, plane={"C": 0})
+            czi_document.write(gray16, plane={"C": 1})
+        with open_czi(czi_path) as czi_document:
+            rois = [(0, 0, 20, 10), (10, 10, 20, 10)]
+            assert czi_document.read_many(rois, planes=[{"C": 1}, {"C": 1}], stack=True).dtype == np.uint16
+            with pytest.raises(ValueError):
+                czi_document.read_many(rois, planes=[{"C": 0}, {"C": 1}])
+            stacked = czi_document.read_many(rois, planes=[{"C": 0}, {"C": 1}], pixel_type="Gray16", stack=True)
+            np.testing.assert_array_equal(stacked[1], gray16[10:20, 10:30])
+
+
+@pytest.mark.parametrize(
+    "zoom, pixel_type, scene",
+    [(None, None, None), (0.5, None, 0), (None, "Bgr48", 1), (0.3, "Gray16", None)],
+)
+def test_prepare(zoom: Optional[float], pixel_type: Optional[str], scene: Optional[int]) -> None:
+    """Integration tests for reads of a read plan giving the same result as the corresponding calls to read"""
+    data = np.random.randint(0, 255, (200, 250, 1), dtype=np.uint8)
+    rois = [(0, 0, 250, 200), (10, 20, 30, 40), (-50, 100, 100, 200), (230, 180, 20, 20)]
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            for c in range(2):
+                czi_document.write(data, plane={"C": c}, scene=0)
+                czi_document.write(data[::-1], plane={"C": c}, location=(100, 50), scene=1)
+        with open_czi(czi_path) as czi_document:
+            plan = czi_document.prepare(plane={"C": 1}, scene=scene, zoom=zoom, pixel_type=pixel_type)
+            for roi in rois:
+                expected = czi_document.read(roi=roi, plane={"C": 1}, scene=scene, zoom=zoom, pixel_type=pixel_type)
+                np.testing.assert_array_equal(plan.read(*roi), expected)
+                out = np.full(expected.shape, 7, dtype=expected.dtype)
+                assert plan.read(*roi, out=out) is out
+                np.testing.assert_array_equal(out, expected)
+
+            with pytest.raises(ValueError):
+                plan.read(0, 0, 10, 10, out=np.zeros((10, 11, 3), dtype=np.uint8))
+            with pytest.raises(ValueError):
+                czi_document.prepare(scene=2)
+
+
+def test_read_pyramid_layer() -> None:
+    """Integration tests for reading a document without pyramid by pyramid layer"""
+    data = np.random.randint(0, 255, (60, 80, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data, plane={"C": 0}, scene=0)
+            czi_document.write(data[:40, :50], plane={"C": 0}, location=(100, 0), scene=1)
+        with open_czi(czi_path) as czi_document:
+            assert czi_document.pyramid_layers == {
+                0: (PyramidLayer(layer=0, minification_factor=0, downscale_factor=1, subblock_count=1, nbytes=14400),),
+                1: (PyramidLayer(layer=0, minification_factor=0, downscale_factor=1, subblock_count=1, nbytes=6000),),
+            }
+            for roi, scene in [(None, None), ((10, 20, 30, 30), None), (None, 1), ((-10, -10, 200, 100), 0)]:
+                expected = czi_document.read(roi=roi, scene=scene, background_pixel=(1, 0, 0))
+                actual = czi_document.read(roi=roi, scene=scene, background_pixel=(1, 0, 0), pyramid_layer=0)
+                np.testing.assert_array_equal(actual, expected)
+
+            with pytest.raises(ValueError):
+                czi_document.read(pyramid_layer=1)
+            with pytest.raises(ValueError):
+                czi_document.read(pyramid_layer=0, zoom=0.5)
+
+
+def test_cache_statistics() -> None:
+    """Integration tests for the statistics of the subblock cache"""
+    data = np.random.randint(0, 255, (100, 400, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path, compression_options="zstd0:ExplicitLevel=1") as czi_document:
+            for x in range(0, 400, 100):
+                czi_document.write(data[:, x : x + 100], location=(x, 0))
+        with open_czi(czi_path, cache_options=CacheOptions(CacheType.Standard, None, 2)) as czi_document:
+            czi_document.read()
+            cache_info = czi_document.get_cache_info()
+            assert (cache_info.hits, cache_info.misses, cache_info.evictions) == (0, 4, 2)
+            assert cache_info.bytes_from_cache == 0
+            assert cache_info.bytes_read_from_stream > 0
+
+            czi_document.read(roi=(200, 0, 200, 100))
+            cache_info = czi_document.get_cache_info()
+            assert (cache_info.hits, cache_info.misses, cache_info.evictions) == (2, 4, 2)
+            assert cache_info.bytes_from_cache == 2 * 100 * 100
+            assert cache_info.decode_time_saved > 0
+
+            czi_document.reset_cache_stats()
+            cache_info = czi_document.get_cache_info()
+            assert (cache_info.hits, cache_info.misses, cache_info.evictions) == (0, 0, 0)
+            assert (cache_info.bytes_from_cache, cache_info.bytes_read_from_stream) == (0, 0)
+            assert cache_info.decode_time_saved == 0
+            assert cache_info.elements_count == 2
+
+        with open_czi_pool(czi_path, 2, cache_options=CacheOptions(CacheType.Standard, None, None)) as pool:
+            with pool.reader() as first_reader, pool.reader() as second_reader:
+                first_reader.read()
+                second_reader.read()
+            cache_info = pool.get_cache_info()
+            assert (cache_info.hits, cache_info.misses) == (4, 4)
+            pool.reset_cache_stats()
+            assert pool.get_cache_info().hits == 0
+
+
+@pytest.mark.parametrize("prefetch, max_bytes", [(0, None), (3, None), (2, 1)])
+def test_iter_tiles(prefetch: int, max_bytes: Optional[int]) -> None:
+    """Integration tests for iterating over overlapping tiles with prefetch"""
+    data = np.random.randint(0, 255, (300, 250, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            tiles = list(czi_document.iter_tiles((128, 100), (28, 20), prefetch=prefetch, max_bytes=max_bytes))
+            assert [tile for tile, _ in tiles] == [
+                (x, y, min(100, 250 - x), min(128, 300 - y)) for y in (0, 100, 200) for x in (0, 80, 160)
+            ]
+            for (x, y, w, h), pixel_data in tiles:
+                np.testing.assert_array_equal(pixel_data, data[y : y + h, x : x + w])
+
+            tiles = czi_document.iter_tiles((10, 10), roi=(5, 5, 20, 20), zoom=0.5, prefetch=prefetch)
+            assert next(tiles)[1].shape == (5, 5, 3)
+            tiles.close()
+
+            with pytest.raises(ValueError):
+                next(czi_document.iter_tiles((10, 10), (10, 0), prefetch=prefetch))
+
+        # the tile_size of the writer has the same (height, width) order
+        czi_path = os.path.join(temp_directory, "tiled.czi")
+        with create_czi(czi_path, tile_size=(128, 100)) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            index = czi_document.subblock_index()
+            subblocks = sorted(zip(index["y"], index["x"], index["height"], index["width"]))
+            tiles = sorted((y, x, h, w) for (x, y, w, h), _ in czi_document.iter_tiles((128, 100), prefetch=prefetch))
+            assert tiles == subblocks
+
+
+def test_read_composite() -> None:
+    """Integration tests for reading the multi-channel composite with the stored and given display settings"""
+    gray8 = np.random.randint(0, 255, (40, 60, 1), dtype=np.uint8)
+    gray16 = np.random.randint(0, 65535, (40, 60, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(gray8, plane={"C": 0})
+            czi_document.write(gray16, plane={"C": 1})
+            czi_document.write_metadata(
+                display_settings={
+                    0: ChannelDisplaySettingsDataClass(
+                        True, TintingMode.Color, Rgb8Color(np.uint8(255), np.uint8(0), np.uint8(0)), 0.0, 1.0
+                    ),
+                    1: ChannelDisplaySettingsDataClass(
+                        True, TintingMode.Color, Rgb8Color(np.uint8(0), np.uint8(255), np.uint8(0)), 0.0, 1.0
+                    ),
+                }
+            )
+        with open_czi(czi_path) as czi_document:
+            composite = czi_document.read_composite()
+            assert composite.shape == (40, 60, 3)
+            assert composite.dtype == np.uint8
+            np.testing.assert_array_equal(composite[:, :, 0], 0)
+            np.testing.assert_array_equal(composite[:, :, 2], gray8[:, :, 0])
+            np.testing.assert_allclose(composite[:, :, 1], gray16[:, :, 0] >> 8, atol=1)
+            np.testing.assert_array_equal(
+                czi_document.read_composite(roi=(10, 5, 20, 30), num_threads=2), composite[5:35, 10:30]
+            )
+            assert czi_document.read_composite(zoom=0.5).shape == (20, 30, 3)
+
+            composite = czi_document.read_composite(
+                display_settings={
+                    0: ChannelDisplaySettingsDataClass(
+                        False, TintingMode.none, Rgb8Color(np.uint8(0), np.uint8(0), np.uint8(0)), 0.0, 1.0
+                    ),
+                    1: ChannelDisplaySettingsDataClass(
+                        True, TintingMode.Color, Rgb8Color(np.uint8(0), np.uint8(0), np.uint8(255)), 0.25, 0.75
+                    ),
+                }
+            )
+            expected = np.clip((gray16[:, :, 0] / 65535 - 0.25) / 0.5, 0, 1) * 255
+            np.testing.assert_allclose(composite[:, :, 0], expected, atol=1)
+            np.testing.assert_array_equal(composite[:, :, 1:], 0)
+            np.testing.assert_array_equal(czi_document.read_composite(display_settings={}), 0)
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(gray8)
+        with open_czi(czi_path) as czi_document:
+            with pytest.raises(ValueError):
+                czi_document.read_composite()
+
+
+def test_thumbnail() -> None:
+    """Integration tests for creating a thumbnail from the pyramid of a document without attachments"""
+    data = np.random.randint(0, 255, (2, 100, 300, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            for channel in range(2):
+                czi_document.write(data[channel], plane={"C": channel})
+        with open_czi(czi_path) as czi_document:
+            expected = data[:, np.arange(25) * 100 // 25][:, :, np.arange(75) * 300 // 75]
+            np.testing.assert_array_equal(czi_document.thumbnail((75, 75)), expected[0])
+            np.testing.assert_array_equal(czi_document.thumbnail((75, 75), source="pyramid"), expected[0])
+            np.testing.assert_array_equal(czi_document.thumbnail((75, 75), channels=[1, 0]), expected[::-1])
+            np.testing.assert_array_equal(czi_document.thumbnail((1000, 1000)), data[0])
+
+            for source in ["thumbnail", "label", "invalid"]:
+                with pytest.raises(ValueError):
+                    czi_document.thumbnail(source=source)
+
+
+@pytest.mark.parametrize(
+    "cache_options",
+    [None, CacheOptions(CacheType.Standard, None, None), CacheOptions(CacheType.Standard, 100000, 3)],
+)
+def test_reader_pool_concurrent_reads(cache_options: Optional[CacheOptions]) -> None:
+    """Stress tests for many threads reading concurrently through a reader pool"""
+    rng = np.random.default_rng(42)
+    data = rng.integers(0, 255, (400, 500, 3), dtype=np.uint8)
+    rois = [
+        (int(x), int(y), int(w), int(h))
+        for x, y, w, h in zip(
+            rng.integers(0, 400, 200), rng.integers(0, 300, 200), rng.integers(1, 100, 200), rng.integers(1, 100, 200)
+        )
+    ]
+    in_use: Set[int] = set()
+    in_use_lock = threading.Lock()
+
+    def read_exclusively(roi: Tuple[int, int, int, int]) -> np.ndarray:
+        with pool.reader() as reader:
+            with in_use_lock:
+                assert id(reader) not in in_use
+                in_use.add(id(reader))
+            try:
+                return reader.read(roi=roi)
+            finally:
+                with in_use_lock:
+                    in_use.remove(id(reader))
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(
+            czi_path, compression_options="zstd1:ExplicitLevel=1;PreProcess=HiLoByteUnpack"
+        ) as czi_document:
+            for y, x in itertools.product(range(0, 400, 100), range(0, 500, 100)):
+                czi_document.write(data[y : y + 100, x : x + 100], location=(x, y))
+        with open_czi_pool(czi_path, pool_size=4, cache_options=cache_options) as pool:
+            assert pool.pool_size == 4
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(read_exclusively, rois))
+                pool_results = list(executor.map(lambda roi: pool.read(roi=roi), rois))
+    for (x, y, w, h), result, pool_result in zip(rois, results, pool_results):
+        np.testing.assert_array_equal(result, data[y : y + h, x : x + w])
+        np.testing.assert_array_equal(pool_result, data[y : y + h, x : x + w])
+
+
+def test_reader_pool_checkout() -> None:
+    """Integration tests for checking out readers of a reader pool"""
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(np.zeros((10, 10, 1), dtype=np.uint8))
+        with pytest.raises(ValueError):
+            with open_czi_pool(czi_path, pool_size=0):
+                pass
+        with open_czi_pool(czi_path, pool_size=1) as pool:
+            with pool.reader() as reader:
+                assert reader.total_bounding_rectangle == (0, 0, 10, 10)
+                with pytest.raises(TimeoutError):
+                    with pool.reader(timeout=0.01):
+                        pass
+            with pool.reader(timeout=0.01) as other_reader:
+                assert other_reader is reader
+
+
+def test_reader_pool_close_releases_file() -> None:
+    """Integration tests for the file of a reader pool being closed along with the last reader using it"""
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(np.zeros((10, 10, 1), dtype=np.uint8))
+        with open_czi_pool(czi_path, pool_size=3) as pool:
+            pool.read()
+            assert _count_open_handles(czi_path) in (None, 1)
+            with open_czi(czi_path) as czi_document:
+                sibling = czi_document._create_sibling()
+            # the stream is shared with the sibling, which keeps it open
+            assert _count_open_handles(czi_path) in (None, 2)
+            sibling.close()
+            with pytest.raises(RuntimeError):
+                sibling._create_sibling()
+        assert _count_open_handles(czi_path) in (None, 0)
+
+
+def _count_open_handles(path: str) -> Optional[int]:
+    """Returns the number of file descriptors of this process referring to path, None if it cannot be determined"""
+    if not os.path.isdir("/proc/self/fd"):
+        return None
+    real_path = os.path.realpath(path)
+    count = 0
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            count += os.readlink(os.path.join("/proc/self/fd", fd)) == real_path
+        except OSError:
+            pass
+    return count
+
+
+def test_async_reader() -> None:
+    """Integration tests for the asynchronous reads of AsyncCziReader"""
+    data = np.random.randint(0, 255, (300, 250, 3), dtype=np.uint8)
+
+    async def read_async(czi_path: str) -> None:
+        async with open_czi_async(czi_path, max_concurrency=3) as czi_document:
+            assert czi_document.reader.total_bounding_rectangle == (0, 0, 250, 300)
+            results = await asyncio.gather(
+                czi_document.read(),
+                czi_document.read(roi=(10, 20, 30, 40)),
+                czi_document.read_many([(0, 0, 10, 10), (5, 5, 20, 20)]),
+            )
+            np.testing.assert_array_equal(results[0], data)
+            np.testing.assert_array_equal(results[1], data[20:60, 10:40])
+            np.testing.assert_array_equal(results[2][1], data[5:25, 5:25])
+
+            tiles = [tile async for tile in czi_document.iter_tiles((128, 100), roi=(0, 0, 250, 300))]
+            assert [tile for tile, _ in tiles] == [
+                (x, y, min(100, 250 - x), min(128, 300 - y)) for y in (0, 128, 256) for x in (0, 100, 200)
+            ]
+            for (x, y, w, h), pixel_data in tiles:
+                np.testing.assert_array_equal(pixel_data, data[y : y + h, x : x + w])
+
+            for prefetch, max_bytes in [(None, None), (0, None), (3, 1)]:
+                tiles = [
+                    tile
+                    async for tile in czi_document.iter_tiles(
+                        (128, 100), (28, 20), prefetch=prefetch, max_bytes=max_bytes
+                    )
+                ]
+                assert [tile for tile, _ in tiles] == [
+                    (x, y, min(100, 250 - x), min(128, 300 - y)) for y in (0, 100, 200) for x in (0, 80, 160)
+                ]
+                for (x, y, w, h), pixel_data in tiles:
+                    np.testing.assert_array_equal(pixel_data, data[y : y + h, x : x + w])
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        asyncio.run(read_async(czi_path))
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_async_iter_tiles_computes_size_once(monkeypatch: pytest.MonkeyPatch, prefetch: int) -> None:
+    """Tests that AsyncCziReader.iter_tiles computes the size of each tile once, with both byte budgets"""
+    data = np.random.randint(0, 255, (300, 250, 3), dtype=np.uint8)
+    original_get_read_nbytes = CziReader._get_read_nbytes
+    sized_rois: List[Any] = []
+
+    def recording_get_read_nbytes(self: CziReader, roi: Any, *args: Any, **kwargs: Any) -> int:
+        sized_rois.append(roi)
+        return original_get_read_nbytes(self, roi, *args, **kwargs)
+
+    async def read_async(czi_path: str) -> None:
+        async with open_czi_async(czi_path, max_bytes=1) as czi_document:
+            tiles = [tile async for tile, _ in czi_document.iter_tiles((128, 100), prefetch=prefetch, max_bytes=1)]
+        assert sized_rois == tiles
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        monkeypatch.setattr(CziReader, "_get_read_nbytes", recording_get_read_nbytes)
+        asyncio.run(read_async(czi_path))
+
+
+@pytest.mark.parametrize("max_bytes, expected_max_concurrent_reads", [(None, 4), (10 * 10 * 3 * 2, 2), (1, 1)])
+def test_async_reader_limits(
+    monkeypatch: pytest.MonkeyPatch, max_bytes: Optional[int], expected_max_concurrent_reads: int
+) -> None:
+    """Integration tests for the concurrency limit and byte budget of AsyncCziReader"""
+    concurrent_reads = [0, 0]  # current, maximum
+    lock = threading.Lock()
+    barrier = threading.Barrier(expected_max_concurrent_reads, timeout=5)
+    original_read = CziReader.read
+    original_get_read_nbytes = CziReader._get_read_nbytes
+    size_threads: List[threading.Thread] = []
+
+    def recording_get_read_nbytes(self: CziReader, *args: Any, **kwargs: Any) -> int:
+        size_threads.append(threading.current_thread())
+        return original_get_read_nbytes(self, *args, **kwargs)
+
+    def counting_read(self: CziReader, *args: Any, **kwargs: Any) -> np.ndarray:
+        with lock:
+            concurrent_reads[0] += 1
+            concurrent_reads[1] = max(concurrent_reads)
+        try:
+            # wait for the expected number of reads to be running at the same time
+            barrier.wait()
+            return original_read(self, *args, **kwargs)
+        finally:
+            with lock:
+                concurrent_reads[0] -= 1
+
+    async def read_async(czi_path: str) -> None:
+        async with open_czi_async(czi_path, max_concurrency=4, max_bytes=max_bytes) as czi_document:
+            results = await asyncio.gather(*(czi_document.read(roi=(x, 0, 10, 10)) for x in range(0, 120, 10)))
+            assert czi_document._bytes_in_flight == 0
+        for x, result in zip(range(0, 120, 10), results):
+            assert result.shape == (10, 10, 3)
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(np.zeros((10, 120, 3), dtype=np.uint8))
+        monkeypatch.setattr(CziReader, "read", counting_read)
+        monkeypatch.setattr(CziReader, "_get_read_nbytes", recording_get_read_nbytes)
+        asyncio.run(read_async(czi_path))
+    assert concurrent_reads[1] == expected_max_concurrent_reads
+    # the sizes of the reads are only computed for the budget, and never on the event loop thread
+    assert len(size_threads) == (0 if max_bytes is None else 12)
+    assert threading.main_thread() not in size_threads
+
+
+def test_async_reader_cancellation() -> None:
+    """Integration tests for cancelling reads of AsyncCziReader"""
+
+    async def read_async(czi_path: str) -> None:
+        async with open_czi_async(czi_path, max_concurrency=1, max_bytes=100 * 100) as czi_document:
+            tasks = [asyncio.ensure_future(czi_document.read()) for _ in range(20)]
+            await asyncio.sleep(0)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # the budget is released by the executor, once the reads did finish or got removed
+            for _ in range(100):
+                if czi_document._bytes_in_flight == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert czi_document._bytes_in_flight == 0
+            assert (await czi_document.read()).shape == (100, 100, 1)
+
+            tiles = czi_document.iter_tiles((10, 10))
+            await tiles.__anext__()
+            await tiles.aclose()
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(np.zeros((100, 100, 1), dtype=np.uint8))
+        asyncio.run(read_async(czi_path))
+
+
+def _read_in_process(czi_document: CziReader, roi: Tuple[int, int, int, int]) -> Tuple[int, int, np.ndarray]:
+    """Reads roi in a worker process, returns the process id and the id of the native reader used as well"""
+    pixel_data = czi_document.read(roi=roi)
+    return os.getpid(), id(czi_document._czi_reader), pixel_data
+
+
+def test_reader_pickle() -> None:
+    """Integration tests for pickling a reader and using it in process pools"""
+    data = np.random.randint(0, 255, (100, 120, 3), dtype=np.uint8)
+    rois = [(x, y, 20, 20) for x, y in itertools.product(range(0, 100, 20), range(0, 80, 20))]
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path, cache_options=CacheOptions(CacheType.Standard, None, None)) as czi_document:
+            unpickled = pickle.loads(pickle.dumps(czi_document))
+            # the document is opened on first use only, and not by accessing other missing attributes
+            with pytest.raises(AttributeError):
+                unpickled._czi_readr  # pylint: disable=pointless-statement
+            assert "_czi_reader" not in unpickled.__dict__
+            np.testing.assert_array_equal(unpickled.read(), data)
+            assert unpickled._cache_options == czi_document._cache_options
+            assert _count_open_handles(czi_path) in (None, 2)
+
+            # the native reader shared by the unpickled readers is closed along with the last of them
+            other_unpickled = pickle.loads(pickle.dumps(czi_document))
+            assert other_unpickled.total_bounding_rectangle == czi_document.total_bounding_rectangle
+            assert other_unpickled._czi_reader is unpickled._czi_reader
+            unpickled.close()
+            unpickled.close()
+            np.testing.assert_array_equal(other_unpickled.read(), data)
+            other_unpickled.close()
+            assert _count_open_handles(czi_path) in (None, 1)
+
+            # or when the readers of the process are closed explicitly, the readers open the document again on use
+            unpickled = pickle.loads(pickle.dumps(czi_document))
+            unpickled.read()
+            close_process_readers()
+            assert _count_open_handles(czi_path) in (None, 1)
+            np.testing.assert_array_equal(unpickled.read(), data)
+            unpickled.close()
+            assert _count_open_handles(czi_path) in (None, 1)
+
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(_read_in_process, [czi_document] * len(rois), rois))
+        for (x, y, w, h), (_, _, pixel_data) in zip(rois, results):
+            np.testing.assert_array_equal(pixel_data, data[y : y + h, x : x + w])
+        # the document is opened once per worker process
+        native_readers: Dict[int, set] = {}
+        for pid, native_reader_id, _ in results:
+            native_readers.setdefault(pid, set()).add(native_reader_id)
+        assert all(len(ids) == 1 for ids in native_readers.values())
+
+
+@pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="fork is not supported on this platform")
+def test_reader_after_fork() -> None:
+    """Integration tests for using a reader inherited by a forked process"""
+    data = np.random.randint(0, 255, (100, 120, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+
+            def read_in_child() -> None:
+                # the inherited native reader has been invalidated and is replaced by one of the child process
+                assert "_czi_reader" not in czi_document.__dict__
+                np.testing.assert_array_equal(czi_document.read(), data)
+
+            process = multiprocessing.get_context("fork").Process(target=read_in_child)
+            process.start()
+            process.join()
+            assert process.exitcode == 0
+            np.testing.assert_array_equal(czi_document.read(), data)
+
+
+def test_subblock_index() -> None:
+    """Integration tests for the subblock index"""
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path, compression_options="zstd0:ExplicitLevel=1") as czi_document:
+            for t, c in itertools.product(range(2), range(3)):
+                for x in [0, 100]:
+                    czi_document.write(
+                        np.zeros((50, 100), dtype=np.uint16), plane={"T": t, "C": c}, location=(x, 10 * t)
+                    )
+        with open_czi(czi_path) as czi_document:
+            index = czi_document.subblock_index()
+            assert index.shape == (12,)
+            # only the dimensions used by the document are present
+            assert {"Z", "C", "T", "S"} <= set(index.dtype.names)
+            assert not {"R", "I", "H", "V", "B"} & set(index.dtype.names)
+            assert index.dtype.itemsize < 100
+            assert sorted(zip(index["T"], index["C"], index["x"])) == [
+                (t, c, x) for t, c, x in itertools.product(range(2), range(3), [0, 100])
+            ]
+            np.testing.assert_array_equal(index["index"], np.arange(12))
+            np.testing.assert_array_equal(index["y"], 10 * index["T"])
+            assert np.all(index["width"] == 100) and np.all(index["height"] == 50)
+            assert np.all(index["physical_width"] == 100) and np.all(index["physical_height"] == 50)
+            assert np.all(index["pixel_type"] == czi_document.PIXEL_TYPES["Gray16"])
+            assert np.all(index["compression"] == 5)
+            assert np.all(index["pyramid_layer"] == 0)
+            assert len(np.unique(index["file_position"])) == 12
+
+
+def test_query_subblocks() -> None:
+    """Integration tests for looking up the subblocks intersecting a roi"""
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            for i in range(200):
+                # tiles of various sizes, some of them spanning many others
+                size = (400, 300) if i % 40 == 0 else tuple(rng.integers(1, 60, 2))
+                location = tuple(int(value) for value in rng.integers(-100, 500, 2))
+                czi_document.write(
+                    np.zeros((*size, 1), dtype=np.uint8),
+                    plane={"C": i % 2, "T": i % 3},
+                    location=location,
+                    scene=i // 2 % 2,
+                )
+        with open_czi(czi_path) as czi_document:
+            index = czi_document.subblock_index()
+            for roi, plane in [
+                ((0, 0, 100, 100), {}),
+                ((-50, 20, 7, 300), {"C": 1}),
+                ((250, 250, 1, 1), {"C": 0, "T": 2}),
+                ((-200, -200, 1000, 1000), {"T": 1}),
+                ((10, 10, 0, 10), {}),
+            ]:
+                expected = index[
+                    (index["x"] < roi[0] + roi[2])
+                    & (index["x"] + index["width"] > roi[0])
+                    & (index["y"] < roi[1] + roi[3])
+                    & (index["y"] + index["height"] > roi[1])
+                    & np.all([index[dim] == value for dim, value in plane.items()], axis=0)
+                    & (roi[2] > 0)
+                ]
+                np.testing.assert_array_equal(czi_document.query_subblocks(roi, plane), expected)
+
+            subblocks = czi_document.query_subblocks(plane={"C": 1}, scene=1)
+            assert len(subblocks) == 50
+            assert np.all(subblocks["S"] == 1) and np.all(subblocks["C"] == 1)
+            with pytest.raises(ValueError):
+                czi_document.query_subblocks(scene=2)
+
+
+@pytest.mark.parametrize("compression_options", [None, "zstd0:ExplicitLevel=1"])
+def test_read_subblock(compression_options: Optional[str]) -> None:
+    """Integration tests for reading single subblocks"""
+    data = np.random.randint(0, 255, (3, 40, 60, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path, compression_options=compression_options) as czi_document:
+            for c in range(3):
+                # overlapping tiles, which would be composed by read
+                czi_document.write(data[c], plane={"C": c}, location=(10 * c, 0))
+        with open_czi(czi_path) as czi_document:
+            index = czi_document.subblock_index()
+            for record in index:
+                bitmap = czi_document.read_subblock(record["index"])
+                np.testing.assert_array_equal(bitmap, data[record["C"]])
+
+                payload = czi_document.read_subblock(record["index"], decode=False)
+                assert isinstance(payload, memoryview) and payload.readonly
+                assert (bytes(payload) == data[record["C"]].tobytes()) == (compression_options is None)
+
+            bitmaps = czi_document.read_subblocks(index["index"][::-1], num_threads=2)
+            for bitmap, c in zip(bitmaps, index["C"][::-1]):
+                np.testing.assert_array_equal(bitmap, data[c])
+            payloads = czi_document.read_subblocks(index["index"], decode=False, num_threads=2)
+            assert [bytes(payload) for payload in payloads] == [
+                bytes(czi_document.read_subblock(i, decode=False)) for i in index["index"]
+            ]
+
+            with pytest.raises(ValueError):
+                czi_document.read_subblock(len(index))
+            with pytest.raises(ValueError):
+                czi_document.read_subblocks([0], num_threads=0)
+
+
+def test_to_dask() -> None:
+    """Integration tests for the dask array adapter"""
+    dask = pytest.importorskip("dask")
+    data = np.random.randint(0, 65535, (2, 3, 250, 320, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path, compression_options="zstd0:ExplicitLevel=1") as czi_document:
+            for t, c in np.ndindex(*data.shape[:2]):
+                for y, x in itertools.product(range(0, 250, 100), range(0, 320, 128)):
+                    czi_document.write(data[t, c, y : y + 100, x : x + 128], plane={"T": t, "C": c}, location=(x, y))
+        with open_czi(czi_path) as czi_document:
+            array = czi_document.to_dask(dims="TCYX")
+            # the chunks are aligned to the subblocks
+            assert array.chunks == ((1, 1), (1, 1, 1), (100, 100, 50), (128, 128, 64), (1,))
+            assert array.dtype == np.uint16
+            np.testing.assert_array_equal(array.compute(scheduler="threads"), data)
+
+            array = czi_document.to_dask(dims="CZYX", chunks=(60, 200), roi=(10, 20, 300, 200), plane={"T": 1})
+            assert array.chunks == ((1, 1, 1), (1,), (60, 60, 60, 20), (200, 100), (1,))
+            expected = data[1, :, np.newaxis, 20:220, 10:310]
+            np.testing.assert_array_equal(array.compute(scheduler="threads"), expected)
+
+            # the array does not refer to the native reader, it can be pickled and computed elsewhere
+            array = pickle.loads(pickle.dumps(array[:, :, 50:150, 50:150]))
+            np.testing.assert_array_equal(array.compute(scheduler="sync"), expected[:, :, 50:150, 50:150])
+
+            with pytest.raises(ValueError):
+                czi_document.to_dask(chunks=(0, 10))
+            with dask.config.set(scheduler="sync"):
+                assert czi_document.to_dask(dims="YX").compute().shape == (250, 320, 1)
+
+
+def test_to_dask_jittered_subblocks() -> None:
+    """Integration tests for the chunks of the dask array adapter with subblocks jittered between planes"""
+    pytest.importorskip("dask")
+    data = np.random.randint(0, 65535, (2, 2, 256, 256, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            for t, c in np.ndindex(*data.shape[:2]):
+                # the tiles of the time points are shifted by a few pixels, the tiles of channel 1 are larger
+                jitter, tile_size = 3 * t, 128 if c == 0 else 256
+                for y, x in itertools.product(range(0, 256, tile_size), range(0, 256, tile_size)):
+                    tile = data[t, c, y : y + tile_size, x : x + tile_size]
+                    czi_document.write(tile, plane={"T": t, "C": c}, location=(x + jitter, y + jitter))
+        with open_czi(czi_path) as czi_document:
+            # the chunks are aligned to the subblocks of channel 0 only, without slivers between the time points
+            array = czi_document.to_dask(dims="TYX", roi=(0, 0, 259, 259), plane={"C": 0})
+            assert array.chunks == ((1, 1), (128, 131), (128, 131), (1,))
+            np.testing.assert_array_equal(array[0, :256, :256].compute(scheduler="sync"), data[0, 0])
+            np.testing.assert_array_equal(array[1, 3:, 3:].compute(scheduler="sync"), data[1, 0])
+
+            array = czi_document.to_dask(dims="TYX", roi=(0, 0, 259, 259), plane={"C": 1})
+            assert array.chunks == ((1, 1), (259,), (259,), (1,))
+
+
+def test_to_dask_readers() -> None:
+    """Integration tests for the documents opened for computing the chunks of dask arrays"""
+    pytest.importorskip("dask")
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(np.full((20, 30, 1), 1, dtype=np.uint8))
+        with open_czi(czi_path) as czi_document:
+            array = czi_document.to_dask(dims="YX")
+        np.testing.assert_array_equal(array.compute(scheduler="sync"), 1)
+
+        # the document is opened again once the file was rewritten
+        with create_czi(czi_path, exist_ok=True) as czi_document:
+            czi_document.write(np.full((20, 40, 1), 2, dtype=np.uint8))
+        with open_czi(czi_path) as czi_document:
+            array = czi_document.to_dask(dims="YX")
+        np.testing.assert_array_equal(array.compute(scheduler="sync"), 2)
+        assert array.shape == (20, 40, 1)
+        np.testing.assert_array_equal(array.compute(scheduler="threads", num_workers=3), 2)
+        assert _count_open_handles(czi_path) in (None, 1, 2, 3)
+
+        close_dask_readers()
+        assert _count_open_handles(czi_path) in (None, 0)
+
+        # the documents of a thread are closed when it exits
+        thread = threading.Thread(target=array.compute, kwargs={"scheduler": "sync"})
+        thread.start()
+        thread.join()
+        assert _count_open_handles(czi_path) in (None, 0)
+
+        # a thread keeps only its most recently used documents open
+        czi_paths = []
+        for index in range(CziReader.DASK_READERS_PER_THREAD + 2):
+            czi_paths.append(os.path.join(temp_directory, f"test{index}.czi"))
+            with create_czi(czi_paths[-1]) as czi_document:
+                czi_document.write(np.full((20, 30, 1), index, dtype=np.uint8))
+            with open_czi(czi_paths[-1]) as czi_document:
+                np.testing.assert_array_equal(czi_document.to_dask(dims="YX").compute(scheduler="sync"), index)
+        open_handles = [_count_open_handles(czi_path) for czi_path in czi_paths]
+        assert open_handles in ([None] * len(czi_paths), [0, 0] + [1] * CziReader.DASK_READERS_PER_THREAD)
+        close_dask_readers()
+        assert all(_count_open_handles(czi_path) in (None, 0) for czi_path in czi_paths)
+
+
+@pytest.mark.parametrize("num_threads", [2, 3, 7])
+@pytest.mark.parametrize("compression_options", [None, "zstd1:ExplicitLevel=1;PreProcess=HiLoByteUnpack"])
+def test_read_num_threads(num_threads: int, compression_options: Optional[str]) -> None:
+    """Integration tests for read composing the roi with several threads"""
+    data = np.random.randint(0, 255, (301, 250, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path, compression_options=compression_options) as czi_document:
+            # several overlapping tiles, so that subblocks span several stripes
+            czi_document.write(data[:200, :200], location=(0, 0))
+            czi_document.write(data[150:, 100:], location=(100, 150))
+            czi_document.write(data[:120, 120:], location=(120, 0))
+        with open_czi(czi_path) as czi_document:
+            for roi in [None, (10, 20, 230, 7), (-20, -10, 300, 330)]:
+                expected = czi_document.read(roi=roi, background_pixel=(0.5, 0.5, 0.5))
+                actual = czi_document.read(roi=roi, background_pixel=(0.5, 0.5, 0.5), num_threads=num_threads)
+                np.testing.assert_array_equal(actual, expected)
+
+            expected = czi_document.read(zoom=0.3)
+            np.testing.assert_array_equal(czi_document.read(zoom=0.3, num_threads=num_threads), expected)
+
+
+def test_read_num_threads_reuses_threads() -> None:
+    """Integration tests for the native threads composing reads with several threads, which are kept for later reads"""
+    if not os.path.isdir("/proc/self/task"):
+        pytest.skip("The threads of the process are not listed")
+    data = np.random.randint(0, 255, (2000, 1500, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path, compression_options="zstd1:ExplicitLevel=1") as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            recording, stopped = threading.Event(), threading.Event()
+            seen_threads: Set[str] = set()
+
+            def record_threads() -> None:
+                while not stopped.is_set():
+                    if recording.is_set():
+                        seen_threads.update(os.listdir("/proc/self/task"))
+
+            recorder = threading.Thread(target=record_threads)
+            recorder.start()
+            try:
+                czi_document.read(num_threads=4)
+                threads = set(os.listdir("/proc/self/task"))
+                recording.set()
+                for _ in range(5):
+                    np.testing.assert_array_equal(czi_document.read(num_threads=4), data)
+                    np.testing.assert_array_equal(czi_document.read_stack(dims="CYX", num_threads=4)[0], data)
+            finally:
+                stopped.set()
+                recorder.join()
+            assert seen_threads <= threads
+
+
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_read_stack(num_threads: int) -> None:
+    """Integration tests for read_stack compared to reading each plane"""
+    data = np.random.randint(0, 65535, (2, 3, 2, 30, 40, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            for t, z, c in np.ndindex(*data.shape[:3]):
+                czi_document.write(data[t, z, c], plane={"T": t, "Z": z, "C": c})
+        with open_czi(czi_path) as czi_document:
+            stack = czi_document.read_stack(num_threads=num_threads)
+            np.testing.assert_array_equal(stack, data)
+
+            stack = czi_document.read_stack(dims="CZYX", roi=(5, 10, 20, 15), plane={"T": 1}, num_threads=num_threads)
+            assert stack.shape == (2, 3, 15, 20, 1)
+            np.testing.assert_array_equal(stack, data[1, :, :, 10:25, 5:25].transpose(1, 0, 2, 3, 4))
+
+            # dimensions not present in the document are of size 1
+            stack = czi_document.read_stack(dims="VTYX", zoom=0.5, num_threads=num_threads)
+            assert stack.shape[:2] == (1, 2)
+            np.testing.assert_array_equal(stack[0, 1], czi_document.read(plane={"T": 1}, zoom=0.5))
+
+
+def test_read_stack_non_zero_start() -> None:
+    """Integration tests for read_stack of dimensions not starting at 0"""
+    data = np.random.randint(0, 65535, (3, 30, 40, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            for z in range(data.shape[0]):
+                czi_document.write(data[z], plane={"Z": z + 2})
+        with open_czi(czi_path) as czi_document:
+            assert czi_document.dimension_bounds["Z"] == (2, 5)
+            np.testing.assert_array_equal(czi_document.read_stack(dims="ZYX"), data)
+
+
+def test_read_stack_mixed_pixel_types() -> None:
+    """Integration tests for read_stack of channels with different pixel types"""
+    gray16 = np.random.randint(0, 65535, (30, 40, 1), dtype=np.uint16)
+    gray8 = np.random.randint(0, 255, (30, 40, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(gray16, plane={"C": 0})
+            czi_document.write(gray8, plane={"C": 1})
+        with open_czi(czi_path) as czi_document:
+            with pytest.raises(ValueError):
+                czi_document.read_stack(dims="CYX")
+            stack = czi_document.read_stack(dims="CYX", pixel_type="Gray16")
+            np.testing.assert_array_equal(stack[0], gray16)
+            np.testing.assert_array_equal(stack[1], czi_document.read(plane={"C": 1}, pixel_type="Gray16"))
+            np.testing.assert_array_equal(czi_document.read_stack(dims="YX", plane={"C": 1}), gray8)
+
+
+@pytest.mark.parametrize("dims", ["TZC", "TZCXY", "TTYX", "SYX", "YXC"])
+def test_read_stack_raises_error_on_invalid_dims(dims: str) -> None:
+    """Integration tests for read_stack with invalid dims"""
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(np.zeros((10, 10, 1), dtype=np.uint8))
+        with open_czi(czi_path) as czi_document:
+            with pytest.raises(ValueError):
+                czi_document.read_stack(dims=dims)
+
+
+def test_read_out() -> None:
+    """Integration tests for read composing into a caller-provided array"""
+    data = np.random.randint(0, 65535, (100, 120, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            out = np.zeros((40, 50, 1), dtype=np.uint16)
+            result = czi_document.read(roi=(10, 20, 50, 40), out=out)
+            assert result is out
+            np.testing.assert_array_equal(out, data[20:60, 10:60])
+
+            # out may be a view with strided rows
+            canvas = np.zeros((100, 200, 1), dtype=np.uint16)
+            view = canvas[10:50, 30:80]
+            czi_document.read(roi=(10, 20, 50, 40), out=view)
+            np.testing.assert_array_equal(canvas[10:50, 30:80], data[20:60, 10:60])
+            assert not canvas[:10].any() and not canvas[:, :30].any() and not canvas[:, 80:].any()
+
+            # zoom uses the size reported by the library
+            zoomed = czi_document.read(zoom=0.5)
+            out = np.empty_like(zoomed)
+            czi_document.read(zoom=0.5, out=out)
+            np.testing.assert_array_equal(out, zoomed)
+
+
+@pytest.mark.parametrize(
+    "out",
+    [
+        np.zeros((40, 50, 1), dtype=np.uint8),
+        np.zeros((40, 51, 1), dtype=np.uint16),
+        np.zeros((40, 50, 3), dtype=np.uint16),
+        np.zeros((40, 100, 1), dtype=np.uint16)[:, ::2],
+        np.zeros((1, 40, 50), dtype=np.uint16).transpose(1, 2, 0),
+    ],
+)
+def test_read_out_raises_error(out: np.ndarray) -> None:
+    """Integration tests for read with a caller-provided array not matching the result"""
+    data = np.zeros((100, 120, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            with pytest.raises(ValueError):
+                czi_document.read(roi=(10, 20, 50, 40), out=out)
+
+
+def test_read_out_raises_error_on_readonly_array() -> None:
+    """Integration tests for read with a read-only caller-provided array"""
+    data = np.zeros((100, 120, 1), dtype=np.uint16)
+    out = np.zeros((40, 50, 1), dtype=np.uint16)
+    out.flags.writeable = False
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            with pytest.raises(ValueError):
+                czi_document.read(roi=(10, 20, 50, 40), out=out)
+
+
+def test_read_does_not_copy_bitmap() -> None:
+    """Integration tests checking that the bitmap composed by libCZI is handed over to numpy without a copy"""
+    data = np.random.randint(0, 65535, (2000, 2000, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            czi_document.write(data)
+        with open_czi(czi_path) as czi_document:
+            czi_document.read(roi=(0, 0, 10, 10))
+            tracemalloc.start()
+            try:
+                result = czi_document.read()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    # The only allocation of the size of the plane is the bitmap allocated by libCZI (which is not traced), any
+    # copy made by numpy would be traced.
+    assert peak < data.nbytes // 10
+    assert result.base is not None and not result.flags.owndata
+    np.testing.assert_array_equal(result, data)
+
+
 CZI_DOCUMENT_TEST_ERROR1 = os.path.join(working_dir, "../test_data", "c1_bgr96float.czi")
 
 CZI_DOCUMENT_TEST_ERROR2 = os.path.join(working_dir, "../test_data", "c1_gray32float.czi")
@@ -561,3 +1590,17 @@ def test_read_raises_error_on_Gray32Float() -> None:
     with pytest.raises(RuntimeError, match=expected_error_message):
         with open_czi(CZI_DOCUMENT_TEST_ERROR2) as czi_document:
             czi_document.read()
+
+
+def test_dimension_bounds() -> None:
+    """Integration tests for reading the dimension bounds"""
+    with tempfile.TemporaryDirectory() as temp_directory:
+        czi_path = os.path.join(temp_directory, "test.czi")
+        with create_czi(czi_path) as czi_document:
+            for c in (1, 2):
+                for t in range(3):
+                    czi_document.write(np.zeros((5, 5, 1), dtype=np.uint8), plane={"C": c, "T": t})
+        with open_czi(czi_path) as czi_document:
+            assert czi_document.dimension_bounds == {"C": (1, 3), "T": (0, 3), "Z": (0, 1), "S": (0, 1)}
+            assert czi_document.total_bounding_box["C"] == (0, 2)
+            assert czi_document.read(plane={"C": 2, "T": 1}).shape == (5, 5, 1)
@@ -1,8 +1,11 @@
 """Module implementing integration tests for the write function of the CziWriter class"""
 
 import os
+import sys
 import tempfile
+import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from os.path import abspath, dirname, join
 from typing import Dict, Iterator, List, Optional, Tuple, Union
 from unittest.mock import MagicMock, patch
@@ -332,3 +335,224 @@ def test_write_incontiguous() -> None:
             actual = czi_document.read()
 
         np.testing.assert_array_equal(expected, actual)
+
+
+def test_write_concurrently() -> None:
+    """Tests that tiles written concurrently from multiple threads are all written correctly to czi."""
+    # Arrange
+    tiles = np.random.randint(0, 65535, (16, 64, 64, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as td:
+        target_path = join(td, "test.czi")
+        # Act
+        with create_czi(target_path, compression_options="zstd1:ExplicitLevel=1") as test_czi:
+            with ThreadPoolExecutor(4) as executor:
+                results = list(
+                    executor.map(lambda index: test_czi.write(tiles[index], location=(index * 64, 0)), range(16))
+                )
+        # Assert
+        assert all(results)
+        with open_czi(target_path) as czi_document:
+            actual = czi_document.read()
+        np.testing.assert_array_equal(np.concatenate(list(tiles), axis=1), actual)
+
+
+@pytest.mark.parametrize("compression_options", ["zstd1:ExplicitLevel=3", "zstd0:", None])
+def test_write_with_compression_threads_matches_serial_write(compression_options: Optional[str]) -> None:
+    """Tests that a document written with compression threads is the same as without, apart from the random file
+    GUIDs in the file header."""
+    # Arrange
+    data = np.random.randint(0, 4096, (1200, 5000, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as td:
+        contents = []
+        for compression_threads in (None, 3):
+            target_path = join(td, f"test_{compression_threads}.czi")
+            # Act
+            with patch("pylibCZIrw.czi.uuid.uuid4", return_value=uuid.UUID(int=0)):
+                with create_czi(
+                    target_path, compression_options=compression_options, compression_threads=compression_threads
+                ) as test_czi:
+                    test_czi.write(data)
+                    test_czi.write(data[:100, :100], location=(0, 1200), plane={"C": 1})
+            with open(target_path, "rb") as czi_file:
+                contents.append(bytearray(czi_file.read()))
+        # Assert
+        for content in contents:
+            content[48:80] = bytes(32)
+        assert contents[0] == contents[1]
+        with open_czi(target_path) as czi_document:
+            np.testing.assert_array_equal(czi_document.read(roi=(0, 0, 5000, 1200), plane={"C": 0}), data)
+
+
+def test_write_with_invalid_compression_threads() -> None:
+    """Tests that a number of compression threads smaller than 1 is rejected."""
+    with tempfile.TemporaryDirectory() as td:
+        with pytest.raises(ValueError, match="compression_threads"):
+            with create_czi(join(td, "test.czi"), compression_threads=0):
+                pass
+
+
+@pytest.mark.parametrize("compression_threads", [None, 2])
+def test_write_in_background(compression_threads: Optional[int]) -> None:
+    """Tests that tiles written in the background are all written correctly to czi, also with a queue of less than
+    a tile and when the written array is reused right after each write."""
+    # Arrange
+    tiles = np.random.randint(0, 65535, (16, 64, 64, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as td:
+        target_path = join(td, "test.czi")
+        # Act
+        with create_czi(
+            target_path,
+            compression_options="zstd1:ExplicitLevel=1",
+            compression_threads=compression_threads,
+            max_queued_bytes=3 * tiles[0].nbytes,
+        ) as test_czi:
+            futures = [test_czi.write(tile, location=(index * 64, 0)) for index, tile in enumerate(tiles[:8])]
+            test_czi.flush()
+            assert all(future.done() and future.result() for future in futures)
+            futures = []
+            buffer = np.empty_like(tiles[0])
+            for index, tile in enumerate(tiles[8:], 8):
+                buffer[...] = tile
+                futures.append(test_czi.write(buffer, location=(index * 64, 0)))
+        # Assert
+        assert all(future.result() for future in futures)
+        with open_czi(target_path) as czi_document:
+            actual = czi_document.read()
+        np.testing.assert_array_equal(np.concatenate(list(tiles), axis=1), actual)
+
+
+def test_write_in_background_surfaces_errors() -> None:
+    """Tests that the error of a background write is raised by its future and by flush, and that the other writes
+    are not affected."""
+    data = np.zeros((64, 64, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as td:
+        target_path = join(td, "test.czi")
+        with create_czi(target_path, max_queued_bytes=1 << 20) as test_czi:
+            failed = test_czi.write(data, compression_options="jpgxr:")
+            succeeded = test_czi.write(data, location=(64, 0))
+            with pytest.raises(ValueError, match="unsupported compression mode"):
+                test_czi.flush()
+            with pytest.raises(ValueError, match="unsupported compression mode"):
+                failed.result()
+            assert succeeded.result()
+            test_czi.flush()
+        with pytest.raises(ValueError, match="unsupported compression mode"):
+            with create_czi(target_path, exist_ok=True, max_queued_bytes=1 << 20) as test_czi:
+                test_czi.write(data, compression_options="jpgxr:")
+
+
+def test_close_raises_background_error_first() -> None:
+    """Tests that closing raises the error of a background write rather than a later error of closing the document,
+    which is chained to it, and that the document is closed in any case."""
+    data = np.zeros((64, 64, 1), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as td:
+        with pytest.raises(ValueError, match="unsupported compression mode") as error_info:
+            with create_czi(join(td, "test.czi"), max_queued_bytes=1 << 20) as test_czi:
+                native_writer = test_czi._czi_writer
+
+                def failing_close() -> None:
+                    native_writer.close()
+                    raise RuntimeError("closing failed")
+
+                test_czi._czi_writer = MagicMock(wraps=native_writer)
+                test_czi._czi_writer.close.side_effect = failing_close
+                test_czi.write(data, compression_options="jpgxr:")
+        assert isinstance(error_info.value.__context__, RuntimeError)
+        test_czi._czi_writer.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    "compression_options, compression_threads", [(None, None), ("zstd1:ExplicitLevel=1", None), (None, 2)]
+)
+def test_write_strided(compression_options: Optional[str], compression_threads: Optional[int]) -> None:
+    """Tests that parts of larger arrays (referred to without copying, also by compression threads), incontiguous
+    arrays and large arrays divided into several subblocks are written correctly to czi."""
+    # Arrange
+    data = np.random.randint(0, 65535, (1400, 4000, 1), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as td:
+        target_path = join(td, "test.czi")
+        # Act
+        with create_czi(
+            target_path, compression_options=compression_options, compression_threads=compression_threads
+        ) as test_czi:
+            test_czi.write(data[100:1300, 200:3800], plane={"C": 0})
+            test_czi.write(data[::2, ::3], plane={"C": 1})
+            test_czi.write(data[::-1, :, 0], plane={"C": 2})
+        # Assert
+        with open_czi(target_path) as czi_document:
+            np.testing.assert_array_equal(
+                czi_document.read(roi=(0, 0, 3600, 1200), plane={"C": 0}), data[100:1300, 200:3800]
+            )
+            np.testing.assert_array_equal(czi_document.read(roi=(0, 0, 1334, 700), plane={"C": 1}), data[::2, ::3])
+            np.testing.assert_array_equal(czi_document.read(roi=(0, 0, 4000, 1400), plane={"C": 2}), data[::-1])
+
+
+@pytest.mark.parametrize("compression_options", [None, "zstd1:ExplicitLevel=1"])
+def test_write_releases_borrowed_data(compression_options: Optional[str]) -> None:
+    """Tests that a write does not keep the (borrowed, not copied) memory of the data after it returned, so the data
+    can be modified and resized afterwards."""
+    # Arrange
+    data = np.random.randint(0, 65535, (1400, 4000, 1), dtype=np.uint16)
+    references = sys.getrefcount(data)
+    with tempfile.TemporaryDirectory() as td:
+        target_path = join(td, "test.czi")
+        with create_czi(target_path, compression_options=compression_options) as test_czi:
+            # Act
+            test_czi.write(data[100:200, 200:300])
+            test_czi.write(data, location=(0, 200))
+            # Assert
+            assert sys.getrefcount(data) == references
+            data.resize((10, 10, 1))
+
+
+@pytest.mark.parametrize(
+    "tile_size, retile_threshold, location, expected_subblocks",
+    [
+        ((512, 512), None, (0, 0), 2 * 3),
+        ((512, 512), None, (100, 400), 3 * 3),
+        ((256, 1024), None, (-100, -100), 4 * 3),
+        ("auto", None, (0, 0), 2 * 3),
+        ((512, 512), 1_000_000, (0, 0), 2 * 3),
+        ((512, 512), 10_000_000, (0, 0), 1),
+    ],
+)
+def test_write_tile_size(
+    tile_size: Union[Tuple[int, int], str],
+    retile_threshold: Optional[int],
+    location: Tuple[int, int],
+    expected_subblocks: int,
+) -> None:
+    """Tests that data is divided into subblocks along a grid of the tile size aligned to the origin of the plane."""
+    # Arrange
+    data = np.random.randint(0, 255, (700, 1200, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as td:
+        target_path = join(td, "test.czi")
+        # Act
+        with create_czi(target_path, tile_size=tile_size, retile_threshold=retile_threshold) as test_czi:
+            test_czi.write(data, location=location)
+        # Assert
+        with open_czi(target_path) as czi_document:
+            subblocks = czi_document.subblock_index()
+            np.testing.assert_array_equal(czi_document.read(roi=location + (1200, 700)), data)
+        assert len(subblocks) == expected_subblocks
+        if expected_subblocks > 1:
+            tile_height, tile_width = (512, 512) if isinstance(tile_size, str) else tile_size
+            assert all((subblocks["x"] == location[0]) | (subblocks["x"] % tile_width == 0))
+            assert all((subblocks["y"] == location[1]) | (subblocks["y"] % tile_height == 0))
+            assert all(subblocks["width"] <= tile_width) and all(subblocks["height"] <= tile_height)
+
+
+def test_write_tile_size_per_write() -> None:
+    """Tests that the tile size of a write overrides the default of the writer, and that invalid ones are rejected."""
+    data = np.zeros((600, 600), dtype=np.uint16)
+    with tempfile.TemporaryDirectory() as td:
+        target_path = join(td, "test.czi")
+        with create_czi(target_path) as test_czi:
+            test_czi.write(data)
+            test_czi.write(data, location=(600, 0), tile_size=(300, 300))
+            with pytest.raises(ValueError, match="tile_size"):
+                test_czi.write(data, location=(1200, 0), tile_size=(0, 300))
+            with pytest.raises(ValueError, match="tile_size"):
+                test_czi.write(data, location=(1200, 0), tile_size="large")
+        with open_czi(target_path) as czi_document:
+            assert len(czi_document.subblock_index()) == 1 + 4
@@ -1,14 +1,15 @@
 """Module implementing unit tests for the CziReader class"""
 
-from typing import Dict, NamedTuple, Optional, Tuple
+import io
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from unittest import mock
 
 import numpy as np
 import pytest
 
 # pylint: disable=no-name-in-module
-from _pylibCZIrw import DimensionIndex, IntRect, PixelType, RgbFloatColor
-from pylibCZIrw.czi import Color, CziReader, Rectangle
+from _pylibCZIrw import IntRect, PixelType, RgbFloatColor
+from pylibCZIrw.czi import Color, CziReader, PyramidLayer, Rectangle
 
 # testing static functions
 
@@ -147,59 +148,48 @@ def test_format_pixel_type_raises_error_on_incorrect_type() -> None:
 
 # testing properties and class functions
 
-dimension_sizes_test1 = {
-    DimensionIndex.Z: 0,
-    DimensionIndex.C: 1,
-    DimensionIndex.T: 0,
-    DimensionIndex.R: 0,
-    DimensionIndex.I: 0,
-    DimensionIndex.H: 0,
-    DimensionIndex.V: 0,
-    DimensionIndex.B: 0,
-    DimensionIndex.S: 2,
+dimension_bounds_test1 = {
+    "C": (0, 1),
+    "S": (0, 2),
 }
 
-dimension_sizes_test2 = {
-    DimensionIndex.Z: 0,
-    DimensionIndex.C: 6,
-    DimensionIndex.T: 0,
-    DimensionIndex.R: 3,
-    DimensionIndex.I: 1,
-    DimensionIndex.H: 0,
-    DimensionIndex.V: 10,
-    DimensionIndex.B: 0,
-    DimensionIndex.S: 1,
+dimension_bounds_test2 = {
+    "C": (0, 6),
+    "R": (0, 3),
+    "I": (0, 1),
+    "V": (0, 10),
+    "S": (0, 1),
 }
 
-dimension_sizes_test3 = {
-    DimensionIndex.Z: 3,
-    DimensionIndex.C: 100,
-    DimensionIndex.T: 2,
-    DimensionIndex.R: 10,
-    DimensionIndex.I: 4,
-    DimensionIndex.H: 1,
-    DimensionIndex.V: 12,
-    DimensionIndex.B: 6,
-    DimensionIndex.S: 5,
+dimension_bounds_test3 = {
+    "Z": (0, 3),
+    "C": (0, 100),
+    "T": (0, 2),
+    "R": (0, 10),
+    "I": (0, 4),
+    "H": (0, 1),
+    "V": (0, 12),
+    "B": (0, 6),
+    "S": (0, 5),
 }
 
 
 @mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
 @pytest.mark.parametrize(
-    "GetDimensionSize, boundingBox, expected_total_bounding_box",
+    "GetDimensionBounds, boundingBox, expected_total_bounding_box",
     [
         (
-            lambda x: 0,
+            {},
             create_rectangle(0, 0, 10, 10),
             {"C": (0, 1), "T": (0, 1), "X": (0, 10), "Y": (0, 10), "Z": (0, 1)},
         ),
         (
-            dimension_sizes_test1.get,
+            dimension_bounds_test1,
             create_rectangle(0, 0, 10, 10),
             {"C": (0, 1), "T": (0, 1), "X": (0, 10), "Y": (0, 10), "Z": (0, 1)},
         ),
         (
-            dimension_sizes_test2.get,
+            dimension_bounds_test2,
             create_rectangle(10, 5, 200, 20),
             {
                 "C": (0, 6),
@@ -213,7 +203,7 @@ dimension_sizes_test3 = {
             },
         ),
         (
-            dimension_sizes_test3.get,
+            dimension_bounds_test3,
             create_rectangle(-10, 10, 10, 10),
             {
                 "X": (-10, 0),
@@ -231,17 +221,159 @@ dimension_sizes_test3 = {
     ],
 )
 def test_total_bounding_box(
-    GetDimensionSize: Dict[DimensionIndex, int],
+    GetDimensionBounds: Dict[str, Tuple[int, int]],
     boundingBox: IntRect,
     expected_total_bounding_box: Dict[str, Tuple[int, int]],
 ) -> None:
     """Unit tests for total_bounding_box function"""
     test_czi = CziReader("filepath")
     test_czi._stats.boundingBox = boundingBox
-    test_czi._czi_reader.GetDimensionSize = GetDimensionSize
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value=GetDimensionBounds)
     assert test_czi.total_bounding_box == expected_total_bounding_box
 
 
+@mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
+def test_dimension_bounds() -> None:
+    """Unit tests for dimension_bounds property"""
+    test_czi = CziReader("filepath")
+    test_czi._stats.boundingBox = create_rectangle(0, 0, 10, 10)
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value={"C": (2, 3), "T": (0, 4), "S": (1, 2)})
+    assert test_czi.dimension_bounds == {"C": (2, 5), "T": (0, 4), "S": (1, 3)}
+    assert test_czi.total_bounding_box["C"] == (0, 3)
+    test_czi.dimension_bounds["C"] = (0, 0)
+    assert test_czi.dimension_bounds["C"] == (2, 5)
+    test_czi._czi_reader.GetDimensionBounds.assert_called_once_with()
+
+
+PyramidLayerStatisticsTest = NamedTuple(
+    "PyramidLayerStatisticsTest",
+    [("scene", int), ("minificationFactor", int), ("pyramidLayer", int), ("subBlockCount", int), ("bitmapBytes", int)],
+)
+
+
+@mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
+def test_pyramid_layers() -> None:
+    """Unit tests for pyramid_layers property and the minification factor used to read a pyramid layer"""
+    test_czi = CziReader("filepath")
+    test_czi._czi_reader.GetPyramidLayerStatistics = mock.Mock(
+        return_value=[
+            PyramidLayerStatisticsTest(0, 0, 0, 16, 1600),
+            PyramidLayerStatisticsTest(0, 3, 1, 4, 400),
+            PyramidLayerStatisticsTest(0, 3, 2, 1, 100),
+            PyramidLayerStatisticsTest(1, 0, 0, 2, 200),
+            PyramidLayerStatisticsTest(CziReader.SUBBLOCK_NO_COORDINATE, 2, 1, 1, 50),
+        ]
+    )
+    assert test_czi.pyramid_layers == {
+        0: (
+            PyramidLayer(layer=0, minification_factor=0, downscale_factor=1, subblock_count=16, nbytes=1600),
+            PyramidLayer(layer=1, minification_factor=3, downscale_factor=3, subblock_count=4, nbytes=400),
+            PyramidLayer(layer=2, minification_factor=3, downscale_factor=9, subblock_count=1, nbytes=100),
+        ),
+        1: (PyramidLayer(layer=0, minification_factor=0, downscale_factor=1, subblock_count=2, nbytes=200),),
+        None: (PyramidLayer(layer=1, minification_factor=2, downscale_factor=2, subblock_count=1, nbytes=50),),
+    }
+    assert test_czi._get_minification_factor(0, 0) == 3
+    assert test_czi._get_minification_factor(2, 0) == 3
+    assert test_czi._get_minification_factor(0, 1) == 2
+    assert test_czi._get_minification_factor(1, None) == 3
+    with pytest.raises(ValueError):
+        test_czi._get_minification_factor(1, 1)
+    with pytest.raises(ValueError):
+        test_czi._get_minification_factor(3, None)
+    test_czi._czi_reader.GetPyramidLayerStatistics.assert_called_once_with()
+
+
+@mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
+@pytest.mark.parametrize("source, expected_index", [("auto", 1), ("thumbnail", 1), ("label", 0)])
+def test_thumbnail_image_attachment(source: str, expected_index: int) -> None:
+    """Unit tests for thumbnail decoding an image attachment (scaled down and returned as Bgr24)"""
+    image_module = pytest.importorskip("PIL.Image")
+    jpg = io.BytesIO()
+    image_module.new("RGB", (100, 50), (255, 0, 0)).save(jpg, format="JPEG")
+    test_czi = CziReader("filepath")
+    test_czi._czi_reader.GetAttachmentInfos = mock.Mock(return_value=[(0, "Label", "JPG"), (1, "Thumbnail", "JPG")])
+    test_czi._czi_reader.ReadAttachment = mock.Mock(return_value=jpg.getvalue())
+    test_czi.read = mock.Mock()  # type: ignore[method-assign]
+    thumbnail = test_czi.thumbnail((40, 40), source=source)
+    assert thumbnail.shape == (20, 40, 3)
+    assert np.all(np.abs(thumbnail.astype(int) - [0, 0, 255]) < 8)
+    test_czi._czi_reader.ReadAttachment.assert_called_once_with(expected_index)
+    test_czi.read.assert_not_called()
+
+
+@mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
+def test_thumbnail_embedded_document() -> None:
+    """Unit tests for thumbnail creating the thumbnail of a czi document embedded in the attachment"""
+    test_czi = CziReader("filepath")
+    test_czi._czi_reader.GetAttachmentInfos = mock.Mock(return_value=[(0, "Label", "JPG"), (2, "Thumbnail", "CZI")])
+    expected = np.zeros((10, 20, 3), dtype=np.uint8)
+    with mock.patch.object(CziReader, "_open_attached_document") as open_attached_document:
+        open_attached_document.return_value.thumbnail.return_value = expected
+        assert test_czi.thumbnail((20, 20)) is expected
+    open_attached_document.assert_called_once_with(2)
+    open_attached_document.return_value.thumbnail.assert_called_once_with((20, 20), source="pyramid")
+    open_attached_document.return_value.close.assert_called_once_with()
+
+    attached_document = test_czi._open_attached_document(2)
+    test_czi._czi_reader.OpenAttachedDocument.assert_called_once_with(2)
+    assert attached_document._czi_reader is test_czi._czi_reader.OpenAttachedDocument.return_value
+    assert attached_document._stats is attached_document._czi_reader.GetSubBlockStats.return_value
+
+
+@mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
+@pytest.mark.parametrize(
+    "max_size, channels, expected_layer, expected_shape",
+    [
+        ((256, 256), None, 1, (204, 256, 1)),
+        ((100, 100), [1, 0], 1, (2, 80, 100, 1)),
+        ((600, 600), None, 0, (480, 600, 1)),
+    ],
+)
+def test_thumbnail_pyramid(
+    max_size: Tuple[int, int],
+    channels: Optional[List[int]],
+    expected_layer: int,
+    expected_shape: Tuple[int, ...],
+) -> None:
+    """Unit tests for thumbnail choosing the coarsest pyramid layer of all scenes at least of the thumbnail's size"""
+    test_czi = CziReader("filepath")
+    test_czi._czi_reader.GetAttachmentInfos = mock.Mock(return_value=[])
+    pyramid_layers = {
+        0: (
+            PyramidLayer(layer=0, minification_factor=0, downscale_factor=1, subblock_count=16, nbytes=1600),
+            PyramidLayer(layer=1, minification_factor=2, downscale_factor=2, subblock_count=4, nbytes=400),
+            PyramidLayer(layer=2, minification_factor=2, downscale_factor=4, subblock_count=1, nbytes=100),
+        ),
+        1: (
+            PyramidLayer(layer=0, minification_factor=0, downscale_factor=1, subblock_count=16, nbytes=1600),
+            PyramidLayer(layer=1, minification_factor=2, downscale_factor=2, subblock_count=4, nbytes=400),
+        ),
+    }
+    roi = Rectangle(0, 0, 1000, 800)
+
+    def read(roi: Rectangle, pyramid_layer: int, **_: Any) -> np.ndarray:
+        downscale_factor = 2**pyramid_layer
+        return np.zeros((roi.h // downscale_factor, roi.w // downscale_factor, 1), dtype=np.uint8)
+
+    test_czi.read = mock.Mock(side_effect=read)  # type: ignore[method-assign]
+    with mock.patch.object(
+        CziReader, "pyramid_layers", new_callable=mock.PropertyMock, return_value=pyramid_layers
+    ), mock.patch.object(
+        CziReader, "total_bounding_rectangle_no_pyramid", new_callable=mock.PropertyMock, return_value=roi
+    ):
+        thumbnail = test_czi.thumbnail(max_size, channels=channels)
+    assert thumbnail.shape == expected_shape
+    expected_planes = [None] if channels is None else [{"C": channel} for channel in channels]
+    assert test_czi.read.call_args_list == [
+        mock.call(roi=roi, plane=plane, pyramid_layer=expected_layer) for plane in expected_planes
+    ]
+    if channels is None:
+        test_czi._czi_reader.GetAttachmentInfos.assert_called_once_with()
+    else:
+        test_czi._czi_reader.GetAttachmentInfos.assert_not_called()
+
+
 @mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
 @pytest.mark.parametrize(
     "scene_bounding_boxes, expected_scenes_bounding_rectangles",
@@ -278,7 +410,7 @@ def test_extract_scenes_bounding_box(
     """Unit tests for total_bounding_box function"""
     test_czi = CziReader("filepath")
     test_czi._stats.sceneBoundingBoxes = scene_bounding_boxes
-    test_czi._czi_reader.GetDimensionSize = mock.Mock(return_value=len(scene_bounding_boxes))
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value={"S": (0, len(scene_bounding_boxes))})
     assert test_czi._extract_scenes_bounding_rectangles(lambda x: x) == expected_scenes_bounding_rectangles
 
 
@@ -317,7 +449,7 @@ def test_extract_scenes_bounding_box_raises_error(
     """Unit tests for total_bounding_box function"""
     test_czi = CziReader("filepath")
     test_czi._stats.sceneBoundingBoxes = scene_bounding_boxes
-    test_czi._czi_reader.GetDimensionSize = mock.Mock(return_value=dimension_size)
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value={"S": (0, dimension_size)})
     with pytest.raises(ValueError) as error:
         test_czi._extract_scenes_bounding_rectangles(lambda x: x)
     assert (
@@ -349,21 +481,21 @@ sceneBoundingBoxesTest3 = {
 
 @mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
 @pytest.mark.parametrize(
-    "GetDimensionSize, sceneBoundingBoxes, expected_scenes_bounding_rectangle",
+    "GetDimensionBounds, sceneBoundingBoxes, expected_scenes_bounding_rectangle",
     [
-        (lambda x: 0, {}, {}),
+        ({}, {}, {}),
         (
-            dimension_sizes_test1.get,
+            dimension_bounds_test1,
             sceneBoundingBoxesTest1,
             {0: Rectangle(0, 0, 100, 100), 1: Rectangle(10, 10, 20, 20)},
         ),
         (
-            dimension_sizes_test2.get,
+            dimension_bounds_test2,
             sceneBoundingBoxesTest2,
             {0: Rectangle(0, 0, 1200, 1200)},
         ),
         (
-            dimension_sizes_test3.get,
+            dimension_bounds_test3,
             sceneBoundingBoxesTest3,
             {
                 0: Rectangle(0, 0, 100, 100),
@@ -376,14 +508,14 @@ sceneBoundingBoxesTest3 = {
     ],
 )
 def test_scenes_bounding_rectangle(
-    GetDimensionSize: Dict[DimensionIndex, int],
+    GetDimensionBounds: Dict[str, Tuple[int, int]],
     sceneBoundingBoxes: Dict[int, IntRect],
     expected_scenes_bounding_rectangle: Dict[int, Rectangle],
 ) -> None:
     """Unit tests for scenes_bounding_rectangle function"""
     test_czi = CziReader("filepath")
     test_czi._stats.sceneBoundingBoxes = sceneBoundingBoxes
-    test_czi._czi_reader.GetDimensionSize = GetDimensionSize
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value=GetDimensionBounds)
     assert test_czi.scenes_bounding_rectangle == expected_scenes_bounding_rectangle
 
 
@@ -425,7 +557,7 @@ def test_create_roi(roi: Optional[Rectangle], scene: Optional[int], expected: Re
     """Unit tests for _create_roi function"""
     test_czi = CziReader("filepath")
     test_czi._stats = GetSubBlockStatsTest(create_rectangle(0, 0, 1000, 1000), sceneBoundingBoxesTest3)
-    test_czi._czi_reader.GetDimensionSize = dimension_sizes_test3.get
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value=dimension_bounds_test3)
     assert test_czi._create_roi(roi, scene) == expected
 
 
@@ -436,62 +568,62 @@ def test_create_roi_raises_error_on_incorrect_scene() -> None:
     with pytest.raises(ValueError, match=expected_error_message):
         test_czi = CziReader("filepath")
         test_czi._stats = GetSubBlockStatsTest(create_rectangle(0, 0, 1000, 1000), sceneBoundingBoxesTest3)
-        test_czi._czi_reader.GetDimensionSize = dimension_sizes_test3.get
+        test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value=dimension_bounds_test3)
         test_czi._create_roi(None, 10)
 
 
 @mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
 @pytest.mark.parametrize(
-    "GetDimensionSize, expected",
+    "GetDimensionBounds, expected",
     [
-        (dimension_sizes_test1, {}),
+        (dimension_bounds_test1, {}),
         (
-            dimension_sizes_test2,
+            dimension_bounds_test2,
             {"C": 0, "R": 0, "V": 0},
         ),
         (
-            dimension_sizes_test3,
+            dimension_bounds_test3,
             {"Z": 0, "C": 0, "T": 0, "R": 0, "I": 0, "V": 0, "B": 0},
         ),
     ],
 )
 def test_create_default_plane_coords(
-    GetDimensionSize: Dict[DimensionIndex, int],
+    GetDimensionBounds: Dict[str, Tuple[int, int]],
     expected: Dict[str, int],
 ) -> None:
     """Unit tests for _create_default_plane_coords function"""
     test_czi = CziReader("filepath")
-    test_czi._czi_reader.GetDimensionSize = GetDimensionSize.get
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value=GetDimensionBounds)
     assert test_czi._create_default_plane_coords() == expected
 
 
 @mock.patch("pylibCZIrw.czi._pylibCZIrw.czi_reader", mock.Mock())
 @pytest.mark.parametrize(
-    "plane, GetDimensionSize, expected",
+    "plane, GetDimensionBounds, expected",
     [
-        (None, dimension_sizes_test1, {}),
-        ({"C": 1, "Z": 3, "T": 4}, dimension_sizes_test1, {}),
+        (None, dimension_bounds_test1, {}),
+        ({"C": 1, "Z": 3, "T": 4}, dimension_bounds_test1, {}),
         (
             {"C": 5, "Z": 3, "T": 4, "B": 12},
-            dimension_sizes_test2,
+            dimension_bounds_test2,
             {"C": 5, "R": 0, "V": 0},
         ),
         (
             None,
-            dimension_sizes_test3,
+            dimension_bounds_test3,
             {"Z": 0, "C": 0, "T": 0, "R": 0, "I": 0, "V": 0, "B": 0},
         ),
     ],
 )
 def test_create_plane_coords(
     plane: Optional[Dict[str, int]],
-    GetDimensionSize: Dict[DimensionIndex, int],
+    GetDimensionBounds: Dict[str, Tuple[int, int]],
     expected: Dict[str, int],
 ) -> None:
     """Unit tests for _create_plane_coords function"""
     test_czi = CziReader("filepath")
     test_czi._stats = GetSubBlockStatsTest(create_rectangle(0, 0, 1000, 1000), {})
-    test_czi._czi_reader.GetDimensionSize = GetDimensionSize.get
+    test_czi._czi_reader.GetDimensionBounds = mock.Mock(return_value=GetDimensionBounds)
     assert test_czi._create_plane_coords(plane) == expected
 
 
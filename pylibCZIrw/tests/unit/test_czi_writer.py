@@ -220,6 +220,28 @@ def test_format_data_rgb() -> None:
     np.testing.assert_array_equal(np.array(data_libczi), np.array(expected))
 
 
+_LARGE_IMAGE = np.arange(60 * 80 * 3, dtype=np.uint16).reshape((60, 80, 3))
+
+
+@pytest.mark.parametrize(
+    "data, shares_memory",
+    [
+        (_LARGE_IMAGE, True),
+        (_LARGE_IMAGE[10:30, 20:60], True),
+        (_LARGE_IMAGE[::2], True),
+        (_LARGE_IMAGE[10:30, 20:60, 1], False),
+        (np.ascontiguousarray(_LARGE_IMAGE[..., 1])[10:30, 20:60], True),
+        (_LARGE_IMAGE[:, ::2], False),
+        (np.moveaxis(np.ascontiguousarray(np.moveaxis(_LARGE_IMAGE, -1, 0)), 0, -1), False),
+    ],
+)
+def test_format_data_refers_to_packed_pixels(data: np.ndarray, shares_memory: bool) -> None:
+    """Unit tests for format_data function referring to the memory of arrays with tightly packed pixels"""
+    data_libczi = CziWriter._format_data(data)
+    assert np.shares_memory(np.asarray(data_libczi), data) == shares_memory
+    np.testing.assert_array_equal(np.array(data_libczi), data.reshape(data.shape[:2] + (-1,)))
+
+
 def test_channel_dimension() -> None:
     """Unit tests for checking the channel dimension of the input pixel_data"""
     data: np.ndarray = np.array(
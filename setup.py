@@ -239,6 +239,8 @@ setup(
     packages=["pylibCZIrw"],
     cmdclass={"build_ext": CMakeBuild},
     install_requires=requirements,
+    # optional dependencies, e.g. pip install pylibCZIrw[dask]
+    extras_require={"dask": ["dask[array]"], "thumbnail": ["Pillow"]},
     # we require at least python version 3.7
     python_requires=">=3.8,<3.14",
     license_files=["COPYING", "COPYING.LESSER", "NOTICE"],